@@ -4,9 +4,29 @@ Dependency Injection
 FastAPI Depends() kullanılan bağımlılıklar.
 """
 
+from api_modules.utils import storage
 from modules.pipeline_manager import PipelineManager
 
 
+def create_pipeline_manager(**options) -> PipelineManager:
+    """
+    API çalıştırmaları için PipelineManager oluştur.
+    
+    Eklentilerin reddettiği satırlar çalışma dizinindeki ortak
+    deleted_records_log.csv yerine her çalıştırma için ayrı bir
+    denetim dizinine (``audit/<run_id>``) yazılır; böylece aynı anda
+    çalışan işler birbirinin kaydına karışmaz.
+    
+    Args:
+        **options: PipelineManager'a iletilen ek argümanlar
+    
+    Returns:
+        PipelineManager: Yeni PipelineManager örneği
+    """
+    options.setdefault("audit_dir", str(storage.ensure_audit_dir()))
+    return PipelineManager(**options)
+
+
 def get_pipeline_manager() -> PipelineManager:
     """
     PipelineManager factory fonksiyonu.
@@ -17,4 +37,4 @@ def get_pipeline_manager() -> PipelineManager:
     Returns:
         PipelineManager: Yeni PipelineManager örneği
     """
-    return PipelineManager()
+    return create_pipeline_manager()
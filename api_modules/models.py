@@ -166,6 +166,85 @@ class PipelineRunResponse(BaseModel):
         }
 
 
+class PipelineEstimateRequest(BaseModel):
+    """Pipeline maliyet tahmini isteği (upload_id üzerinden)."""
+    upload_id: int = Field(..., description="Veritabanındaki upload ID")
+    modules: List[str] = Field(..., description="Tahmin edilecek modül keys veya names")
+    sample_rows: int = Field(default=10000, ge=100, description="Örneklem satır sayısı")
+
+    class Config:
+        example = {
+            "upload_id": 42,
+            "modules": ["trim_spaces", "drop_duplicates"],
+            "sample_rows": 10000
+        }
+
+
+class StepEstimateInfo(BaseModel):
+    """Tek bir pipeline adımının tahmini maliyeti."""
+    key: str = Field(..., description="Modül anahtarı")
+    name: str = Field(..., description="Modül adı")
+    sample_seconds: float = Field(..., description="Örneklem üzerinde ölçülen süre (sn)")
+    estimated_seconds: float = Field(..., description="Tüm dosya için tahmini süre (sn)")
+    estimated_peak_bytes: int = Field(..., description="Tüm dosya için tahmini tepe bellek (byte)")
+    rows_in: int = Field(..., description="Örneklemde adıma giren satır sayısı")
+    rows_out: int = Field(..., description="Örneklemde adımdan çıkan satır sayısı")
+
+
+class PipelineEstimateResponse(BaseModel):
+    """Pipeline maliyet tahmini yanıtı."""
+    status: str = Field(..., description="İşlem durumu (success/error)")
+    sample_rows: int = Field(..., description="Kullanılan örneklem satır sayısı")
+    estimated_rows: int = Field(..., description="Dosyanın tahmini satır sayısı")
+    estimated_seconds: float = Field(..., description="Tahmini toplam süre (sn)")
+    estimated_peak_bytes: int = Field(..., description="Tahmini tepe bellek (byte)")
+    steps: List[StepEstimateInfo] = Field(..., description="Adım bazında tahminler")
+    timestamp: str = Field(..., description="İşlem zamanı")
+
+    class Config:
+        example = {
+            "status": "success",
+            "sample_rows": 10000,
+            "estimated_rows": 2500000,
+            "estimated_seconds": 84.2,
+            "estimated_peak_bytes": 3221225472,
+            "steps": [],
+            "timestamp": "2025-11-25T10:30:00"
+        }
+
+
+class PipelineProfileRequest(BaseModel):
+    """Veri kalitesi profili isteği (upload_id üzerinden)."""
+    upload_id: int = Field(..., description="Veritabanındaki upload ID")
+    modules: List[str] = Field(default_factory=list, description="Profil öncesi/sonrası arasında çalışacak modüller (boşsa yalnızca giriş profili)")
+    chunk_size: int = Field(default=50000, ge=100, description="Dosyanın parça parça okunacağı satır sayısı")
+
+    class Config:
+        example = {
+            "upload_id": 42,
+            "modules": ["trim_spaces", "convert_types"],
+            "chunk_size": 50000
+        }
+
+
+class PipelineProfileResponse(BaseModel):
+    """Veri kalitesi profili yanıtı (sütun bazında null oranı, tekil sayısı, min/max, sık değerler, tür uyumu)."""
+    status: str = Field(..., description="İşlem durumu (success/error)")
+    before: Dict[str, Any] = Field(..., description="Temizlik öncesi profil")
+    after: Optional[Dict[str, Any]] = Field(None, description="Temizlik sonrası profil (modül seçildiyse)")
+    modules_executed: List[str] = Field(default_factory=list, description="Çalıştırılan modüller")
+    timestamp: str = Field(..., description="İşlem zamanı")
+
+    class Config:
+        example = {
+            "status": "success",
+            "before": {"rows": 3, "columns": {"name": {"nulls": 0, "distinct": 2}}},
+            "after": None,
+            "modules_executed": [],
+            "timestamp": "2025-11-25T10:30:00"
+        }
+
+
 class FileUploadResponse(BaseModel):
     """CSV dosyası upload yanıt modeli."""
     status: str = Field(..., description="Upload durumu (success/error)")
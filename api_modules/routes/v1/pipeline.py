@@ -9,12 +9,19 @@ from api_modules.models import (
     AvailableModulesResponse,
     ModuleInfo,
     PipelineRunByIdRequest,
-    PipelineRunResponse
+    PipelineRunResponse,
+    PipelineEstimateRequest,
+    PipelineEstimateResponse,
+    PipelineProfileRequest,
+    PipelineProfileResponse,
+    StepEstimateInfo
 )
 from api_modules.utils import get_iso_timestamp
-from api_modules.dependencies import get_pipeline_manager
+from api_modules.dependencies import create_pipeline_manager, get_pipeline_manager
 from api_modules.security import verify_api_key
 from modules.pipeline_manager import PipelineManager
+from modules.data_loader import DataLoader
+from modules.estimator import PipelineEstimator
 from typing import Dict, List, Any
 from typing import cast
 import pandas as pd
@@ -135,7 +142,7 @@ async def run_pipeline(
         original_shape = df_original.shape
 
         # PipelineManager'ı oluştur ve çalıştır
-        pm_runner = PipelineManager(selected_modules_list=request.modules)
+        pm_runner = create_pipeline_manager(selected_modules_list=request.modules)
         df_cleaned = pm_runner.run_pipeline(df_original)
         
         cleaned_shape = df_cleaned.shape
@@ -157,3 +164,131 @@ async def run_pipeline(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Pipeline hatası: {str(e)}")
+
+
+@router.post(
+    "/estimate",
+    response_model=PipelineEstimateResponse,
+    summary="Pipeline Maliyet Tahmini",
+    responses={
+        200: {"description": "Tahmin başarıyla üretildi"},
+        400: {"description": "Hatalı istek"},
+        401: {"description": "Unauthorized - geçersiz API key"},
+        500: {"description": "Tahmin sırasında hata"}
+    }
+)
+async def estimate_pipeline(
+    request: PipelineEstimateRequest,
+    api_key: str = Depends(verify_api_key)
+) -> PipelineEstimateResponse:
+    """
+    Seçili modülleri dosyanın katmanlı bir örneklemi üzerinde çalıştırıp
+    tüm dosya için süre ve bellek tahmini üret.
+    
+    Büyük bir dosyayı kuyruğa göndermeden önce ne kadar süreceğini ve
+    ne kadar bellek gerektireceğini görmek için kullanılır.
+    
+    Returns:
+        PipelineEstimateResponse: Adım bazında ve toplam tahminler
+    """
+    try:
+        if not request.modules:
+            raise ValueError("En az bir modül seçilmelidir")
+
+        from db import get_upload_by_id
+
+        record = get_upload_by_id(request.upload_id)
+        if not record:
+            raise ValueError(f"Upload ID bulunamadı: {request.upload_id}")
+
+        file_path = record.get("file_path")
+        if not file_path:
+            raise ValueError(f"Upload kaydında file_path yok (upload_id={request.upload_id})")
+
+        estimate = PipelineEstimator().estimate(file_path, request.modules, sample_rows=request.sample_rows)
+
+        return PipelineEstimateResponse(
+            status="success",
+            sample_rows=estimate.sample_rows,
+            estimated_rows=estimate.estimated_rows,
+            estimated_seconds=estimate.estimated_seconds,
+            estimated_peak_bytes=estimate.estimated_peak_bytes,
+            steps=[
+                StepEstimateInfo(
+                    key=step.key,
+                    name=step.name,
+                    sample_seconds=step.sample_seconds,
+                    estimated_seconds=step.estimated_seconds,
+                    estimated_peak_bytes=step.estimated_peak_bytes,
+                    rows_in=step.rows_in,
+                    rows_out=step.rows_out,
+                )
+                for step in estimate.steps
+            ],
+            timestamp=get_iso_timestamp()
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Tahmin hatası: {str(e)}")
+
+
+@router.post(
+    "/profile",
+    response_model=PipelineProfileResponse,
+    summary="Veri Kalitesi Profili",
+    responses={
+        200: {"description": "Profil başarıyla üretildi"},
+        400: {"description": "Hatalı istek"},
+        401: {"description": "Unauthorized - geçersiz API key"},
+        500: {"description": "Profil çıkarılırken hata"}
+    }
+)
+async def profile_pipeline(
+    request: PipelineProfileRequest,
+    api_key: str = Depends(verify_api_key)
+) -> PipelineProfileResponse:
+    """
+    Yüklenen dosyanın sütun bazında veri kalitesi profilini çıkar.
+    
+    Dosya parça parça tek geçişte okunur; null oranı, tekil değer sayısı
+    (HyperLogLog), min/max, çeyrekler, en sık değerler ve tür uyumu
+    birleştirilebilir özetlerle hesaplanır. Modül seçilirse aynı geçişte
+    temizlik sonrası profil de üretilir.
+    
+    Returns:
+        PipelineProfileResponse: Temizlik öncesi ve (varsa) sonrası profil
+    """
+    try:
+        from db import get_upload_by_id
+
+        record = get_upload_by_id(request.upload_id)
+        if not record:
+            raise ValueError(f"Upload ID bulunamadı: {request.upload_id}")
+
+        file_path = record.get("file_path")
+        if not file_path:
+            raise ValueError(f"Upload kaydında file_path yok (upload_id={request.upload_id})")
+
+        pm_runner = create_pipeline_manager(selected_modules_list=request.modules, profile_points=["input", "output"])
+        chunks = DataLoader().iter_chunks(file_path, request.chunk_size)
+        for _ in pm_runner.run_pipeline_chunked(chunks):
+            pass
+
+        return PipelineProfileResponse(
+            status="success",
+            before=pm_runner.profiles.get("input", {"rows": 0, "columns": {}}),
+            after=pm_runner.profiles.get("output") if request.modules else None,
+            modules_executed=request.modules,
+            timestamp=get_iso_timestamp()
+        )
+
+    except (ValueError, FileNotFoundError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Profil hatası: {str(e)}")
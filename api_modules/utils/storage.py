@@ -5,6 +5,8 @@ from fastapi import UploadFile
 
 
 BASE_UPLOADS_DIR = Path(__file__).resolve().parents[2] / "uploads"
+# rows rejected by plugins, one run directory per pipeline run
+BASE_AUDIT_DIR = Path(__file__).resolve().parents[2] / "audit"
 
 
 def ensure_uploads_dir() -> Path:
@@ -13,6 +15,12 @@ def ensure_uploads_dir() -> Path:
     return BASE_UPLOADS_DIR
 
 
+def ensure_audit_dir() -> Path:
+    """Ensure the audit directory exists and return its Path."""
+    BASE_AUDIT_DIR.mkdir(parents=True, exist_ok=True)
+    return BASE_AUDIT_DIR
+
+
 async def save_upload_file(file: UploadFile) -> str:
     """Save an incoming `UploadFile` to disk with a UUID name.
 
@@ -0,0 +1,306 @@
+"""Audit sinks for rows that plugins reject.
+
+Plugins call `record_rows(frame, mask, reason)` instead of appending to a log
+file themselves. The sink active in the current context decides what
+happens:
+
+- `AuditSink` buffers the rows in memory and writes them as numbered part
+  files (Parquet when pyarrow is installed, CSV otherwise) under a per-run
+  directory from a background thread, so concurrent runs never share a file.
+- `CsvAuditSink` appends to one CSV right away. With no sink active rows go
+  to ``deleted_records_log.csv`` in the working directory, as before.
+- `NullAuditSink` drops them (used for estimation runs on samples).
+- `MemoryAuditSink` keeps them so they can be replayed into another sink,
+  e.g. after a plugin ran in a worker process (`modules.plugin_pool`).
+
+`PipelineManager(audit_dir=...)` activates an `AuditSink` for each run.
+"""
+
+from __future__ import annotations
+
+import abc
+import logging
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (optional: Parquet audit parts)
+except Exception:
+    pyarrow = None
+
+LEGACY_LOG = "deleted_records_log.csv"
+REASON_COLUMN = "Reason"
+SOURCE_COLUMN = "Source"
+AUDIT_FORMATS = ("parquet", "csv")
+
+logger = logging.getLogger("Audit")
+
+_active: ContextVar[Optional["_SinkBase"]] = ContextVar("audit_sink", default=None)
+
+
+def _positions(frame: pd.DataFrame, mask) -> np.ndarray:
+    values = np.asarray(mask.to_numpy() if isinstance(mask, pd.Series) else mask, dtype=bool)
+    if len(values) != len(frame):
+        raise ValueError(f"Denetim maskesi uzunluğu ({len(values)}) tablo ile uyuşmuyor ({len(frame)}).")
+    return np.flatnonzero(values)
+
+
+def _pick(values, positions: np.ndarray, length: int):
+    """Rows ``positions`` of a column-like value; scalars pass through."""
+    if isinstance(values, (pd.Series, pd.Index, np.ndarray, list)):
+        array = values.to_numpy() if isinstance(values, (pd.Series, pd.Index)) else np.asarray(values, dtype=object)
+        if len(array) != length:
+            raise ValueError(f"Denetim sütunu uzunluğu ({len(array)}) tablo ile uyuşmuyor ({length}).")
+        return array[positions]
+    return values
+
+
+class _SinkBase(abc.ABC):
+    def record(
+        self,
+        frame: pd.DataFrame,
+        mask,
+        reason: Union[str, pd.Series, np.ndarray],
+        *,
+        extra: Optional[Dict[str, Any]] = None,
+        source: Optional[str] = None,
+    ) -> int:
+        """Log the rows of ``frame`` selected by ``mask``; returns how many were logged.
+
+        ``mask`` is positional (a boolean Series or array as long as
+        ``frame``). Only the selected rows are copied. ``extra`` adds columns
+        (per-row values or scalars) before the ``Reason`` column, and
+        ``reason`` may be one string or one value per row of ``frame``.
+        """
+        positions = _positions(frame, mask)
+        if not len(positions):
+            return 0
+        rows = frame.iloc[positions].copy()
+        for name, values in (extra or {}).items():
+            rows[name] = _pick(values, positions, len(frame))
+        rows[REASON_COLUMN] = _pick(reason, positions, len(frame))
+        self._add(rows, source)
+        return len(rows)
+
+    @abc.abstractmethod
+    def _add(self, rows: pd.DataFrame, source: Optional[str]) -> None:
+        """Keep ``rows`` (already copied, with the ``Reason`` column) logged by ``source``."""
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NullAuditSink(_SinkBase):
+    """Counts rows without keeping them."""
+
+    def record(self, frame, mask, reason, *, extra=None, source=None) -> int:
+        return int(len(_positions(frame, mask)))
+
+    def _add(self, rows: pd.DataFrame, source: Optional[str]) -> None:
+        pass
+
+
+class CsvAuditSink(_SinkBase):
+    """Appends rows to one CSV file immediately (the legacy behaviour)."""
+
+    def __init__(self, path: Union[str, Path] = LEGACY_LOG) -> None:
+        self.path = Path(path)
+
+    def _add(self, rows: pd.DataFrame, source: Optional[str]) -> None:
+        write_header = not self.path.exists()
+        rows.to_csv(self.path, mode="a", header=write_header, index=False, encoding="utf-8")
+
+
+class MemoryAuditSink(_SinkBase):
+    """Keeps recorded rows in memory; picklable, so it can cross processes."""
+
+    def __init__(self) -> None:
+        self.records: List[Tuple[pd.DataFrame, Optional[str]]] = []
+
+    def _add(self, rows: pd.DataFrame, source: Optional[str]) -> None:
+        self.records.append((rows, source))
+
+    def replay(self, sink: Optional[_SinkBase] = None) -> int:
+        """Record the kept rows into ``sink`` (default: the current sink) in order."""
+        target = sink if sink is not None else current_sink()
+        total = 0
+        for rows, source in self.records:
+            # rows already carry their extra and Reason columns
+            total += target.record(rows, np.ones(len(rows), dtype=bool), rows[REASON_COLUMN], source=source)
+        return total
+
+
+def _columnar(rows: pd.DataFrame) -> pd.DataFrame:
+    """Rows with Parquet-friendly columns: string names and object cells as text."""
+    frame = rows.copy()
+    frame.columns = [str(column) for column in frame.columns]
+    for position in range(frame.shape[1]):
+        column = frame.iloc[:, position]
+        if column.dtype == object:
+            # rejected rows are often mixed-type, which Parquet cannot store as-is
+            frame.isetitem(position, column.astype(str).where(column.notna(), None))
+    return frame
+
+
+class AuditSink(_SinkBase):
+    """Per-run audit log written as part files by a background thread.
+
+    Rows are buffered until ``flush_rows`` are pending, then handed to a
+    single writer thread as ``part-00000.parquet``, ``part-00001.parquet``...
+    under ``<directory>/<run_id>``. ``close`` writes what is left and waits
+    for the writer. Write errors are logged, not raised, so a failing disk
+    does not abort the cleaning run.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        run_id: Optional[str] = None,
+        file_format: str = "parquet",
+        flush_rows: int = 50_000,
+    ) -> None:
+        if file_format not in AUDIT_FORMATS:
+            raise ValueError(f"Bilinmeyen denetim biçimi: {file_format}")
+        if file_format == "parquet" and pyarrow is None:
+            logger.warning("pyarrow kurulu değil; denetim kayıtları CSV olarak yazılacak.")
+            file_format = "csv"
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.path = Path(directory) / self.run_id
+        self.file_format = file_format
+        self.flush_rows = max(1, int(flush_rows))
+        self.rows_recorded = 0
+        self._buffer: List[pd.DataFrame] = []
+        self._buffered = 0
+        self._parts = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    def _add(self, rows: pd.DataFrame, source: Optional[str]) -> None:
+        if source is not None:
+            rows[SOURCE_COLUMN] = source
+        self._buffer.append(rows)
+        self._buffered += len(rows)
+        self.rows_recorded += len(rows)
+        if self._buffered >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the buffered rows to the writer thread."""
+        if not self._buffer:
+            return
+        batch = pd.concat(self._buffer, ignore_index=True)
+        self._buffer, self._buffered = [], 0
+        target = self.path / f"part-{self._parts:05d}.{self.file_format}"
+        self._parts += 1
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit")
+        self._pending.append(self._executor.submit(self._write, batch, target))
+
+    def _write(self, batch: pd.DataFrame, target: Path) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if self.file_format == "parquet":
+            _columnar(batch).to_parquet(target, index=False)
+        else:
+            batch.to_csv(target, index=False, encoding="utf-8")
+
+    def close(self) -> None:
+        self.flush()
+        for future in self._pending:
+            try:
+                future.result()
+            except Exception as exc:
+                logger.error("Denetim kaydı yazılamadı (%s): %s", self.path, exc)
+        self._pending = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def parts(self) -> List[Path]:
+        return sorted(self.path.glob(f"part-*.{self.file_format}"))
+
+    def read(self) -> pd.DataFrame:
+        """All written rows in recording order (call after ``close``)."""
+        return read_audit(self.path)
+
+
+def read_audit(path: Union[str, Path]) -> pd.DataFrame:
+    """Concatenate the part files of a run directory written by `AuditSink`."""
+    frames = []
+    for part in sorted(Path(path).glob("part-*")):
+        frames.append(pd.read_parquet(part) if part.suffix == ".parquet" else pd.read_csv(part))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def active_sink() -> Optional[_SinkBase]:
+    """The sink set with `use_sink` in this context, or None."""
+    return _active.get()
+
+
+def current_sink() -> _SinkBase:
+    """The active sink, or the legacy CSV in the working directory."""
+    sink = _active.get()
+    return sink if sink is not None else CsvAuditSink(LEGACY_LOG)
+
+
+@contextmanager
+def use_sink(sink: _SinkBase) -> Iterator[_SinkBase]:
+    """Make ``sink`` receive `record_rows` calls made in this context."""
+    token = _active.set(sink)
+    try:
+        yield sink
+    finally:
+        _active.reset(token)
+
+
+def audited(stream, sink: _SinkBase) -> Iterator[Any]:
+    """Iterate ``stream`` with ``sink`` active only while each item is produced.
+
+    Setting the context variable around a whole generator would leak it
+    into the consumer between items.
+    """
+    iterator = iter(stream)
+    while True:
+        with use_sink(sink):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def record_rows(frame: pd.DataFrame, mask, reason, *, extra: Optional[Dict[str, Any]] = None, source: Optional[str] = None) -> int:
+    """Log rejected rows to the current sink (see ``AuditSink.record``)."""
+    return current_sink().record(frame, mask, reason, extra=extra, source=source)
+
+
+__all__ = [
+    "AUDIT_FORMATS",
+    "AuditSink",
+    "CsvAuditSink",
+    "LEGACY_LOG",
+    "MemoryAuditSink",
+    "NullAuditSink",
+    "active_sink",
+    "audited",
+    "current_sink",
+    "read_audit",
+    "record_rows",
+    "use_sink",
+]
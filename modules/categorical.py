@@ -0,0 +1,69 @@
+"""Helpers for running value-wise cleaning on ``category`` columns.
+
+A categorical column stores each distinct value once plus an integer code per
+row, so a value-wise transformation only has to touch the categories. These
+helpers do that and map the result back through the codes, keeping string
+modules and plugins proportional to cardinality instead of row count.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Union
+
+import numpy as np
+import pandas as pd
+
+
+def is_categorical(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def _categories(series: pd.Series) -> pd.Series:
+    return pd.Series(series.cat.categories.to_numpy(dtype=object), dtype=object)
+
+
+def transform_categories(series: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Apply a value-wise Series -> Series ``func`` to the categories of ``series``.
+
+    ``func`` receives the categories as an object Series and must return one
+    value per category. Categories that become equal are merged (the first
+    one keeps its position) and categories mapped to a missing value turn
+    their rows into missing values. Missing rows stay missing and the result
+    keeps the ``ordered`` flag.
+    """
+    transformed = np.asarray(func(_categories(series)), dtype=object)
+    codes, merged = pd.factorize(pd.Series(transformed, dtype=object), use_na_sentinel=True)
+    old_codes = series.cat.codes.to_numpy()
+    # one extra slot so missing rows (code -1) stay missing
+    lookup = np.append(codes, -1)
+    categorical = pd.Categorical.from_codes(
+        lookup[old_codes],
+        categories=pd.Index(list(merged), dtype=None if len(merged) else object),
+        ordered=series.cat.ordered,
+    )
+    return pd.Series(categorical, index=series.index, name=series.name)
+
+
+def apply_by_category(
+    series: pd.Series,
+    func: Callable[[pd.Series], Union[pd.Series, pd.DataFrame]],
+    *,
+    missing=np.nan,
+):
+    """Run ``func`` on the categories of ``series`` and expand the result to its rows.
+
+    For transformations whose output is not a categorical column (flags,
+    numbers, several columns): ``func`` gets the categories as an object
+    Series and returns a Series or DataFrame with one row per category. Rows
+    of ``series`` that are missing get ``missing``. The result is indexed
+    like ``series``.
+    """
+    result = func(_categories(series)).reset_index(drop=True)
+    codes = series.cat.codes.to_numpy()
+    if (codes < 0).any():
+        result = result.reindex(range(len(result) + 1), fill_value=missing)
+        codes = np.where(codes < 0, len(result) - 1, codes)
+    return result.iloc[codes].set_axis(series.index, axis=0)
+
+
+__all__ = ["apply_by_category", "is_categorical", "transform_categories"]
@@ -0,0 +1,139 @@
+"""Per-run step checkpoints so long pipeline runs can resume after a failure."""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (optional: parquet checkpoints)
+except Exception:
+    pyarrow = None
+
+DEFAULT_CHECKPOINT_DIR = Path(".neatdata_checkpoints")
+_MANIFEST = "manifest.json"
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def input_fingerprint(file_path: str, modules: Iterable[str]) -> Dict[str, Any]:
+    """Identify a run by its input file (path, size, mtime) and module selection."""
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return {
+        "file": str(path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "modules": list(modules),
+    }
+
+
+class CheckpointStore:
+    """Stores the frame produced by the last completed step of a run.
+
+    Frames are written as parquet when pyarrow is available (falling back to
+    pickle for columns parquet cannot represent, e.g. mixed-type objects). Only
+    the latest step is kept on disk; `clear()` removes the run directory.
+    """
+
+    def __init__(self, run_id: Optional[str] = None, root: Optional[Path] = None) -> None:
+        self.run_id = run_id or new_run_id()
+        self.root = Path(root or DEFAULT_CHECKPOINT_DIR)
+        self.directory = self.root / self.run_id
+        self.logger = logging.getLogger("CheckpointStore")
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / _MANIFEST
+
+    def manifest(self) -> Dict[str, Any]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def begin(self, fingerprint: Dict[str, Any], input_rows: int) -> None:
+        """Start a fresh run, or keep the existing checkpoints if the input is unchanged."""
+        manifest = self.manifest()
+        if manifest and manifest.get("fingerprint") == fingerprint:
+            return
+        if manifest:
+            self.logger.warning("Checkpoint girdisi değişmiş; %s baştan başlatılıyor.", self.run_id)
+            self.clear()
+        self._write_manifest({"run_id": self.run_id, "fingerprint": fingerprint, "input_rows": input_rows, "completed": []})
+
+    def matches(self, fingerprint: Dict[str, Any]) -> bool:
+        return self.manifest().get("fingerprint") == fingerprint
+
+    def save(self, step_index: int, step_key: str, frame: pd.DataFrame) -> Path:
+        """Persist the output of step ``step_index`` (1-based) and drop older checkpoints."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stem = self.directory / f"step_{step_index:03d}"
+        path = self._write_frame(frame, stem)
+
+        manifest = self.manifest() or {"run_id": self.run_id, "completed": []}
+        previous = manifest.get("latest")
+        completed: List[str] = manifest.get("completed", [])[: step_index - 1]
+        completed.append(step_key)
+        manifest.update({"completed": completed, "latest": {"index": step_index, "key": step_key, "file": path.name}})
+        self._write_manifest(manifest)
+
+        if previous and previous.get("file") != path.name:
+            (self.directory / previous["file"]).unlink(missing_ok=True)
+        return path
+
+    def has_frame(self) -> bool:
+        """Whether the frame of the last completed step is still on disk."""
+        latest = self.manifest().get("latest")
+        return bool(latest) and (self.directory / latest["file"]).exists()
+
+    def latest(self) -> Optional[Tuple[int, pd.DataFrame]]:
+        """Return ``(completed_step_count, frame)`` for the last good step, if any."""
+        latest = self.manifest().get("latest")
+        if not latest:
+            return None
+        path = self.directory / latest["file"]
+        if not path.exists():
+            return None
+        if path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+        else:
+            frame = pd.read_pickle(path)
+        return int(latest["index"]), frame
+
+    def completed_steps(self) -> List[str]:
+        return list(self.manifest().get("completed", []))
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write_frame(self, frame: pd.DataFrame, stem: Path) -> Path:
+        if pyarrow is not None:
+            path = stem.with_suffix(".parquet")
+            try:
+                frame.to_parquet(path, index=True)
+                return path
+            except Exception:
+                path.unlink(missing_ok=True)
+        path = stem.with_suffix(".pkl")
+        frame.to_pickle(path)
+        return path
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(self.manifest_path)
+
+
+__all__ = ["CheckpointStore", "DEFAULT_CHECKPOINT_DIR", "input_fingerprint", "new_run_id"]
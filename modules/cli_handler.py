@@ -9,6 +9,8 @@ import argparse
 from typing import List, Optional
 
 from modules.utils import UIState, PipelineRunner, GuiLogger
+from modules.estimator import PipelineEstimator
+from modules.memory_budget import format_bytes
 from modules.pipeline_manager import PipelineManager
 
 
@@ -49,6 +51,30 @@ def run_pipeline_for_file(input_file: str, state: UIState, runner: PipelineRunne
     return runner.run_file(state, progress_callback=None)
 
 
+def estimate_file(input_file: str, modules: List[str], logger: GuiLogger, sample_rows: int) -> bool:
+    """Print a sample-based time/memory estimate for a file instead of processing it.
+    
+    Returns:
+        True if the estimate could be computed, False otherwise
+    """
+    try:
+        estimate = PipelineEstimator().estimate(input_file, modules, sample_rows=sample_rows)
+    except Exception as exc:
+        logger.error(f"Tahmin yapılamadı ({input_file}): {exc}")
+        return False
+
+    logger.section(f"TAHMİN: {input_file}")
+    logger.info(f"• Örnek: {estimate.sample_rows} satır → tahmini {estimate.estimated_rows} satır")
+    logger.info(f"• Okuma: ~{estimate.load_seconds:.2f} sn")
+    for step in estimate.steps:
+        logger.info(
+            f"• {step.key}: ~{step.estimated_seconds:.2f} sn, tepe ~{format_bytes(step.estimated_peak_bytes)}"
+        )
+    logger.info(f"• Toplam süre: ~{estimate.estimated_seconds:.2f} sn")
+    logger.info(f"• Tepe bellek: ~{format_bytes(estimate.estimated_peak_bytes)}")
+    return True
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -71,6 +97,28 @@ def main():
   # CSV çıktısı, özel klasöre
   python -m modules.cli_handler --input data.csv \\
     --output-dir /tmp/cleaned --output-format csv
+
+  # Bellek bütçesi: tahmini tepe bellek aşılırsa parçalı işler
+  python -m modules.cli_handler --input big.csv --output-format csv --memory-budget 2GB
+
+  # Checkpoint ile çalıştır; hata olursa loglanan run ID ile devam et
+  python -m modules.cli_handler --input big.csv --checkpoint
+  python -m modules.cli_handler --input big.csv --resume 3f2a9c1b7d4e
+
+  # Sürekli büyüyen CSV: yalnızca yeni satırları işle ve çıktıya ekle
+  python -m modules.cli_handler --input daily_export.csv --output-format csv --incremental
+
+  # Metin sütunlarını Arrow (string[pyarrow]) olarak tut: daha az bellek, yerel string çekirdekleri
+  python -m modules.cli_handler --input big.csv --string-backend arrow
+
+  # Silinen satırları her çalışma için ayrı Parquet dosyalarına yaz
+  python -m modules.cli_handler --input big.csv --custom-modules fix_cafe_business_logic --audit-dir audit_logs
+
+  # Özel eklentileri ayrı süreçlerde, çağrı başına 60 sn ve 2GB sınırla çalıştır
+  python -m modules.cli_handler --input data.csv --custom-modules all --plugin-workers 2 --plugin-timeout 60 --plugin-memory 2GB
+
+  # Çalıştırmadan önce süre/bellek tahmini (örneklem üzerinden)
+  python -m modules.cli_handler --input big.csv --estimate --sample-rows 20000
         """
     )
     
@@ -109,14 +157,87 @@ def main():
         default="xlsx",
         help="Çıktı formatı (varsayılan: xlsx)"
     )
+    parser.add_argument(
+        "--memory-budget",
+        dest="memory_budget",
+        type=str,
+        default=None,
+        help="Bellek bütçesi (örn: 512MB, 2GB). Aşılacaksa dosya parçalı işlenir."
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Her adımdan sonra checkpoint kaydet (başarılı bitişte silinir)"
+    )
+    parser.add_argument(
+        "--resume",
+        dest="resume",
+        type=str,
+        default=None,
+        help="Önceki çalışmanın run ID'si; son başarılı adımdan devam eder"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Yalnızca önceki çalışmadan sonra CSV'ye eklenen satırları işle ve mevcut çıktıya ekle"
+    )
+    parser.add_argument(
+        "--string-backend",
+        dest="string_backend",
+        choices=["python", "arrow"],
+        default="python",
+        help="Metin sütunlarının bellekte tutulma biçimi: python (object) veya arrow (string[pyarrow], pyarrow gerekir)"
+    )
+    parser.add_argument(
+        "--audit-dir",
+        dest="audit_dir",
+        type=str,
+        default=None,
+        help="Silinen satırların denetim kayıtları için klasör; her çalışma kendi alt klasörüne yazar (varsayılan: deleted_records_log.csv)"
+    )
+    parser.add_argument(
+        "--plugin-workers",
+        dest="plugin_workers",
+        type=int,
+        default=0,
+        help="Özel eklentileri bu sayıda ayrı işçi sürecinde çalıştır (varsayılan: 0, aynı süreçte)"
+    )
+    parser.add_argument(
+        "--plugin-timeout",
+        dest="plugin_timeout",
+        type=float,
+        default=None,
+        help="Ayrı süreçteki eklenti çağrısı için süre sınırı (saniye); aşılırsa işçi durdurulur"
+    )
+    parser.add_argument(
+        "--plugin-memory",
+        dest="plugin_memory_limit",
+        type=str,
+        default=None,
+        help="Ayrı süreçteki eklenti çağrısı için bellek sınırı (örn: 512MB, 2GB; yalnızca Linux/macOS)"
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Dosyayı işlemeden, örneklem üzerinden süre ve bellek tahmini yazdır"
+    )
+    parser.add_argument(
+        "--sample-rows",
+        dest="sample_rows",
+        type=int,
+        default=10000,
+        help="--estimate için örneklem satır sayısı (varsayılan: 10000)"
+    )
     
     args = parser.parse_args()
+    if args.resume and len(args.input) > 1:
+        parser.error("--resume yalnızca tek bir --input dosyası ile kullanılabilir")
     
     # Setup logger (no GUI callback for CLI)
     logger = GuiLogger()
     
     # Create pipeline runner
-    runner = PipelineRunner(logger=logger)
+    runner = PipelineRunner(logger=logger, memory_budget=args.memory_budget)
     
     # Get available modules
     manager = PipelineManager()
@@ -146,6 +267,15 @@ def main():
     
     success_count = 0
     
+    if args.estimate:
+        modules = core_keys + custom_keys
+        for input_file in args.input:
+            if estimate_file(input_file, modules, logger, args.sample_rows):
+                success_count += 1
+        logger.info(f"\n{'='*70}")
+        logger.info(f"📊 {success_count}/{len(args.input)} dosya için tahmin üretildi")
+        return
+    
     for input_file in args.input:
         # Clone state for each file
         state = UIState(
@@ -153,12 +283,24 @@ def main():
             selected_custom_keys=template_state.selected_custom_keys.copy(),
             output_type=template_state.output_type,
             output_dir=template_state.output_dir,
-            file_path=input_file
+            file_path=input_file,
+            memory_budget=args.memory_budget,
+            checkpoint=args.checkpoint or bool(args.resume),
+            run_id=args.resume,
+            incremental=args.incremental,
+            string_backend=args.string_backend,
+            audit_dir=args.audit_dir,
+            plugin_workers=args.plugin_workers,
+            plugin_timeout=args.plugin_timeout,
+            plugin_memory_limit=args.plugin_memory_limit,
         )
         
         if run_pipeline_for_file(input_file, state, runner):
             success_count += 1
     
+    # stop plugin worker processes, if any were started
+    runner.pipeline_manager.close()
+
     # Summary
     logger.info(f"\n{'='*70}")
     logger.info(f"✅ {success_count}/{len(args.input)} dosya başarıyla temizlendi")
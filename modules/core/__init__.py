@@ -3,14 +3,57 @@
 Each module inside this package MUST expose two attributes:
 - META: dict including key, name, description, defaults
 - process(df, **kwargs): function returning a pandas DataFrame
+
+META may also declare ``capabilities`` (see `ModuleCapabilities`) so the
+executor can pick chunking, parallelism, caching and copy strategies.
+
+Modules whose result depends on rows seen in earlier runs (e.g. duplicate
+removal) may expose ``process_stateful(df, state, **kwargs)``; incremental
+runs call it with a persisted, mutable ``state`` dict instead of `process`.
+Modules that are not chunk-safe may expose ``process_chunked(chunks, **kwargs)``
+(an iterator of frames in, an iterator out) for chunked execution.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib import import_module
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ModuleCapabilities:
+    """Execution hints declared by a module. Defaults assume nothing.
+
+    - chunk_safe: running on row chunks and concatenating equals running on the whole frame.
+    - column_wise: each output column depends only on the same input column (rows are kept).
+    - pure: deterministic and free of side effects, so results may be cached.
+    - in_place_safe: never mutates the frame it receives, so callers may skip defensive copies.
+    - columns_read / columns_written: fixed column sets the module touches (None = unknown/all).
+    """
+
+    chunk_safe: bool = False
+    column_wise: bool = False
+    pure: bool = False
+    in_place_safe: bool = False
+    columns_read: Optional[Tuple[str, ...]] = None
+    columns_written: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> "ModuleCapabilities":
+        raw = meta.get("capabilities") or {}
+        columns_read = raw.get("columns_read")
+        columns_written = raw.get("columns_written")
+        return cls(
+            chunk_safe=bool(raw.get("chunk_safe", False)),
+            column_wise=bool(raw.get("column_wise", False)),
+            pure=bool(raw.get("pure", False)),
+            in_place_safe=bool(raw.get("in_place_safe", False)),
+            columns_read=tuple(columns_read) if columns_read is not None else None,
+            columns_written=tuple(columns_written) if columns_written is not None else None,
+        )
+
 
 @dataclass(frozen=True)
 class ModuleDescriptor:
@@ -20,6 +63,9 @@ class ModuleDescriptor:
     defaults: Dict
     process: Callable
     order: int = 0
+    capabilities: ModuleCapabilities = field(default_factory=ModuleCapabilities)
+    process_stateful: Optional[Callable] = None
+    process_chunked: Optional[Callable] = None
 
 _PACKAGE_ROOT = Path(__file__).parent
 
@@ -45,9 +91,12 @@ def load_core_modules() -> List[ModuleDescriptor]:
                 defaults=defaults,
                 process=getattr(module, "process"),
                 order=order,
+                capabilities=ModuleCapabilities.from_meta(meta),
+                process_stateful=getattr(module, "process_stateful", None),
+                process_chunked=getattr(module, "process_chunked", None),
             )
         )
     return sorted(descriptors, key=lambda descriptor: descriptor.order)
 
 
-__all__ = ["load_core_modules", "ModuleDescriptor"]
+__all__ = ["load_core_modules", "ModuleCapabilities", "ModuleDescriptor"]
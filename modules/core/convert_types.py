@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from modules.core.parse_numbers import parse_number_series
+
+try:
+    import pyarrow
+    import pyarrow.compute as pc
+except Exception:
+    pyarrow = None  # Optional dependency: Arrow compute paths for string[pyarrow] columns
+    pc = None
+
 META = {
     "key": "convert_types",
     "name": "Veri Türlerini Düzelt",
@@ -16,19 +26,137 @@ META = {
         "numeric_threshold": 0.7,
         "strip_characters": [",", " ", "$", "TL", "€", "%"],
         "coerce": True,
+        "sample_size": 1000,
+        "sample_tolerance": 0.1,
+        # None keeps the strip_characters cleaning; "auto", "tr", "us", ... use parse_number_series
+        "decimal_locale": None,
     },
     "order": 50,
+    "capabilities": {
+        # numeric_threshold is measured over the whole column
+        "chunk_safe": False,
+        "column_wise": True,
+        "pure": True,
+        "in_place_safe": True,
+    },
 }
 
+_NON_NUMERIC = re.compile(r"[^0-9+\-\.eE]")
+# same class, but keeps the row separator used by `clean_numeric_series`
+_NON_NUMERIC_RUN = re.compile(r"[^0-9+\-\.eE\n]+")
+_SEPARATOR = "\n"
+# Arrow's cast is correctly rounded while pandas' parser is not, so only decimals
+# both parse identically (no exponent, at most 15 digits) take the Arrow path
+_ARROW_NUMBER = r"^[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)$"
+_ARROW_MAX_DIGITS = 15
+_ARROW_INTEGER = r"^[+-]?[0-9]{1,18}$"
+
 
 def _clean_numeric_string(value: str, patterns) -> str:
     cleaned = value
     for token in patterns:
         cleaned = cleaned.replace(token, "")
-    cleaned = re.sub(r"[^0-9+\-\.eE]", "", cleaned)
+    cleaned = _NON_NUMERIC.sub("", cleaned)
     return cleaned
 
 
+def _literal_tokens(patterns: List[str]) -> List[str]:
+    """Tokens that must be removed literally before the character-class pass.
+
+    Tokens made only of characters the class pass removes anyway are
+    redundant, unless a later token could match across them, so only the
+    prefix up to the last token containing a kept character is returned.
+    """
+    last = -1
+    for index, token in enumerate(patterns):
+        if _NON_NUMERIC.sub("", token):
+            last = index
+    return [token for token in patterns[: last + 1] if token]
+
+
+def clean_numeric_series(prepared: pd.Series, patterns: Iterable[str]) -> pd.Series:
+    """Vectorized equivalent of applying `_clean_numeric_string` to every cell.
+
+    The cells are joined into one newline-separated buffer so each literal
+    token and the character class run once over the whole column instead of
+    once per cell. Columns whose cells (or tokens) contain the separator fall
+    back to per-cell ``.str.replace``.
+    """
+    tokens = _literal_tokens(list(patterns))
+    values = prepared.tolist()
+    buffer = _SEPARATOR.join(values)
+    if buffer.count(_SEPARATOR) != len(values) - 1 or any(_SEPARATOR in token for token in tokens):
+        cleaned = prepared
+        for token in tokens:
+            cleaned = cleaned.str.replace(token, "", regex=False)
+        return cleaned.str.replace(_NON_NUMERIC, "", regex=True)
+
+    for token in tokens:
+        buffer = buffer.replace(token, "")
+    parts = _NON_NUMERIC_RUN.sub("", buffer).split(_SEPARATOR) if values else []
+    return pd.Series(parts, index=prepared.index, dtype=object)
+
+
+def _is_arrow_string(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.StringDtype) and str(series.dtype.storage).startswith("pyarrow")
+
+
+def clean_numeric_arrow(prepared: pd.Series, patterns: Iterable[str]) -> pd.Series:
+    """`clean_numeric_series` for ``string[pyarrow]`` columns.
+
+    Each token and the character class run as Arrow compute kernels
+    (``replace_substring``/``replace_substring_regex``) on the whole column;
+    missing values stay missing instead of becoming ``"nan"``.
+    """
+    cleaned = prepared
+    for token in _literal_tokens(list(patterns)):
+        cleaned = cleaned.str.replace(token, "", regex=False)
+    return cleaned.str.replace(_NON_NUMERIC.pattern, "", regex=True)
+
+
+def arrow_to_numeric(prepared: pd.Series) -> pd.Series:
+    """``pd.to_numeric(errors="coerce")`` for ``string[pyarrow]`` with numpy results.
+
+    Short plain decimal literals are parsed by Arrow's cast kernel; any other
+    non-missing cell (exponents, long mantissas, ``"inf"``, garbage) is
+    handed to ``pd.to_numeric`` so the result matches the object-column
+    path exactly, including int64 when every cell is an integer.
+    """
+    array = pyarrow.chunked_array(pyarrow.array(prepared.array)) if pyarrow is not None else None
+    if array is None:
+        return _as_numpy_numeric(pd.to_numeric(prepared, errors="coerce"))
+    present = pc.is_valid(array)
+    if pc.all(present).as_py() and pc.all(pc.match_substring_regex(array, _ARROW_INTEGER)).as_py():
+        return pd.Series(pc.cast(array, pyarrow.int64()).to_numpy(), index=prepared.index)
+
+    digits = pc.utf8_length(pc.replace_substring_regex(array, r"[+\-.]", ""))
+    plain = pc.and_(pc.match_substring_regex(array, _ARROW_NUMBER), pc.less_equal(digits, _ARROW_MAX_DIGITS))
+    plain = pc.fill_null(plain, False)
+    others = pc.and_(present, pc.invert(plain))
+
+    values = pc.cast(pc.if_else(plain, array, None), pyarrow.float64()).to_numpy()
+    others = others.to_numpy(zero_copy_only=False)
+    if others.any():
+        parsed = pd.to_numeric(prepared[others].astype(object), errors="coerce")
+        values[others] = parsed.to_numpy(dtype="float64", na_value=np.nan)
+    return pd.Series(values, index=prepared.index)
+
+
+def _as_numpy_numeric(values: pd.Series) -> pd.Series:
+    # to_numeric returns nullable dtypes for Arrow strings; match the object path
+    numpy_dtype = getattr(values.dtype, "numpy_dtype", None)
+    if not isinstance(values.dtype, pd.api.extensions.ExtensionDtype) or numpy_dtype is None:
+        return values
+    if values.isna().any():
+        return values.astype("float64")
+    return values.astype(numpy_dtype)
+
+
+def _evenly_spaced(series: pd.Series, size: int) -> pd.Series:
+    step = max(1, len(series) // size)
+    return series.iloc[::step]
+
+
 def process(
     df: pd.DataFrame,
     *,
@@ -36,21 +164,48 @@ def process(
     numeric_threshold: float = 0.7,
     strip_characters: Optional[Iterable[str]] = None,
     coerce: bool = True,
+    sample_size: int = 1000,
+    sample_tolerance: float = 0.1,
+    decimal_locale: Optional[str] = None,
 ) -> pd.DataFrame:
-    """Convert eligible columns to numeric values."""
+    """Convert eligible columns to numeric values.
+
+    With ``coerce`` enabled, columns longer than ``sample_size`` are first
+    checked on an evenly spaced sample; a column whose sample ratio falls more
+    than ``sample_tolerance`` below ``numeric_threshold`` is skipped without
+    converting every cell. ``decimal_locale`` switches the cleaning to
+    `parse_number_series`, so ``1.234,56`` style separators are understood;
+    unparseable cells then always become NaN.
+    """
 
     frame = df.copy()
     strip_characters = list(strip_characters or [])
     candidate_columns = list(columns) if columns else frame.select_dtypes(include=["object", "string"]).columns.tolist()
 
+    def _convert(values: pd.Series) -> pd.Series:
+        if decimal_locale:
+            return parse_number_series(values, locale=decimal_locale, sample_size=sample_size)
+        if _is_arrow_string(values):
+            prepared = values.str.strip()
+            if strip_characters:
+                prepared = clean_numeric_arrow(prepared, strip_characters)
+            if coerce:
+                return arrow_to_numeric(prepared)
+            return _as_numpy_numeric(pd.to_numeric(prepared, errors="raise"))
+        prepared = values.astype(str).str.strip()
+        if strip_characters:
+            prepared = clean_numeric_series(prepared, strip_characters)
+        return pd.to_numeric(prepared, errors="coerce" if coerce else "raise")
+
     for column in candidate_columns:
         if column not in frame.columns:
             continue
         series = frame[column]
-        prepared = series.astype(str).str.strip()
-        if strip_characters:
-            prepared = prepared.apply(lambda value: _clean_numeric_string(value, strip_characters))
-        numeric_series = pd.to_numeric(prepared, errors="coerce" if coerce else "raise")
+        if coerce and sample_size and len(series) > sample_size:
+            sample_ratio = _convert(_evenly_spaced(series, sample_size)).notna().mean()
+            if sample_ratio < numeric_threshold - sample_tolerance:
+                continue
+        numeric_series = _convert(series)
         non_null_ratio = numeric_series.notna().mean()
         if non_null_ratio >= numeric_threshold:
             frame[column] = numeric_series
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 META = {
@@ -14,10 +18,55 @@ META = {
         "subset": None,
         "keep": "first",
         "reset_index": True,
+        # "pandas" or "hash" (64-bit row hashes)
+        "method": "pandas",
+        # re-check rows whose hashes collide so the result is exact
+        "verify": True,
+        # hash partitions spilled to disk when deduplicating a chunk stream
+        "spill_partitions": 16,
     },
     "order": 20,
+    "capabilities": {
+        "chunk_safe": False,
+        "column_wise": False,
+        "pure": True,
+        "in_place_safe": True,
+    },
 }
 
+_ROW_ID = "__neatdata_row_id"
+
+
+def hash_rows(df: pd.DataFrame, subset: Optional[Iterable[str]] = None) -> np.ndarray:
+    """64-bit hash per row over ``subset`` (all columns when None), ignoring the index."""
+    frame = df[list(subset)] if subset else df
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def duplicated_by_hash(
+    df: pd.DataFrame,
+    *,
+    subset: Optional[Iterable[str]] = None,
+    keep="first",
+    verify: bool = True,
+) -> np.ndarray:
+    """Boolean mask of duplicate rows, decided on row hashes.
+
+    Only rows whose hash occurs more than once can be duplicates. With
+    ``verify`` those candidates are compared exactly (so the mask equals
+    ``DataFrame.duplicated``); without it equal hashes count as equal rows.
+    """
+    subset = list(subset) if subset else None
+    hashes = pd.Series(hash_rows(df, subset))
+    if not verify:
+        return hashes.duplicated(keep=keep).to_numpy()
+
+    mask = np.zeros(len(df), dtype=bool)
+    candidates = hashes.duplicated(keep=False).to_numpy()
+    if candidates.any():
+        mask[candidates] = df[candidates].duplicated(subset=subset, keep=keep).to_numpy()
+    return mask
+
 
 def process(
     df: pd.DataFrame,
@@ -25,12 +74,276 @@ def process(
     subset: Optional[Iterable[str]] = None,
     keep: str = "first",
     reset_index: bool = True,
+    method: str = "pandas",
+    verify: bool = True,
+    spill_partitions: int = 16,
 ) -> pd.DataFrame:
     """Return dataframe without duplicate rows."""
 
-    frame = df.copy()
     subset = list(subset) if subset else None
-    deduped = frame.drop_duplicates(subset=subset, keep=keep)
+    if method == "hash":
+        deduped = df[~duplicated_by_hash(df, subset=subset, keep=keep, verify=verify)]
+    else:
+        deduped = df.drop_duplicates(subset=subset, keep=keep)
+    if reset_index:
+        deduped = deduped.reset_index(drop=True)
+    return deduped
+
+
+class SpillingDeduplicator:
+    """Global duplicate removal over a stream of chunks with bounded memory.
+
+    `add` computes dtype-independent row keys (`_row_keys`) and routes
+    every row, with its keys, to one of ``partitions`` spill files by the
+    keys' hash, so duplicates always meet in the same partition even when
+    chunks were parsed with different dtypes (``1`` / ``1.0`` / ``"1"``).
+    `results` then deduplicates one partition at a time, comparing the keys
+    exactly (or only their hashes without ``verify``), re-buckets the
+    surviving rows by their source chunk and yields them chunk by chunk in
+    the original order.
+    """
+
+    def __init__(
+        self,
+        *,
+        subset: Optional[Iterable[str]] = None,
+        keep="first",
+        verify: bool = True,
+        partitions: int = 16,
+        directory: Optional[Path] = None,
+    ) -> None:
+        self.subset = list(subset) if subset else None
+        self.keep = keep
+        self.verify = verify
+        self.partitions = max(1, int(partitions))
+        self._tmp = None
+        if directory is None:
+            self._tmp = tempfile.TemporaryDirectory(prefix="neatdata_dedup_")
+            directory = Path(self._tmp.name)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._chunk_starts: List[int] = []
+        self._rows = 0
+        self._empty: Optional[pd.DataFrame] = None
+
+    def _partition_path(self, index: int) -> Path:
+        return self.directory / f"partition_{index:04d}.pkl"
+
+    def _bucket_path(self, index: int) -> Path:
+        return self.directory / f"chunk_{index:06d}.pkl"
+
+    @staticmethod
+    def _append(path: Path, item: Any) -> None:
+        with path.open("ab") as handle:
+            pickle.dump(item, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _read(path: Path) -> List[Any]:
+        parts = []
+        if not path.exists():
+            return parts
+        with path.open("rb") as handle:
+            while True:
+                try:
+                    parts.append(pickle.load(handle))
+                except EOFError:
+                    return parts
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        if self._empty is None:
+            self._empty = chunk.iloc[0:0]
+        self._chunk_starts.append(self._rows)
+        if chunk.empty:
+            return
+        keys = _row_keys(chunk[self.subset] if self.subset else chunk)
+        partition = pd.util.hash_pandas_object(keys, index=False).to_numpy() % np.uint64(self.partitions)
+        tagged = chunk.assign(**{_ROW_ID: np.arange(self._rows, self._rows + len(chunk), dtype=np.int64)})
+        self._rows += len(chunk)
+        for index in np.unique(partition):
+            selected = partition == index
+            self._append(self._partition_path(int(index)), (tagged[selected], keys[selected]))
+
+    def results(self) -> Iterator[pd.DataFrame]:
+        try:
+            for index in range(self.partitions):
+                parts = self._read(self._partition_path(index))
+                if not parts:
+                    continue
+                frame = pd.concat([rows for rows, _ in parts])
+                keys = pd.concat([row_keys for _, row_keys in parts], ignore_index=True)
+                if self.verify:
+                    duplicated = keys.duplicated(keep=self.keep).to_numpy()
+                else:
+                    hashes = pd.util.hash_pandas_object(keys, index=False)
+                    duplicated = hashes.duplicated(keep=self.keep).to_numpy()
+                survivors = frame[~duplicated]
+                buckets = np.searchsorted(self._chunk_starts, survivors[_ROW_ID].to_numpy(), side="right") - 1
+                for bucket in np.unique(buckets):
+                    self._append(self._bucket_path(int(bucket)), survivors[buckets == bucket])
+                self._partition_path(index).unlink()
+
+            emitted = False
+            for bucket in range(len(self._chunk_starts)):
+                parts = self._read(self._bucket_path(bucket))
+                if not parts:
+                    continue
+                frame = pd.concat(parts).sort_values(_ROW_ID, kind="stable").drop(columns=_ROW_ID)
+                self._bucket_path(bucket).unlink()
+                emitted = True
+                yield frame
+            if not emitted and self._empty is not None:
+                yield self._empty
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+
+def process_chunked(
+    chunks: Iterable[pd.DataFrame],
+    *,
+    subset: Optional[Iterable[str]] = None,
+    keep: str = "first",
+    reset_index: bool = True,
+    method: str = "pandas",
+    verify: bool = True,
+    spill_partitions: int = 16,
+) -> Iterator[pd.DataFrame]:
+    """Deduplicate a chunk stream globally via `SpillingDeduplicator`.
+
+    All chunks are consumed before the first result is produced. Rows are
+    compared exactly on dtype-independent keys (so a column read as int in
+    one chunk and as float or text in another still matches) unless
+    ``verify`` is off and ``method`` is ``"hash"``.
+    """
+    deduplicator = SpillingDeduplicator(
+        subset=subset,
+        keep=keep,
+        verify=verify or method != "hash",
+        partitions=spill_partitions,
+    )
+    for chunk in chunks:
+        deduplicator.add(chunk)
+    for frame in deduplicator.results():
+        yield frame.reset_index(drop=True) if reset_index else frame
+
+
+# text keys: "" for numbers, "n" for missing, "s<text>" and "i<integer>" otherwise
+# (no NUL sentinel: pandas' string hashing stops at the first NUL)
+_MISSING_KEY = "n"
+# integers beyond this are not exact as float64 and are keyed by their text
+_EXACT_FLOAT_INT = 2**53
+
+
+def _value_key(value: Any) -> Tuple[float, str]:
+    """(number, text) key of one object value.
+
+    Numbers are keyed by value. A string is keyed as a number only when it is
+    exactly how that number is written (``"1"``, ``"2.5"``), so it matches
+    the same cell parsed as int or float in another chunk while distinct
+    strings (``"01"``/``"1"``, ``"1.0"``/``"1"``) never share a key.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return np.nan, "s" + str(value)
+    if isinstance(value, (int, np.integer)):
+        if abs(int(value)) > _EXACT_FLOAT_INT:
+            return np.nan, "i" + str(int(value))
+        return float(value), ""
+    if isinstance(value, (float, np.floating)):
+        return (np.nan, _MISSING_KEY) if np.isnan(value) else (float(value), "")
+    if isinstance(value, str):
+        try:
+            integer = int(value)
+        except ValueError:
+            integer = None
+        if integer is not None and str(integer) == value:
+            return _value_key(integer)
+        try:
+            number = float(value)
+        except ValueError:
+            number = None
+        if number is not None and np.isfinite(number) and not number.is_integer() and repr(number) == value:
+            return number, ""
+    return np.nan, "s" + str(value)
+
+
+def _value_keys(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(number, text) keys of object values, see `_value_key`."""
+    numbers = np.empty(len(values), dtype="float64")
+    text = np.empty(len(values), dtype=object)
+    for position, value in enumerate(values):
+        numbers[position], text[position] = _value_key(value)
+    return numbers, text
+
+
+def _column_keys(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """(number, text) keys of a column; equal values get equal keys whatever the dtype."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        numbers = series.to_numpy(dtype="float64", na_value=np.nan, copy=True)
+        text = np.full(len(series), "", dtype=object)
+        text[np.isnan(numbers)] = _MISSING_KEY
+        if pd.api.types.is_integer_dtype(series):
+            present = series.notna().to_numpy()
+            big = present & (np.abs(numbers) > _EXACT_FLOAT_INT)
+            if big.any():
+                text[big] = ("i" + series[big].astype(str)).to_numpy(dtype=object)
+                numbers[big] = np.nan
+        return numbers, text
+    # text-like columns: keys are computed once per distinct value
+    codes, uniques = pd.factorize(series)
+    numbers, text = _value_keys(np.asarray(uniques, dtype=object))
+    return np.append(numbers, np.nan)[codes], np.append(text, _MISSING_KEY)[codes]
+
+
+def _row_keys(frame: pd.DataFrame) -> pd.DataFrame:
+    """Per-cell keys that do not depend on how a chunk's dtypes were inferred.
+
+    Every column becomes a float64 key and a text key. Numbers compare by
+    value whether parsed as int, float or text (``1``, ``1.0`` and ``"1"``
+    share a key), missing values share one key and everything else compares
+    as text; two different strings never share a key.
+    """
+    keys: Dict[str, np.ndarray] = {}
+    for position in range(frame.shape[1]):
+        numbers, text = _column_keys(frame.iloc[:, position])
+        # one bit pattern per key: NaNs (the text key tells what they were) and -0.0
+        numbers[np.isnan(numbers)] = 0.0
+        keys[f"{position}n"], keys[f"{position}t"] = numbers + 0.0, text
+    return pd.DataFrame(keys, index=pd.RangeIndex(len(frame)))
+
+
+def process_stateful(
+    df: pd.DataFrame,
+    state: Dict[str, Any],
+    *,
+    subset: Optional[Iterable[str]] = None,
+    keep: str = "first",
+    reset_index: bool = True,
+    **_options: Any,
+) -> pd.DataFrame:
+    """Drop duplicates of rows kept in earlier runs as well as within ``df``.
+
+    ``state["hashes"]`` holds the sorted row hashes already emitted and is
+    updated in place. Rows from earlier runs are already written, so they are
+    always the kept occurrence; ``keep`` only applies among the new rows.
+    Rows are hashed on their `_row_keys`, so a value read as ``1`` in one run
+    and as ``1.0`` or ``"1"`` in the next still matches. Matching is by 64-bit
+    hash without verification against past rows, so ``method``/``verify``
+    options are ignored here.
+    """
+    subset = list(subset) if subset else None
+    keys = _row_keys(df[subset] if subset else df)
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    seen = state.get("hashes")
+    if seen is None:
+        seen = np.empty(0, dtype=np.uint64)
+
+    mask = ~np.isin(hashes, seen) & ~pd.Series(hashes).duplicated(keep=keep).to_numpy()
+    deduped = df[mask]
+    state["hashes"] = np.union1d(seen, hashes)
     if reset_index:
         deduped = deduped.reset_index(drop=True)
     return deduped
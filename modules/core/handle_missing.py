@@ -2,24 +2,110 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from modules.sketches import QuantileSketch, RunningMoments, SpaceSaving
+
 META = {
     "key": "handle_missing",
     "name": "Eksik Verileri Yönet",
-    "description": "Eksik (NaN) değerleri silme, sabit değerle doldurma veya ileri/geri doldurma stratejileri sunar.",
+    "description": "Eksik (NaN) değerleri silme, sabit değerle, ortalama/medyan/mod ile (isteğe bağlı grup bazında) veya ileri/geri doldurma stratejileri sunar.",
     "defaults": {
         # Safer default: no-op unless caller specifies a strategy and columns.
         "strategy": "noop",
         "fill_value": None,
         "columns": None,
         "limit": None,
+        # mean/median/mode are computed per group of these columns when given
+        "group_by": None,
+        # quantile sketch items per level / heavy-hitter capacity in chunked mode
+        "sketch_size": 1024,
     },
     "order": 30,
+    "capabilities": {
+        # ffill/bfill and statistics depend on other rows
+        "chunk_safe": False,
+        "column_wise": False,
+        "pure": True,
+        "in_place_safe": True,
+    },
 }
 
+STATISTICS = ("mean", "median", "mode")
+_STRATEGIES = ("noop", "drop", "fill", "ffill", "bfill") + STATISTICS
+
+# column -> (overall value or None, per-group values or None)
+Fills = Dict[str, Tuple[Any, Optional[pd.Series]]]
+
+
+def _as_list(columns) -> List[str]:
+    if columns is None:
+        return []
+    if isinstance(columns, str):
+        return [columns]
+    return list(columns)
+
+
+def _eligible(series: pd.Series, statistic: str) -> bool:
+    if statistic == "mode":
+        return True
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _exact_fills(frame: pd.DataFrame, columns: List[str], statistic: str, group_by: List[str]) -> Fills:
+    fills: Fills = {}
+    for column in columns:
+        values = frame[column].dropna()
+        if values.empty or not _eligible(frame[column], statistic):
+            continue
+        if statistic == "mode":
+            overall = values.mode().iloc[0]
+        else:
+            overall = getattr(values, statistic)()
+        table = None
+        if group_by:
+            if statistic == "mode":
+                counts = frame.groupby(group_by + [column]).size()
+                winners = counts.groupby(level=list(range(len(group_by)))).idxmax()
+                table = pd.Series([winner[-1] for winner in winners], index=winners.index)
+            else:
+                table = frame.groupby(group_by)[column].agg(statistic)
+        fills[column] = (overall, table)
+    return fills
+
+
+def _lookup(frame: pd.DataFrame, group_by: List[str], table: pd.Series) -> pd.Series:
+    if len(group_by) == 1:
+        keys = pd.Index(frame[group_by[0]])
+    else:
+        keys = pd.MultiIndex.from_frame(frame[group_by])
+    return pd.Series(table.reindex(keys).to_numpy(), index=frame.index)
+
+
+def _apply_fills(frame: pd.DataFrame, fills: Fills, statistic: str, group_by: List[str]) -> pd.DataFrame:
+    for column, (overall, table) in fills.items():
+        if column not in frame.columns or not frame[column].isna().any():
+            continue
+        if not _eligible(frame[column], statistic):
+            continue
+        fill = overall
+        if table is not None and len(table) and all(key in frame.columns for key in group_by):
+            by_group = _lookup(frame, group_by, table)
+            fill = by_group if overall is None else by_group.fillna(overall)
+        if fill is None:
+            continue
+        series = frame[column]
+        if pd.api.types.is_integer_dtype(series) and statistic != "mode":
+            series = series.astype("Float64")
+        frame[column] = series.fillna(fill)
+    return frame
+
 
 def process(
     df: pd.DataFrame,
@@ -28,8 +114,16 @@ def process(
     fill_value=None,
     columns: Optional[Iterable[str]] = None,
     limit: Optional[int] = None,
+    group_by: Optional[Iterable[str]] = None,
+    sketch_size: int = 1024,
 ) -> pd.DataFrame:
-    """Handle missing values and return a new dataframe."""
+    """Handle missing values and return a new dataframe.
+
+    ``mean``/``median`` fill numeric columns and ``mode`` any column; with
+    ``group_by`` each row gets its group's statistic and falls back to the
+    column-wide one. In memory the statistics are exact; ``sketch_size``
+    only matters for `process_chunked`.
+    """
 
     frame = df.copy()
     # If columns is None, do not operate on all columns implicitly — require explicit columns.
@@ -58,4 +152,197 @@ def process(
         frame[target_columns] = frame[target_columns].bfill(limit=limit)
         return frame
 
+    if strategy in STATISTICS:
+        keys = [key for key in _as_list(group_by) if key in frame.columns]
+        targets = [column for column in target_columns if column not in keys]
+        return _apply_fills(frame, _exact_fills(frame, targets, strategy, keys), strategy, keys)
+
     raise ValueError(f"Bilinmeyen strateji: {strategy}")
+
+
+class StatisticAccumulator:
+    """One-pass, mergeable mean/median/mode per column (and per group).
+
+    Uses `RunningMoments`, `QuantileSketch` or `SpaceSaving` from
+    `modules.sketches`, so memory depends on ``sketch_size`` and the number
+    of groups, not on the number of rows.
+    """
+
+    def __init__(self, statistic: str, columns: Iterable[str], *, group_by=None, sketch_size: int = 1024) -> None:
+        if statistic not in STATISTICS:
+            raise ValueError(f"Bilinmeyen istatistik: {statistic}")
+        self.statistic = statistic
+        self.group_by = _as_list(group_by)
+        self.columns = [column for column in columns if column not in self.group_by]
+        self.sketch_size = sketch_size
+        self.overall: Dict[str, Any] = {}
+        self.groups: Dict[str, Dict[tuple, Any]] = {}
+
+    def _new(self):
+        if self.statistic == "mean":
+            return RunningMoments()
+        if self.statistic == "median":
+            return QuantileSketch(self.sketch_size)
+        return SpaceSaving(self.sketch_size)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        grouped = bool(self.group_by) and all(key in chunk.columns for key in self.group_by)
+        for column in self.columns:
+            if column not in chunk.columns or not _eligible(chunk[column], self.statistic):
+                continue
+            values = chunk[column].dropna()
+            if values.empty:
+                continue
+            self.overall.setdefault(column, self._new()).update(values)
+            if grouped:
+                sketches = self.groups.setdefault(column, {})
+                for key, part in chunk.loc[values.index].groupby(self.group_by)[column]:
+                    sketches.setdefault(key, self._new()).update(part)
+
+    def merge(self, other: "StatisticAccumulator") -> "StatisticAccumulator":
+        for column, sketch in other.overall.items():
+            self.overall.setdefault(column, self._new()).merge(sketch)
+        for column, sketches in other.groups.items():
+            mine = self.groups.setdefault(column, {})
+            for key, sketch in sketches.items():
+                mine.setdefault(key, self._new()).merge(sketch)
+        return self
+
+    def _value(self, sketch):
+        if self.statistic == "mean":
+            return sketch.mean
+        if self.statistic == "median":
+            return sketch.median()
+        return sketch.mode()
+
+    def fills(self) -> Fills:
+        fills: Fills = {}
+        for column, sketch in self.overall.items():
+            table = None
+            sketches = self.groups.get(column)
+            if sketches:
+                keys = list(sketches)
+                index = pd.Index([key[0] for key in keys]) if len(self.group_by) == 1 else pd.MultiIndex.from_tuples(keys)
+                table = pd.Series([self._value(item) for item in sketches.values()], index=index)
+            fills[column] = (self._value(sketch), table)
+        return fills
+
+
+class _ChunkSpool:
+    """Chunks pickled to a temporary directory so a stream can be read twice."""
+
+    def __init__(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(prefix="neatdata_missing_")
+        self._count = 0
+
+    def _path(self, index: int) -> Path:
+        return Path(self._tmp.name) / f"chunk_{index:06d}.pkl"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, frame: pd.DataFrame) -> None:
+        self.write(self._count, frame)
+        self._count += 1
+
+    def write(self, index: int, frame: pd.DataFrame) -> None:
+        self._path(index).write_bytes(pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def read(self, index: int) -> pd.DataFrame:
+        return pickle.loads(self._path(index).read_bytes())
+
+    def close(self) -> None:
+        self._tmp.cleanup()
+
+
+def _fill_across(
+    frame: pd.DataFrame,
+    columns: List[str],
+    carry: Dict[str, Tuple[Any, int]],
+    *,
+    limit: Optional[int],
+    reverse: bool,
+) -> pd.DataFrame:
+    """ffill (or bfill when ``reverse``) one chunk, continuing from the previous one.
+
+    ``carry`` maps a column to the last valid value seen so far and the number
+    of missing values after it; it is updated for the next chunk.
+    """
+    frame = frame.copy()
+    for column in columns:
+        if column not in frame.columns:
+            continue
+        original = frame[column].iloc[::-1] if reverse else frame[column]
+        filled = original.ffill(limit=limit)
+        value, gap = carry.get(column, (None, 0))
+
+        valid = original.notna().to_numpy()
+        lead = int(valid.argmax()) if valid.any() else len(original)
+        if value is not None:
+            count = lead if limit is None else max(0, min(lead, limit - gap))
+            if count:
+                filled = filled.mask(np.arange(len(filled)) < count, value)
+
+        if valid.any():
+            last = len(valid) - 1 - int(valid[::-1].argmax())
+            carry[column] = (original.iloc[last], len(valid) - 1 - last)
+        else:
+            carry[column] = (value, gap + len(valid))
+        frame[column] = filled.iloc[::-1].set_axis(frame.index) if reverse else filled
+    return frame
+
+
+def process_chunked(
+    chunks: Iterable[pd.DataFrame],
+    *,
+    strategy: str = "drop",
+    fill_value=None,
+    columns: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    group_by: Optional[Iterable[str]] = None,
+    sketch_size: int = 1024,
+) -> Iterator[pd.DataFrame]:
+    """Handle missing values across a chunk stream as if it were one frame.
+
+    Row-local strategies stream through; ``ffill`` carries the last valid
+    value into the next chunk. ``bfill`` and the statistics spill chunks to a
+    temporary directory: statistics are accumulated in the first pass with
+    mergeable sketches (exact until a sketch fills up) and applied in the
+    second, so memory is bounded by one chunk plus the sketches.
+    """
+    if columns is None or strategy in ("noop", "drop", "fill"):
+        for chunk in chunks:
+            yield process(chunk, strategy=strategy, fill_value=fill_value, columns=columns, limit=limit)
+        return
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"Bilinmeyen strateji: {strategy}")
+
+    columns = list(columns)
+    if strategy == "ffill":
+        carry: Dict[str, Tuple[Any, int]] = {}
+        for chunk in chunks:
+            yield _fill_across(chunk, columns, carry, limit=limit, reverse=False)
+        return
+
+    spool = _ChunkSpool()
+    try:
+        if strategy == "bfill":
+            for chunk in chunks:
+                spool.append(chunk)
+            carry = {}
+            for index in reversed(range(len(spool))):
+                spool.write(index, _fill_across(spool.read(index), columns, carry, limit=limit, reverse=True))
+            for index in range(len(spool)):
+                yield spool.read(index)
+            return
+
+        keys = _as_list(group_by)
+        accumulator = StatisticAccumulator(strategy, columns, group_by=keys, sketch_size=sketch_size)
+        for chunk in chunks:
+            accumulator.update(chunk)
+            spool.append(chunk)
+        fills = accumulator.fills()
+        for index in range(len(spool)):
+            yield _apply_fills(spool.read(index), fills, strategy, keys)
+    finally:
+        spool.close()
@@ -0,0 +1,189 @@
+"""Remove near-duplicate rows by MinHash/LSH similarity on chosen text columns."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_array
+
+META = {
+    "key": "near_duplicates",
+    "name": "Benzer Kayıtları Kaldır",
+    "description": "Seçilen metin sütunlarında yalnızca boşluk, noktalama veya küçük farklarla ayrışan satırları MinHash/LSH ile bulur ve ilk ya da son kaydı tutar.",
+    "defaults": {
+        # None = no-op; the module only runs on explicitly chosen columns
+        "columns": None,
+        "threshold": 0.8,
+        "num_perm": 64,
+        "bands": 8,
+        "shingle_size": 3,
+        "keep": "first",
+        "reset_index": True,
+    },
+    "order": 25,
+    "capabilities": {
+        "chunk_safe": False,
+        "column_wise": False,
+        "pure": True,
+        "in_place_safe": True,
+    },
+}
+
+REPORT_KEY = "near_duplicates"
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def normalize_for_matching(series: pd.Series) -> pd.Series:
+    """Lowercase, drop punctuation and collapse whitespace; missing values become ''."""
+    text = series.astype("string").fillna("").str.lower()
+    text = text.str.replace(_PUNCTUATION_RE, " ", regex=True)
+    return text.str.split().str.join(" ").astype(object)
+
+
+def _shingles(texts: List[str], size: int):
+    """Flat shingle list plus the start offset of each text's shingles."""
+    shingles: List[str] = []
+    starts = np.empty(len(texts), dtype=np.int64)
+    for index, text in enumerate(texts):
+        starts[index] = len(shingles)
+        if len(text) <= size:
+            shingles.append(text)
+        else:
+            shingles.extend(text[position:position + size] for position in range(len(text) - size + 1))
+    return shingles, starts
+
+
+def minhash_signatures(texts: List[str], *, num_perm: int = 64, shingle_size: int = 3, seed: int = 0) -> np.ndarray:
+    """Return a ``(num_perm, len(texts))`` uint64 MinHash signature matrix.
+
+    Character shingles are hashed once; each permutation is a random odd
+    multiply/add over uint64 followed by an xor-shift, and the per-text
+    minimum is taken with ``np.minimum.reduceat``.
+    """
+    shingles, starts = _shingles(texts, shingle_size)
+    base = hash_array(np.asarray(shingles, dtype=object))
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    offsets = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+
+    signatures = np.empty((num_perm, len(texts)), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for index in range(num_perm):
+            permuted = base * multipliers[index] + offsets[index]
+            permuted ^= permuted >> np.uint64(29)
+            signatures[index] = np.minimum.reduceat(permuted, starts)
+    return signatures
+
+
+def _candidate_pairs(signatures: np.ndarray, bands: int) -> np.ndarray:
+    """LSH banding: pairs ``(leader, member)`` of texts sharing any band bucket."""
+    num_perm, count = signatures.shape
+    rows = max(1, num_perm // bands)
+    pairs = []
+    with np.errstate(over="ignore"):
+        for band in range(bands):
+            block = signatures[band * rows:(band + 1) * rows]
+            if not len(block):
+                break
+            key = np.zeros(count, dtype=np.uint64)
+            for row in block:
+                key = (key ^ row) * _MIX
+            order = np.argsort(key, kind="stable")
+            ordered = key[order]
+            starts = np.r_[True, ordered[1:] != ordered[:-1]]
+            group_start = np.maximum.accumulate(np.where(starts, np.arange(count), 0))
+            members = ~starts
+            if members.any():
+                pairs.append(np.stack([order[group_start[members]], order[members]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def _find(parent: np.ndarray, node: int) -> int:
+    root = node
+    while parent[root] != root:
+        root = parent[root]
+    while parent[node] != root:
+        parent[node], node = root, parent[node]
+    return root
+
+
+def cluster_near_duplicates(
+    texts: List[str],
+    *,
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    bands: int = 8,
+    shingle_size: int = 3,
+) -> np.ndarray:
+    """Cluster id per text; texts whose estimated Jaccard similarity reaches
+    ``threshold`` (directly or transitively) share an id."""
+    count = len(texts)
+    parent = np.arange(count)
+    if count < 2:
+        return parent
+    signatures = minhash_signatures(texts, num_perm=num_perm, shingle_size=shingle_size)
+    pairs = _candidate_pairs(signatures, bands)
+    if len(pairs):
+        similarity = (signatures[:, pairs[:, 0]] == signatures[:, pairs[:, 1]]).mean(axis=0)
+        for left, right in pairs[similarity >= threshold]:
+            root_left, root_right = _find(parent, left), _find(parent, right)
+            if root_left != root_right:
+                parent[max(root_left, root_right)] = min(root_left, root_right)
+    return np.array([_find(parent, node) for node in range(count)])
+
+
+def process(
+    df: pd.DataFrame,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    bands: int = 8,
+    shingle_size: int = 3,
+    keep: str = "first",
+    reset_index: bool = True,
+) -> pd.DataFrame:
+    """Drop rows whose chosen columns nearly match an earlier (or later) row.
+
+    Texts are normalised first, identical normalised texts share one
+    signature, and rows with empty text are never treated as duplicates.
+    ``keep`` mirrors `drop_duplicates`. Cluster and removal counts are
+    stored in ``attrs["near_duplicates"]``.
+    """
+    columns = [column for column in (columns or []) if column in df.columns]
+    if not columns or df.empty:
+        return df.copy()
+
+    normalized = normalize_for_matching(df[columns[0]])
+    for column in columns[1:]:
+        normalized = normalized + " | " + normalize_for_matching(df[column])
+
+    codes, uniques = pd.factorize(normalized)
+    clusters = cluster_near_duplicates(
+        list(uniques),
+        threshold=threshold,
+        num_perm=num_perm,
+        bands=bands,
+        shingle_size=shingle_size,
+    )
+    row_cluster = pd.Series(clusters[codes], index=df.index)
+    has_text = (normalized.str.replace("|", "", regex=False).str.strip() != "").to_numpy()
+    duplicated = row_cluster.duplicated(keep=keep).to_numpy() & has_text
+
+    result = df[~duplicated]
+    if reset_index:
+        result = result.reset_index(drop=True)
+    report: Dict[str, Any] = {
+        "columns": columns,
+        "clusters": int(row_cluster[has_text].value_counts().gt(1).sum()),
+        "removed": int(duplicated.sum()),
+    }
+    result.attrs[REPORT_KEY] = report
+    return result
@@ -0,0 +1,184 @@
+"""Shrink column dtypes late in the pipeline and report the memory saved."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (optional: Arrow-backed strings)
+except Exception:
+    pyarrow = None
+
+META = {
+    "key": "optimize_dtypes",
+    "name": "Bellek Kullanımını Optimize Et",
+    "description": "Tam sayı sütunlarını varsayılan olarak en fazla int32'ye indirir; daha dar türler, float32 ve tam sayı değerli ondalıkların nullable tam sayıya çevrilmesi isteğe bağlıdır. Metinler isteğe bağlı olarak category/Arrow türüne dönüştürülür.",
+    "defaults": {
+        "columns": None,
+        "downcast_integers": True,
+        # custom plugins run after this step and may write values that need the
+        # headroom (1.5 into a price column, qty * 2 overflowing int8), so by
+        # default integers keep at least 32 bits and floats stay float64
+        "min_int_bits": 32,
+        "downcast_floats": False,
+        "integral_floats": False,
+        # None, "category" or "pyarrow"; off by default because custom plugins
+        # run after core modules and may assign values outside the categories
+        "string_dtype": None,
+        "max_category_ratio": 0.5,
+    },
+    "order": 90,
+    "capabilities": {
+        # each chunk could pick a different width or category set
+        "chunk_safe": False,
+        "column_wise": True,
+        "pure": True,
+        "in_place_safe": True,
+    },
+}
+
+REPORT_KEY = "optimize_dtypes"
+
+_SIGNED = ((np.int8, "Int8"), (np.int16, "Int16"), (np.int32, "Int32"), (np.int64, "Int64"))
+
+
+def _smallest_int(minimum, maximum, nullable: bool, min_bits: int = 8):
+    for numpy_type, nullable_name in _SIGNED:
+        info = np.iinfo(numpy_type)
+        if info.bits < min_bits:
+            continue
+        if info.min <= minimum and maximum <= info.max:
+            return nullable_name if nullable else np.dtype(numpy_type)
+    return None
+
+
+def _optimize_integer(series: pd.Series, min_bits: int) -> pd.Series:
+    values = series.dropna()
+    if values.empty:
+        return series
+    nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+    target = _smallest_int(values.min(), values.max(), nullable, min_bits)
+    # never widen: a column already narrower than the floor is left alone
+    if target is None or str(target) == str(series.dtype) or np.dtype(str(target).lower()).itemsize >= series.dtype.itemsize:
+        return series
+    return series.astype(target)
+
+
+def _is_integral(values: np.ndarray) -> bool:
+    finite = np.isfinite(values)
+    if not finite.all():
+        return False
+    return bool(np.all(np.mod(values, 1) == 0))
+
+
+def _optimize_float(series: pd.Series, *, downcast: bool, integral: bool, min_bits: int) -> pd.Series:
+    values = series.dropna().to_numpy(dtype="float64")
+    if integral and len(values) and _is_integral(values):
+        if np.iinfo(np.int64).min <= values.min() and values.max() <= np.iinfo(np.int64).max:
+            target = _smallest_int(values.min(), values.max(), True, min_bits)
+            if target is not None:
+                return series.astype(target)
+    if downcast and series.dtype == np.float64:
+        narrowed = series.astype(np.float32)
+        # only when every value survives the round trip exactly
+        if np.array_equal(narrowed.to_numpy(dtype="float64"), series.to_numpy(), equal_nan=True):
+            return narrowed
+    return series
+
+
+def _optimize_strings(series: pd.Series, string_dtype: str, max_category_ratio: float) -> pd.Series:
+    if pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return series
+    if string_dtype == "category":
+        non_null = series.notna().sum()
+        if non_null and series.nunique(dropna=True) / non_null <= max_category_ratio:
+            return series.astype("category")
+        return series
+    if string_dtype == "pyarrow" and pyarrow is not None:
+        return series.astype("string[pyarrow]")
+    return series
+
+
+def optimize_series(
+    series: pd.Series,
+    *,
+    downcast_integers: bool = True,
+    min_int_bits: int = 32,
+    downcast_floats: bool = False,
+    integral_floats: bool = False,
+    string_dtype: Optional[str] = None,
+    max_category_ratio: float = 0.5,
+) -> pd.Series:
+    """Return ``series`` converted to a smaller dtype holding the same values.
+
+    Integer targets are never narrower than ``min_int_bits``. ``downcast_floats``
+    (float32) and ``integral_floats`` (whole-number floats to nullable ints)
+    are opt-in: later steps may store fractions or larger values there.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        return _optimize_integer(series, min_int_bits) if downcast_integers else series
+    if pd.api.types.is_float_dtype(dtype) and not isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return _optimize_float(series, downcast=downcast_floats, integral=integral_floats, min_bits=min_int_bits)
+    if string_dtype and dtype == object:
+        return _optimize_strings(series, string_dtype, max_category_ratio)
+    return series
+
+
+def process(
+    df: pd.DataFrame,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    downcast_integers: bool = True,
+    min_int_bits: int = 32,
+    downcast_floats: bool = False,
+    integral_floats: bool = False,
+    string_dtype: Optional[str] = None,
+    max_category_ratio: float = 0.5,
+) -> pd.DataFrame:
+    """Downcast columns and record per-column savings in ``attrs["optimize_dtypes"]``.
+
+    The report maps each changed column to its old/new dtype and bytes
+    (``memory_usage(deep=True)``) and carries the frame-level totals.
+    """
+
+    frame = df.copy()
+    targets = list(columns) if columns else list(frame.columns)
+    report: Dict[str, Any] = {"columns": {}, "bytes_before": 0, "bytes_after": 0}
+
+    for position, column in enumerate(frame.columns):
+        if column not in targets:
+            continue
+        series = frame.iloc[:, position]
+        optimized = optimize_series(
+            series,
+            downcast_integers=downcast_integers,
+            min_int_bits=min_int_bits,
+            downcast_floats=downcast_floats,
+            integral_floats=integral_floats,
+            string_dtype=string_dtype,
+            max_category_ratio=max_category_ratio,
+        )
+        if optimized is series:
+            continue
+        before = int(series.memory_usage(deep=True, index=False))
+        after = int(optimized.memory_usage(deep=True, index=False))
+        frame.isetitem(position, optimized)
+        report["columns"][str(column)] = {
+            "dtype_before": str(series.dtype),
+            "dtype_after": str(optimized.dtype),
+            "bytes_before": before,
+            "bytes_after": after,
+            "bytes_saved": before - after,
+        }
+
+    report["bytes_before"] = int(df.memory_usage(deep=True, index=False).sum())
+    report["bytes_after"] = int(frame.memory_usage(deep=True, index=False).sum())
+    report["bytes_saved"] = report["bytes_before"] - report["bytes_after"]
+    frame.attrs[REPORT_KEY] = report
+    return frame
@@ -0,0 +1,238 @@
+"""Parse textual date columns with formats inferred from a sample."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+META = {
+    "key": "parse_dates",
+    "name": "Tarihleri Ayrıştır",
+    "description": "Seçilen tarih sütunlarında örnek üzerinden tarih biçimlerini tespit eder, her biçimi açıkça ayrıştırır ve hangi biçimin kaç satırla eşleştiğini raporlar.",
+    "defaults": {
+        # None = no-op; the module only runs on explicitly chosen columns
+        "columns": None,
+        # candidate strptime formats; None uses CANDIDATE_FORMATS
+        "formats": None,
+        "sample_size": 1000,
+        # day-first formats win ties against month-first ones (01/02 = 1 Feb)
+        "dayfirst": False,
+        # leftover values go through pandas' per-value parser
+        "fallback": True,
+        # None keeps datetime64 values; a strftime pattern writes strings
+        "output_format": None,
+    },
+    "order": 40,
+    "capabilities": {
+        # formats are inferred per column, so chunks may pick different ones
+        "chunk_safe": False,
+        "column_wise": True,
+        "pure": True,
+        "in_place_safe": True,
+    },
+}
+
+REPORT_KEY = "parse_dates"
+FALLBACK = "fallback"
+
+# Checked in this order when two formats match the same number of sample values.
+CANDIDATE_FORMATS: List[str] = [
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y/%m/%d",
+    "%Y%m%d",
+    "%d.%m.%Y",
+    "%d.%m.%Y %H:%M",
+    "%d.%m.%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d/%m/%Y %H:%M",
+    "%m/%d/%Y %H:%M",
+    "%d-%m-%Y",
+    "%m-%d-%Y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+]
+
+
+def _day_month_order(fmt: str) -> Optional[str]:
+    """``"day"``/``"month"`` for formats like ``%d/%m/%Y``/``%m/%d/%Y``, else None."""
+    if "%d" not in fmt or "%m" not in fmt or fmt.startswith("%Y"):
+        return None
+    return "day" if fmt.index("%d") < fmt.index("%m") else "month"
+
+
+def _ordered_candidates(formats: Optional[Sequence[str]], dayfirst: bool) -> List[str]:
+    candidates = list(formats) if formats else list(CANDIDATE_FORMATS)
+    # stable sort: the non-preferred twin of each ambiguous pair moves back
+    losing = "month" if dayfirst else "day"
+    return sorted(candidates, key=lambda fmt: _day_month_order(fmt) == losing)
+
+
+def _evenly_spaced(values: np.ndarray, size: int) -> np.ndarray:
+    step = max(1, len(values) // max(1, size))
+    return values[::step]
+
+
+def _parse(values: np.ndarray, fmt: str) -> np.ndarray:
+    parsed = pd.to_datetime(pd.Series(values, dtype=object), format=fmt, errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[ns]")
+
+
+def detect_formats(
+    values: Iterable[str],
+    *,
+    formats: Optional[Sequence[str]] = None,
+    dayfirst: bool = False,
+) -> List[str]:
+    """Candidate formats matching at least one of ``values``, best first.
+
+    Formats are ranked by how many values they parse; ties keep candidate
+    order, where ``dayfirst`` decides between ``%d/%m`` and ``%m/%d``.
+    """
+    sample = np.asarray([value for value in values if isinstance(value, str)], dtype=object)
+    if not len(sample):
+        return []
+    hits = []
+    for position, fmt in enumerate(_ordered_candidates(formats, dayfirst)):
+        matched = int((~np.isnat(_parse(sample, fmt))).sum())
+        if matched:
+            hits.append((-matched, position, fmt))
+    return [fmt for _, _, fmt in sorted(hits)]
+
+
+def _parse_fallback(values: np.ndarray, dayfirst: bool) -> np.ndarray:
+    series = pd.Series(values, dtype=object)
+    try:
+        parsed = pd.to_datetime(series, errors="coerce", format="mixed", dayfirst=dayfirst)
+    except (TypeError, ValueError):
+        # mixed UTC offsets cannot share one dtype; compare them in UTC
+        parsed = pd.to_datetime(series, errors="coerce", format="mixed", dayfirst=dayfirst, utc=True)
+    if not pd.api.types.is_datetime64_any_dtype(parsed):
+        parsed = pd.to_datetime(parsed, errors="coerce", utc=True)
+    if getattr(parsed.dt, "tz", None) is not None:
+        parsed = parsed.dt.tz_convert(None)
+    return parsed.to_numpy(dtype="datetime64[ns]")
+
+
+def parse_date_series(
+    series: pd.Series,
+    *,
+    formats: Optional[Sequence[str]] = None,
+    sample_size: int = 1000,
+    dayfirst: bool = False,
+    fallback: bool = True,
+    report: Optional[Dict[str, Any]] = None,
+) -> pd.Series:
+    """Parse ``series`` into ``datetime64[ns]``, unparseable values becoming ``NaT``.
+
+    Work is done on the distinct (stripped) strings only: formats are
+    detected on an evenly spaced sample of them, best first. The formats
+    are then applied as a cascade: each one parses, with
+    ``pd.to_datetime(format=...)``, the values the better ones left unparsed,
+    so a column mixing e.g. ISO and dotted dates keeps both. The cascade
+    never mixes day/month orders: once a ``%d/%m``-style format matched, its
+    ``%m/%d`` twin is skipped (and vice versa), so ``05/01/2023`` means the
+    same day in every row of a column. Whatever is left, including
+    non-string values, goes through pandas' per-value parser (honouring
+    ``dayfirst``) when ``fallback`` is set. ``report``, when given, is
+    filled with ``{"formats": {format: rows}, "fallback": rows, "failed": rows}``.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if getattr(series.dt, "tz", None) is not None:
+            return series.dt.tz_convert(None)
+        return series
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+    texts = np.array([value.strip() if isinstance(value, str) else value for value in uniques], dtype=object)
+    present = np.array([not isinstance(value, str) or value != "" for value in texts], dtype=bool)
+    is_text = present & np.array([isinstance(value, str) for value in texts], dtype=bool)
+    rows_per_unique = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    parsed = np.full(len(uniques), np.datetime64("NaT"), dtype="datetime64[ns]")
+    counts: Dict[str, int] = {}
+    chosen_order: Optional[str] = None
+    for fmt in detect_formats(_evenly_spaced(texts[is_text], sample_size), formats=formats, dayfirst=dayfirst):
+        pending = is_text & np.isnat(parsed)
+        if not pending.any():
+            break
+        order = _day_month_order(fmt)
+        if order is not None and chosen_order not in (None, order):
+            continue
+        result = _parse(texts[pending], fmt)
+        matched = ~np.isnat(result)
+        if matched.any():
+            positions = np.flatnonzero(pending)[matched]
+            parsed[positions] = result[matched]
+            counts[fmt] = int(rows_per_unique[positions].sum())
+            chosen_order = chosen_order or order
+
+    leftover = np.isnat(parsed) & present
+    fallback_rows = 0
+    if fallback and leftover.any():
+        result = _parse_fallback(texts[leftover], dayfirst)
+        matched = ~np.isnat(result)
+        positions = np.flatnonzero(leftover)[matched]
+        parsed[positions] = result[matched]
+        fallback_rows = int(rows_per_unique[positions].sum())
+
+    # the trailing NaT is what code -1 (missing) picks; also covers all-missing columns
+    values = np.append(parsed, np.datetime64("NaT", "ns"))[codes]
+    if report is not None:
+        report["formats"] = counts
+        report[FALLBACK] = fallback_rows
+        report["failed"] = int(rows_per_unique[np.isnat(parsed) & present].sum())
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def process(
+    df: pd.DataFrame,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    formats: Optional[Sequence[str]] = None,
+    sample_size: int = 1000,
+    dayfirst: bool = False,
+    fallback: bool = True,
+    output_format: Optional[str] = None,
+) -> pd.DataFrame:
+    """Parse the chosen date columns and report matches in ``attrs["parse_dates"]``.
+
+    The report maps each column to the rows parsed per format, the rows
+    left to the fallback parser and the non-empty rows that stayed ``NaT``.
+    """
+
+    frame = df.copy()
+    if not columns:
+        return frame
+    if isinstance(columns, str):
+        columns = [columns]
+
+    report: Dict[str, Any] = {}
+    for column in columns:
+        if column not in frame.columns:
+            continue
+        column_report: Dict[str, Any] = {}
+        parsed = parse_date_series(
+            frame[column],
+            formats=formats,
+            sample_size=sample_size,
+            dayfirst=dayfirst,
+            fallback=fallback,
+            report=column_report,
+        )
+        if output_format:
+            parsed = parsed.dt.strftime(output_format)
+        frame[column] = parsed
+        report[str(column)] = column_report
+    frame.attrs[REPORT_KEY] = report
+    return frame
+
+
+__all__ = ["CANDIDATE_FORMATS", "META", "detect_formats", "parse_date_series", "process"]
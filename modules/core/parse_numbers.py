@@ -0,0 +1,222 @@
+"""Parse locale-formatted number columns (``1.234,56`` / ``1,234.56``) in bulk."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+META = {
+    "key": "parse_numbers",
+    "name": "Sayıları Ayrıştır",
+    "description": "Seçilen sütunlarda sayı biçimini (Türkçe 1.234,56, ABD 1,234.56 veya düz) örnek üzerinden tespit eder ve tüm sütunu vektörel olarak sayıya çevirir.",
+    "defaults": {
+        # None = no-op; the module only runs on explicitly chosen columns
+        "columns": None,
+        # "auto", "tr", "us", "heuristic" or "plain"
+        "locale": "auto",
+        "sample_size": 1000,
+    },
+    "order": 45,
+    "capabilities": {
+        # "auto" picks the locale per column, so chunks may decide differently
+        "chunk_safe": False,
+        "column_wise": True,
+        "pure": True,
+        "in_place_safe": True,
+    },
+}
+
+REPORT_KEY = "parse_numbers"
+LOCALES = ("auto", "tr", "us", "heuristic", "plain")
+
+_NON_NUMBER = re.compile(r"[^0-9,\.\-]")
+_PLAIN_NON_NUMBER = re.compile(r"[^0-9.\-]")
+# same patterns the hepsiburada plugin used per cell
+_EURO = re.compile(r"\d{1,3}(?:\.\d{3})*(?:,\d+)?")
+_US = re.compile(r"\d{1,3}(?:,\d{3})*(?:\.\d+)?")
+
+
+def _distinct(series: pd.Series):
+    """(codes, distinct values as an object Series); missing cells get code -1."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes, pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+
+
+def _expand(codes: np.ndarray, values: pd.Series, index: pd.Index, missing) -> pd.Series:
+    table = np.append(values.to_numpy(dtype=object), missing)
+    return pd.Series(table[np.where(codes < 0, len(table) - 1, codes)], index=index, dtype=object)
+
+
+def _separators(cleaned: pd.Series) -> Dict[str, Any]:
+    return {
+        "commas": cleaned.str.count(",").to_numpy(),
+        "dots": cleaned.str.count(r"\.").to_numpy(),
+        "last_comma": cleaned.str.rfind(",").to_numpy(),
+        "last_dot": cleaned.str.rfind(".").to_numpy(),
+        "length": cleaned.str.len().to_numpy(),
+    }
+
+
+def classify_cells(cleaned: pd.Series) -> pd.Series:
+    """``"tr"``, ``"us"`` or ``"ambiguous"`` for cells holding only digits, ``,``, ``.`` and ``-``.
+
+    A cell is evidence for Turkish notation when its last separator is a
+    comma after a dot, when it has several dots, or when a single comma is
+    not followed by exactly three digits; the US rules are the mirror image.
+    Cells such as ``1.234`` or ``12`` fit both and are ambiguous.
+    """
+    sep = _separators(cleaned)
+    commas, dots = sep["commas"], sep["dots"]
+    after_comma = sep["length"] - sep["last_comma"] - 1
+    after_dot = sep["length"] - sep["last_dot"] - 1
+    both = (commas > 0) & (dots > 0)
+    tr = (both & (sep["last_comma"] > sep["last_dot"])) | (dots > 1) | ((commas == 1) & (dots == 0) & (after_comma != 3))
+    us = (both & (sep["last_dot"] > sep["last_comma"])) | (commas > 1) | ((dots == 1) & (commas == 0) & (after_dot != 3))
+    kinds = np.where(tr & ~us, "tr", np.where(us & ~tr, "us", "ambiguous"))
+    return pd.Series(kinds, index=cleaned.index, dtype=object)
+
+
+def _as_turkish(cleaned: pd.Series) -> pd.Series:
+    return cleaned.str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+
+
+def _as_us(cleaned: pd.Series) -> pd.Series:
+    return cleaned.str.replace(",", "", regex=False)
+
+
+def _heuristic(cleaned: pd.Series) -> pd.Series:
+    """Vectorized form of the hepsiburada per-cell price rules.
+
+    Turkish-looking cells (``1.234,56``) and US-looking cells (``1,234.56``)
+    are converted as such; otherwise the last separator wins when both
+    appear, a lone comma is a decimal comma, and dots are thousands
+    separators unless a single dot is followed by one or two digits.
+    """
+    sep = _separators(cleaned)
+    commas, dots = sep["commas"] > 0, sep["dots"] > 0
+    euro = cleaned.str.fullmatch(_EURO).fillna(False).to_numpy(dtype=bool)
+    us = ~euro & cleaned.str.fullmatch(_US).fillna(False).to_numpy(dtype=bool)
+    rest = ~euro & ~us
+    comma_decimal = euro | (rest & commas & dots & (sep["last_comma"] > sep["last_dot"])) | (rest & commas & ~dots)
+    dot_decimal = us | (rest & commas & dots & (sep["last_dot"] > sep["last_comma"]))
+    after_dot = sep["length"] - sep["last_dot"] - 1
+    thousands_dots = rest & dots & ~commas & ~((sep["dots"] == 1) & (after_dot >= 1) & (after_dot <= 2))
+
+    result = cleaned.copy()
+    result[comma_decimal] = _as_turkish(cleaned[comma_decimal])
+    result[dot_decimal] = _as_us(cleaned[dot_decimal])
+    result[thousands_dots] = cleaned[thousands_dots].str.replace(".", "", regex=False)
+    return result
+
+
+def detect_locale(cleaned: pd.Series, *, sample_size: int = 1000) -> Optional[str]:
+    """Majority of unambiguous cells in an evenly spaced sample; None on a tie."""
+    step = max(1, len(cleaned) // max(1, sample_size))
+    counts = classify_cells(cleaned.iloc[::step]).value_counts()
+    tr, us = int(counts.get("tr", 0)), int(counts.get("us", 0))
+    if tr == us:
+        return None
+    return "tr" if tr > us else "us"
+
+
+def _normalize(cleaned: pd.Series, locale: str, sample_size: int, report: Optional[Dict[str, Any]]) -> pd.Series:
+    if locale == "tr":
+        return _as_turkish(cleaned)
+    if locale == "us":
+        return _as_us(cleaned)
+    if locale == "heuristic":
+        return _heuristic(cleaned)
+
+    column_locale = detect_locale(cleaned, sample_size=sample_size)
+    kinds = classify_cells(cleaned).to_numpy()
+    if column_locale is not None:
+        # ambiguous cells follow the column; the others follow their own evidence
+        kinds = np.where(kinds == "ambiguous", column_locale, kinds)
+    if report is not None:
+        report["locale"] = column_locale or "heuristic"
+    result = cleaned.copy()
+    for kind, convert in (("tr", _as_turkish), ("us", _as_us), ("ambiguous", _heuristic)):
+        mask = kinds == kind
+        if mask.any():
+            result[mask] = convert(cleaned[mask])
+    return result
+
+
+def parse_number_series(
+    series: pd.Series,
+    *,
+    locale: str = "auto",
+    sample_size: int = 1000,
+    report: Optional[Dict[str, Any]] = None,
+) -> pd.Series:
+    """Parse formatted numbers in ``series``; unparseable cells become NaN.
+
+    Every cell is read as ``str(value)`` and stripped of anything other
+    than digits, ``,``, ``.`` and ``-`` (currency, NBSP, spaces), working on
+    the distinct values only. ``locale`` picks the separators:
+
+    - ``"tr"``: ``.`` groups thousands, ``,`` is the decimal mark.
+    - ``"us"``: ``,`` groups thousands, ``.`` is the decimal mark.
+    - ``"auto"``: the column's notation is detected on a sample (see
+      `classify_cells`) and used for ambiguous cells; cells that
+      contradict it follow their own notation and, when the sample is
+      inconclusive, ambiguous cells use the ``"heuristic"`` rules.
+    - ``"heuristic"``: per-cell rules of the hepsiburada price cleaner.
+    - ``"plain"``: ``,`` becomes ``.`` and the text goes straight to
+      ``pd.to_numeric`` (the cafe plugin's rules).
+
+    ``report``, when given, gets the applied ``locale`` and the ``failed``
+    count of non-missing cells that did not parse.
+    """
+    if locale not in LOCALES:
+        raise ValueError(f"Bilinmeyen sayı biçimi: {locale}")
+    codes, uniques = _distinct(series)
+    if locale == "plain":
+        # missing cells are read as "nan"/"None" like astype(str) would, and fail to parse
+        text = uniques.astype(str).str.replace(",", ".", regex=False)
+        normalized = text.str.replace(_PLAIN_NON_NUMBER, "", regex=True)
+        missing = ""
+    else:
+        normalized = _normalize(uniques.astype(str).str.replace(_NON_NUMBER, "", regex=True), locale, sample_size, report)
+        normalized = normalized.mask(normalized == "")
+        missing = np.nan
+    expanded = _expand(codes, normalized, series.index, missing)
+    if locale != "plain":
+        expanded = expanded.where(expanded.notna(), pd.NA)
+    result = pd.to_numeric(expanded, errors="coerce")
+    if report is not None:
+        report.setdefault("locale", locale)
+        report["failed"] = int((result.isna() & series.notna()).sum())
+    return result.rename(series.name)
+
+
+def process(
+    df: pd.DataFrame,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    locale: str = "auto",
+    sample_size: int = 1000,
+) -> pd.DataFrame:
+    """Parse the chosen columns and report each column's locale in ``attrs["parse_numbers"]``."""
+
+    frame = df.copy()
+    if not columns:
+        return frame
+    if isinstance(columns, str):
+        columns = [columns]
+
+    report: Dict[str, Any] = {}
+    for column in columns:
+        if column not in frame.columns:
+            continue
+        column_report: Dict[str, Any] = {}
+        frame[column] = parse_number_series(frame[column], locale=locale, sample_size=sample_size, report=column_report)
+        report[str(column)] = column_report
+    frame.attrs[REPORT_KEY] = report
+    return frame
+
+
+__all__ = ["LOCALES", "META", "classify_cells", "detect_locale", "parse_number_series", "process"]
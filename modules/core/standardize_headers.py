@@ -18,6 +18,12 @@ META = {
         "max_length": 128,
     },
     "order": 10,
+    "capabilities": {
+        "chunk_safe": True,
+        "column_wise": True,
+        "pure": True,
+        "in_place_safe": True,
+    },
 }
 
 
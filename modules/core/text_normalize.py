@@ -22,8 +22,110 @@ try:
 except Exception:
     unidecode = None  # Optional dependency: transliteration to ASCII
 
+try:
+    import pyarrow
+    import pyarrow.compute as pc
+except Exception:
+    pyarrow = None  # Optional dependency: Arrow compute paths for string[pyarrow] columns
+    pc = None
+
+import html
+
+import numpy as np
 import pandas as pd
 
+from modules.categorical import is_categorical, transform_categories
+
+NBSP = "\u00a0"
+ZERO_WIDTH_CHARS = "\u200B\u200C\u200D\u2060\uFEFF"
+ZW_RE = re.compile(f"[{ZERO_WIDTH_CHARS}]")
+TAG_RE = re.compile(r"<[^>]+>")
+QUOTE_MAP = {
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u201e": '"',
+    "\u201f": '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u00b4": "'",
+    "\u02bc": "'",
+    "\u2032": "'",  # prime
+    "\u2033": '"',  # double prime
+}
+QUOTE_TABLE = str.maketrans(QUOTE_MAP)
+QUOTE_RE = re.compile("[" + "".join(QUOTE_MAP) + "]|''|\"\"")
+
+# Single-byte codecs whose misreadings of UTF-8 ftfy can undo. Mojibake needs
+# the image of a UTF-8 lead byte followed by the image of a continuation byte
+# (or by a space/"?" standing in for a lost 0xA0 or undecodable byte).
+_MOJIBAKE_CODECS = ("latin-1", "cp1252", "cp1250", "cp1251", "cp1253", "cp1254", "cp1257", "iso-8859-2", "mac_roman", "cp437")
+
+
+def _byte_chars(first: int, last: int) -> str:
+    chars = {
+        char
+        for codec in _MOJIBAKE_CODECS
+        for byte in range(first, last + 1)
+        for char in bytes([byte]).decode(codec, errors="ignore")
+    }
+    return "".join(sorted(chars))
+
+
+def _byte_images(first: int, last: int) -> str:
+    return "".join(re.escape(char) for char in _byte_chars(first, last))
+
+
+# Cells ftfy could change: mojibake pairs, replacement/C1/control characters,
+# line separators, curly quotes, ligatures, full/half-width forms, surrogates
+# and HTML entities. NFC changes are checked separately (`is_mojibake_suspect`).
+MOJIBAKE_SUSPECT_RE = re.compile(
+    f"[{_byte_images(0xC2, 0xF4)}][ ?{_byte_images(0x80, 0xBF)}]"
+    "|[\ufffd\x80-\x9f\r\u2028\u2029\x00-\x08\x0b\x0c\x0e-\x1f\x7f\u206a-\u206f\ufeff\ufff9-\ufffc]"
+    "|[\u02bc\u2018-\u201f]"
+    "|[\u0132\u0133\u0149\u01c4-\u01cc\u01f1-\u01f3\ufb00-\ufb06]"
+    "|[\u3000\uff01-\uffee]"
+    "|[\ud800-\udfff]"
+    "|&#?[0-9A-Za-z]{1,24};"
+)
+# without ftfy the heuristic fallback only acts on these characters
+FALLBACK_SUSPECT_RE = re.compile("[\ufffd\xc3]")
+_NON_ASCII_RE = re.compile("[^\x00-\x7f]")
+
+# characters str.split()/str.strip() treat as whitespace (``str.isspace``)
+WHITESPACE_CHARS = "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680" + "".join(map(chr, range(0x2000, 0x200B))) + "\u2028\u2029\u202f\u205f\u3000"
+
+
+def _re2_class(chars: str) -> str:
+    """A character class Arrow's RE2 engine reads the same way as Python's ``re``."""
+    return "[" + "".join(f"\\x{{{ord(char):x}}}" for char in chars) + "]"
+
+
+def _char_ranges(*ranges) -> str:
+    return "".join(chr(code) for first, last in ranges for code in range(first, last + 1))
+
+
+# RE2 twins of the suspect patterns for Arrow columns (which cannot hold surrogates)
+_ARROW_MOJIBAKE_SUSPECT = "|".join([
+    _re2_class(_byte_chars(0xC2, 0xF4)) + _re2_class(" ?" + _byte_chars(0x80, 0xBF)),
+    _re2_class(_char_ranges(
+        (0xFFFD, 0xFFFD), (0x80, 0x9F), (0x0D, 0x0D), (0x2028, 0x2029), (0x00, 0x08), (0x0B, 0x0C),
+        (0x0E, 0x1F), (0x7F, 0x7F), (0x206A, 0x206F), (0xFEFF, 0xFEFF), (0xFFF9, 0xFFFC),
+    )),
+    _re2_class(_char_ranges((0x02BC, 0x02BC), (0x2018, 0x201F))),
+    _re2_class(_char_ranges((0x0132, 0x0133), (0x0149, 0x0149), (0x01C4, 0x01CC), (0x01F1, 0x01F3), (0xFB00, 0xFB06))),
+    _re2_class(_char_ranges((0x3000, 0x3000), (0xFF01, 0xFFEE))),
+    "&#?[0-9A-Za-z]{1,24};",
+])
+_ARROW_FALLBACK_SUSPECT = _re2_class("\ufffd\xc3")
+_ARROW_ZW = _re2_class(ZERO_WIDTH_CHARS)
+_ARROW_WHITESPACE_RUN = _re2_class(WHITESPACE_CHARS) + "+"
+_ARROW_QUOTES = [
+    (replacement, _re2_class("".join(char for char, target in QUOTE_MAP.items() if target == replacement)))
+    for replacement in dict.fromkeys(QUOTE_MAP.values())
+]
+
 
 def _call_on_series_or_string(fn, value, *args, **kwargs):
     if isinstance(value, pd.Series):
@@ -31,13 +133,35 @@ def _call_on_series_or_string(fn, value, *args, **kwargs):
     return fn(value, *args, **kwargs)
 
 
+def apply_on_uniques(series: pd.Series, func) -> pd.Series:
+    """Run a Series -> Series ``func`` on the distinct values only and map back by code.
+
+    Missing values are passed through untouched, as the element-wise helpers
+    here do. Only pure-text columns are memoized: factorizing mixed objects
+    would merge values such as ``1`` and ``1.0`` that the helpers treat
+    differently, so those columns (and unhashable cells) go to ``func`` directly.
+    """
+    if pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return func(series)
+    try:
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    except TypeError:
+        return func(series)
+
+    cleaned = func(pd.Series(uniques.to_numpy(dtype=object), dtype=object)).to_numpy(dtype=object)
+    values = series.to_numpy(dtype=object, copy=True)
+    present = codes >= 0
+    values[present] = cleaned[codes[present]]
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
 def replace_nbsp(text: Union[str, pd.Series]) -> Union[str, pd.Series]:
     """Replace non-breaking spaces with regular spaces."""
 
     def _replace(s: str) -> str:
         if s is None or pd.isna(s):
             return s
-        return s.replace("\u00a0", " ")
+        return s.replace(NBSP, " ")
 
     return _call_on_series_or_string(_replace, text)
 
@@ -45,12 +169,10 @@ def replace_nbsp(text: Union[str, pd.Series]) -> Union[str, pd.Series]:
 def remove_zero_width(text: Union[str, pd.Series]) -> Union[str, pd.Series]:
     """Remove zero width / invisible characters (ZWSP etc.)."""
 
-    ZW_PATTERN = "[\u200B\u200C\u200D\u2060\uFEFF]"
-
     def _remove(s: str) -> str:
         if s is None or pd.isna(s):
             return s
-        return re.sub(ZW_PATTERN, "", s)
+        return ZW_RE.sub("", s)
 
     return _call_on_series_or_string(_remove, text)
 
@@ -73,26 +195,10 @@ def normalize_quotes(text: Union[str, pd.Series]) -> Union[str, pd.Series]:
     This is generic — site-specific replacements should still live in `modules/custom`.
     """
 
-    mapping = {
-        "\u201c": '"',
-        "\u201d": '"',
-        "\u201e": '"',
-        "\u201f": '"',
-        "\u2018": "'",
-        "\u2019": "'",
-        "\u2013": "-",
-        "\u2014": "-",
-        "\u00b4": "'",
-        "\u02bc": "'",
-        "\u2032": "'",  # prime
-        "\u2033": '"',  # double prime
-    }
-
     def _map(s: str) -> str:
         if s is None or pd.isna(s):
             return s
-        for k, v in mapping.items():
-            s = s.replace(k, v)
+        s = s.translate(QUOTE_TABLE)
         # common artefacts
         s = s.replace("''", '"')
         s = s.replace('""', '"')
@@ -101,43 +207,124 @@ def normalize_quotes(text: Union[str, pd.Series]) -> Union[str, pd.Series]:
     return _call_on_series_or_string(_map, text)
 
 
-def fix_mojibake(text: Union[str, pd.Series], use_ftfy: bool = True) -> Union[str, pd.Series]:
-    """Attempt to fix mojibake; uses ftfy if available, otherwise heuristics.
+def is_mojibake_suspect(s: str, use_ftfy: bool = True) -> bool:
+    """True when `fix_mojibake` could change ``s`` (cheap pre-check before ftfy)."""
+    if use_ftfy and ftfy is not None:
+        if MOJIBAKE_SUSPECT_RE.search(s):
+            return True
+        return not s.isascii() and not unicodedata.is_normalized("NFC", s)
+    return FALLBACK_SUSPECT_RE.search(s) is not None
 
-    Accepts a string or a pandas Series (element-wise operation).
-    """
 
-    def _fix(s: str) -> str:
-        if s is None or pd.isna(s):
-            return s
-        s = str(s)
-        # try ftfy first
-        if use_ftfy and ftfy is not None:
-            try:
-                return ftfy.fix_text(s)
-            except Exception:
-                pass
+def _is_arrow_string(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.StringDtype) and str(series.dtype.storage).startswith("pyarrow")
 
-        # heuristic fallback: try re-decode attempts if replacement char present
-        if '�' not in s and '\xc3' not in s:
-            return s
 
-        # attempt latin1 -> utf-8 and reverse
-        candidates = [s]
-        try:
-            candidates.append(s.encode('latin-1', errors='replace').decode('utf-8', errors='replace'))
-        except Exception:
-            pass
+def _arrow_contains(series: pd.Series, pattern: str) -> np.ndarray:
+    array = pyarrow.array(series.array)
+    return pc.fill_null(pc.match_substring_regex(array, pattern), False).to_numpy(zero_copy_only=False)
+
+
+def _arrow_non_ascii(series: pd.Series) -> np.ndarray:
+    array = pyarrow.array(series.array)
+    return np.invert(pc.fill_null(pc.string_is_ascii(array), True).to_numpy(zero_copy_only=False))
+
+
+def mojibake_suspects(series: pd.Series, use_ftfy: bool = True) -> pd.Series:
+    """Vectorized `is_mojibake_suspect` over a Series; non-string cells are False.
+
+    ``string[pyarrow]`` Series are matched by Arrow's regex kernel.
+    """
+    if _is_arrow_string(series):
+        if use_ftfy and ftfy is not None:
+            mask = _arrow_contains(series, _ARROW_MOJIBAKE_SUSPECT)
+            unchecked = _arrow_non_ascii(series) & ~mask
+            if unchecked.any():
+                normalized = [unicodedata.is_normalized("NFC", value) for value in series[unchecked].tolist()]
+                mask[unchecked] = ~np.array(normalized, dtype=bool)
+        else:
+            mask = _arrow_contains(series, _ARROW_FALLBACK_SUSPECT)
+        return pd.Series(mask, index=series.index)
+    try:
+        if use_ftfy and ftfy is not None:
+            mask = series.str.contains(MOJIBAKE_SUSPECT_RE, regex=True, na=False).to_numpy(dtype=bool)
+            unchecked = series.str.contains(_NON_ASCII_RE, regex=True, na=False).to_numpy(dtype=bool) & ~mask
+            if unchecked.any():
+                normalized = [unicodedata.is_normalized("NFC", value) for value in series[unchecked]]
+                mask[unchecked] = ~np.array(normalized, dtype=bool)
+        else:
+            mask = series.str.contains(FALLBACK_SUSPECT_RE, regex=True, na=False).to_numpy(dtype=bool)
+    except AttributeError:  # no string values at all
+        mask = np.zeros(len(series), dtype=bool)
+    return pd.Series(mask, index=series.index)
+
+
+def _fix_mojibake_value(s: str, use_ftfy: bool = True, prefilter: bool = True) -> str:
+    if prefilter and not is_mojibake_suspect(s, use_ftfy):
+        return s
+    # try ftfy first
+    if use_ftfy and ftfy is not None:
         try:
-            candidates.append(s.encode('utf-8', errors='replace').decode('latin-1', errors='replace'))
+            return ftfy.fix_text(s)
         except Exception:
             pass
 
-        # choose shortest replacement-character count
-        best = min(candidates, key=lambda t: t.count('�'))
-        return best
+    # heuristic fallback: try re-decode attempts if replacement char present
+    if '\ufffd' not in s and '\xc3' not in s:
+        return s
+
+    # attempt latin1 -> utf-8 and reverse
+    candidates = [s]
+    try:
+        candidates.append(s.encode('latin-1', errors='replace').decode('utf-8', errors='replace'))
+    except Exception:
+        pass
+    try:
+        candidates.append(s.encode('utf-8', errors='replace').decode('latin-1', errors='replace'))
+    except Exception:
+        pass
 
-    return _call_on_series_or_string(_fix, text)
+    # choose shortest replacement-character count
+    return min(candidates, key=lambda t: t.count('\ufffd'))
+
+
+def fix_mojibake(
+    text: Union[str, pd.Series],
+    use_ftfy: bool = True,
+    prefilter: bool = True,
+    stats: Optional[dict] = None,
+) -> Union[str, pd.Series]:
+    """Attempt to fix mojibake; uses ftfy if available, otherwise heuristics.
+
+    Accepts a string or a pandas Series (element-wise operation). With
+    ``prefilter`` only cells selected by `mojibake_suspects` are passed to
+    ftfy/the heuristics; the rest cannot change. ``stats`` (a dict) receives
+    ``checked`` and ``suspect`` counts.
+    """
+
+    def _fix(s: str) -> str:
+        if s is None or pd.isna(s):
+            return s
+        return _fix_mojibake_value(str(s), use_ftfy, prefilter=False)
+
+    if not isinstance(text, pd.Series):
+        if text is None or pd.isna(text):
+            return text
+        return _fix_mojibake_value(str(text), use_ftfy, prefilter=prefilter)
+
+    if not prefilter:
+        return text.apply(_fix)
+    is_text = text.map(lambda value: isinstance(value, str)).astype(bool)
+    suspects = mojibake_suspects(text, use_ftfy) & is_text
+    if stats is not None:
+        stats["checked"] = stats.get("checked", 0) + int(is_text.sum())
+        stats["suspect"] = stats.get("suspect", 0) + int(suspects.sum())
+    # non-string values are still stringified, as without the prefilter
+    selected = suspects | (~is_text & text.notna())
+    result = text.astype(object).copy()
+    if selected.any():
+        result[selected] = text[selected].apply(_fix)
+    return result
 
 
 from typing import Literal
@@ -178,10 +365,6 @@ def to_ascii(text: Union[str, pd.Series], use_unidecode: bool = True) -> Union[s
 def strip_html_tags(text: Union[str, pd.Series]) -> Union[str, pd.Series]:
     """Strip common HTML tags and unescape entities."""
 
-    import html
-
-    TAG_RE = re.compile(r"<[^>]+>")
-
     def _strip(s: str) -> str:
         if s is None or pd.isna(s):
             return s
@@ -192,6 +375,129 @@ def strip_html_tags(text: Union[str, pd.Series]) -> Union[str, pd.Series]:
     return _call_on_series_or_string(_strip, text)
 
 
+def build_text_normalizer(
+    *,
+    fix_mojibake_opt: bool = True,
+    normalize_quotes_opt: bool = True,
+    replace_nbsp_opt: bool = True,
+    remove_zw_opt: bool = True,
+    collapse_whitespace: bool = True,
+    use_unidecode: bool = False,
+    strip_html: bool = False,
+    mojibake_stats: Optional[dict] = None,
+):
+    """Return a ``str -> str`` kernel applying the enabled normalisations in one call.
+
+    NBSP and zero-width handling share one ``str.translate`` table, quote
+    mapping uses a second one (it must run after the mojibake fix, which can
+    produce curly quotes), and patterns are the module-level compiled ones.
+    The step order and results match the chained `clean_text_pipeline`.
+    Missing and non-string values are returned unchanged. Only values passing
+    `is_mojibake_suspect` go through the mojibake fix; ``mojibake_stats``
+    receives ``checked``/``suspect`` counts.
+    """
+    pre_table = {}
+    if replace_nbsp_opt:
+        pre_table[ord(NBSP)] = " "
+    if remove_zw_opt:
+        pre_table.update({ord(char): None for char in ZERO_WIDTH_CHARS})
+    # translate() is slow per character, so only run it on values that need it
+    pre_re = re.compile("[" + "".join(map(chr, pre_table)) + "]") if pre_table else None
+    transliterate = unidecode if use_unidecode and unidecode is not None else None
+
+    def _kernel(s):
+        if not isinstance(s, str):
+            return s
+        if pre_re is not None and pre_re.search(s):
+            s = s.translate(pre_table)
+        if fix_mojibake_opt:
+            suspect = is_mojibake_suspect(s)
+            if mojibake_stats is not None:
+                mojibake_stats["checked"] = mojibake_stats.get("checked", 0) + 1
+                mojibake_stats["suspect"] = mojibake_stats.get("suspect", 0) + suspect
+            if suspect:
+                s = _fix_mojibake_value(s, prefilter=False)
+        if normalize_quotes_opt and QUOTE_RE.search(s):
+            s = s.translate(QUOTE_TABLE).replace("''", '"').replace('""', '"')
+        if strip_html and ("<" in s or "&" in s):
+            s = html.unescape(TAG_RE.sub("", s))
+        s = unicodedata.normalize("NFC", s)
+        if transliterate is not None:
+            try:
+                s = transliterate(s)
+            except Exception:
+                pass
+        s = s.strip()
+        return " ".join(s.split()) if collapse_whitespace else s
+
+    return _kernel
+
+
+def _map_where(series: pd.Series, mask, func) -> pd.Series:
+    mask = np.asarray(mask, dtype=bool)
+    if not mask.any():
+        return series
+    result = series.copy()
+    result[mask] = [func(value) for value in series[mask].tolist()]
+    return result
+
+
+def normalize_arrow_series(
+    series: pd.Series,
+    *,
+    fix_mojibake_opt: bool = True,
+    normalize_quotes_opt: bool = True,
+    replace_nbsp_opt: bool = True,
+    remove_zw_opt: bool = True,
+    collapse_whitespace: bool = True,
+    use_unidecode: bool = False,
+    strip_html: bool = False,
+    mojibake_stats: Optional[dict] = None,
+) -> pd.Series:
+    """`build_text_normalizer` for ``string[pyarrow]`` Series, column at a time.
+
+    NBSP, zero-width, quote and whitespace handling run as Arrow compute
+    kernels over the whole column. The mojibake fix, HTML stripping, NFC
+    and transliteration stay in Python but only visit the cells that can
+    change (suspects, cells with ``<``/``&``, non-ASCII cells), so results
+    match the fused kernel exactly. The column stays ``string[pyarrow]``.
+    """
+    s = series
+    if replace_nbsp_opt:
+        s = s.str.replace(NBSP, " ", regex=False)
+    if remove_zw_opt:
+        s = s.str.replace(_ARROW_ZW, "", regex=True)
+    if fix_mojibake_opt:
+        suspects = mojibake_suspects(s).to_numpy(dtype=bool)
+        if mojibake_stats is not None:
+            mojibake_stats["checked"] = mojibake_stats.get("checked", 0) + int(s.notna().sum())
+            mojibake_stats["suspect"] = mojibake_stats.get("suspect", 0) + int(suspects.sum())
+        s = _map_where(s, suspects, lambda value: _fix_mojibake_value(value, prefilter=False))
+    if normalize_quotes_opt:
+        for replacement, pattern in _ARROW_QUOTES:
+            s = s.str.replace(pattern, replacement, regex=True)
+        s = s.str.replace("''", '"', regex=False).str.replace('""', '"', regex=False)
+    if strip_html:
+        markup = (s.str.contains("<", regex=False) | s.str.contains("&", regex=False)).fillna(False)
+        s = _map_where(s, markup, lambda value: html.unescape(TAG_RE.sub("", value)))
+    non_ascii = _arrow_non_ascii(s)
+    if non_ascii.any():
+        # only rewrite cells NFC actually changes
+        non_ascii[non_ascii] = [not unicodedata.is_normalized("NFC", value) for value in s[non_ascii].tolist()]
+    s = _map_where(s, non_ascii, lambda value: unicodedata.normalize("NFC", value))
+    if use_unidecode and unidecode is not None:
+        s = _map_where(s, _arrow_non_ascii(s), unidecode)
+    if collapse_whitespace:
+        return s.str.replace(_ARROW_WHITESPACE_RUN, " ", regex=True).str.strip(" ")
+    return s.str.strip(WHITESPACE_CHARS)
+
+
+def _arrow_on_uniques(series: pd.Series, func) -> pd.Series:
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    cleaned = func(pd.Series(uniques.array))
+    return pd.Series(cleaned.array.take(codes, allow_fill=True), index=series.index, name=series.name)
+
+
 def clean_text_pipeline(
     text: Union[str, pd.Series],
     *,
@@ -202,20 +508,98 @@ def clean_text_pipeline(
     collapse_whitespace: bool = True,
     use_unidecode: bool = False,
     strip_html: bool = False,
+    memoize: bool = True,
+    engine: str = "fused",
+    mojibake_stats: Optional[dict] = None,
 ) -> Union[str, pd.Series]:
     """A convenience pipeline that chains common normalisations.
 
     Designed for generic pipeline usage where the same sequence of
-    normalisations is applied to many datasets.
+    normalisations is applied to many datasets. With ``memoize`` a Series is
+    factorized once and the chain runs on its distinct values only (see
+    `apply_on_uniques`). ``engine="fused"`` runs every step in a single pass
+    per value (`build_text_normalizer`); ``"legacy"`` chains one
+    ``Series.apply`` per step. ``mojibake_stats`` collects how many values
+    the mojibake pre-filter checked and flagged (distinct values when memoized).
+    ``string[pyarrow]`` Series use `normalize_arrow_series` unless the engine
+    is ``"legacy"`` and keep their dtype. ``category`` Series are cleaned on
+    their categories (see `transform_categories`) and stay categorical.
     """
 
+    if isinstance(text, pd.Series) and is_categorical(text):
+        return transform_categories(
+            text,
+            lambda categories: clean_text_pipeline(
+                categories,
+                fix_mojibake_opt=fix_mojibake_opt,
+                normalize_quotes_opt=normalize_quotes_opt,
+                replace_nbsp_opt=replace_nbsp_opt,
+                remove_zw_opt=remove_zw_opt,
+                collapse_whitespace=collapse_whitespace,
+                use_unidecode=use_unidecode,
+                strip_html=strip_html,
+                memoize=False,
+                engine=engine,
+                mojibake_stats=mojibake_stats,
+            ),
+        )
+
+    if engine != "legacy" and isinstance(text, pd.Series) and _is_arrow_string(text):
+        def _run(values: pd.Series) -> pd.Series:
+            return normalize_arrow_series(
+                values,
+                fix_mojibake_opt=fix_mojibake_opt,
+                normalize_quotes_opt=normalize_quotes_opt,
+                replace_nbsp_opt=replace_nbsp_opt,
+                remove_zw_opt=remove_zw_opt,
+                collapse_whitespace=collapse_whitespace,
+                use_unidecode=use_unidecode,
+                strip_html=strip_html,
+                mojibake_stats=mojibake_stats,
+            )
+
+        return _arrow_on_uniques(text, _run) if memoize else _run(text)
+
+    if memoize and isinstance(text, pd.Series):
+        return apply_on_uniques(
+            text,
+            lambda values: clean_text_pipeline(
+                values,
+                fix_mojibake_opt=fix_mojibake_opt,
+                normalize_quotes_opt=normalize_quotes_opt,
+                replace_nbsp_opt=replace_nbsp_opt,
+                remove_zw_opt=remove_zw_opt,
+                collapse_whitespace=collapse_whitespace,
+                use_unidecode=use_unidecode,
+                strip_html=strip_html,
+                memoize=False,
+                engine=engine,
+                mojibake_stats=mojibake_stats,
+            ),
+        )
+
+    if engine == "fused":
+        kernel = build_text_normalizer(
+            fix_mojibake_opt=fix_mojibake_opt,
+            normalize_quotes_opt=normalize_quotes_opt,
+            replace_nbsp_opt=replace_nbsp_opt,
+            remove_zw_opt=remove_zw_opt,
+            collapse_whitespace=collapse_whitespace,
+            use_unidecode=use_unidecode,
+            strip_html=strip_html,
+            mojibake_stats=mojibake_stats,
+        )
+        if isinstance(text, pd.Series):
+            return text.map(kernel)
+        return kernel(text)
+
     s = text
     if replace_nbsp_opt:
         s = replace_nbsp(s)
     if remove_zw_opt:
         s = remove_zero_width(s)
     if fix_mojibake_opt:
-        s = fix_mojibake(s)
+        s = fix_mojibake(s, stats=mojibake_stats)
     if normalize_quotes_opt:
         s = normalize_quotes(s)
     if strip_html:
@@ -228,11 +612,16 @@ def clean_text_pipeline(
 
 
 __all__ = [
+    "apply_on_uniques",
+    "build_text_normalizer",
+    "normalize_arrow_series",
     "replace_nbsp",
     "remove_zero_width",
     "normalize_whitespace",
     "normalize_quotes",
     "fix_mojibake",
+    "is_mojibake_suspect",
+    "mojibake_suspects",
     "unicode_normalize_text",
     "clean_text_pipeline",
 ]
@@ -251,23 +640,46 @@ META = {
         "collapse_whitespace": True,
         "use_unidecode": False,
         "strip_html": False,
+        "memoize": True,
+        "engine": "fused",
     },
     "order": 15,
+    "capabilities": {
+        "chunk_safe": True,
+        "column_wise": True,
+        "pure": True,
+        "in_place_safe": True,
+    },
 }
 
 
+def _text_columns(frame: pd.DataFrame) -> list:
+    columns = []
+    for column, dtype in frame.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            if pd.api.types.infer_dtype(dtype.categories, skipna=True) == "string":
+                columns.append(column)
+        elif dtype == object or isinstance(dtype, pd.StringDtype):
+            columns.append(column)
+    return columns
+
+
 def process(df: pd.DataFrame, *, columns: Optional[Iterable[str]] = None, **kwargs) -> pd.DataFrame:
     """Apply `clean_text_pipeline` to specified textual columns.
 
     Parameters mirror `clean_text_pipeline` options. If `columns` is None,
-    operates on all object/string dtype columns.
+    operates on all object/string dtype columns and on category columns
+    with text categories. Per-column mojibake
+    pre-filter hit rates are stored in ``attrs["text_normalize"]["mojibake"]``.
     """
 
     frame = df.copy()
-    target_columns = list(columns) if columns else frame.select_dtypes(include=["object", "string"]).columns.tolist()
+    target_columns = list(columns) if columns else _text_columns(frame)
+    mojibake_report = {}
     for col in target_columns:
         if col not in frame.columns:
             continue
+        stats = {"checked": 0, "suspect": 0}
         frame[col] = clean_text_pipeline(
             frame[col],
             fix_mojibake_opt=kwargs.get("fix_mojibake_opt", True),
@@ -277,5 +689,13 @@ def process(df: pd.DataFrame, *, columns: Optional[Iterable[str]] = None, **kwar
             collapse_whitespace=kwargs.get("collapse_whitespace", True),
             use_unidecode=kwargs.get("use_unidecode", False),
             strip_html=kwargs.get("strip_html", False),
+            memoize=kwargs.get("memoize", True),
+            engine=kwargs.get("engine", "fused"),
+            mojibake_stats=stats,
         )
+        if kwargs.get("fix_mojibake_opt", True):
+            stats["hit_rate"] = stats["suspect"] / stats["checked"] if stats["checked"] else 0.0
+            mojibake_report[str(col)] = stats
+    if mojibake_report:
+        frame.attrs["text_normalize"] = {"mojibake": mojibake_report}
     return frame
@@ -4,25 +4,58 @@ from __future__ import annotations
 
 import pandas as pd
 
+from modules.categorical import is_categorical, transform_categories
+
+try:
+    import pyarrow  # noqa: F401  (optional: Arrow-backed string columns)
+except Exception:
+    pyarrow = None
+
 META = {
     "key": "trim_spaces",
     "name": "Boşlukları Temizle",
     "description": "Tüm metin sütunlarındaki baştaki ve sondaki boşlukları temizler, iç boşlukları korur.",
-    "defaults": {},
+    "defaults": {
+        "use_arrow": False,
+    },
     "order": 18,
+    "capabilities": {
+        "chunk_safe": True,
+        "column_wise": True,
+        "pure": True,
+        "in_place_safe": True,
+    },
 }
 
 
-def _trim_value(value):
-    if isinstance(value, str):
-        return value.strip()
-    return value
+def trim_series(series: pd.Series, *, use_arrow: bool = False) -> pd.Series:
+    """Strip string values with ``.str.strip()``, leaving non-strings as they are.
+
+    With ``use_arrow`` (and pyarrow installed) pure-text object columns are
+    converted to ``string[pyarrow]`` first, so the strip runs as an Arrow
+    compute kernel and the column stays in Arrow memory. ``category``
+    columns are stripped on their categories (merging any that collide) and
+    stay categorical.
+    """
+    if is_categorical(series):
+        return transform_categories(series, trim_series)
+    if use_arrow and pyarrow is not None and series.dtype == object:
+        if pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+            series = series.astype("string[pyarrow]")
+    if isinstance(series.dtype, pd.StringDtype):
+        # every cell is a string or missing; Arrow storage strips natively
+        return series.str.strip()
+    try:
+        stripped = series.str.strip()
+    except AttributeError:  # no string values in the column
+        return series
+    # non-string cells come back as NaN from .str; keep their original value
+    return stripped.where(stripped.notna(), series)
 
 
-def process(df: pd.DataFrame) -> pd.DataFrame:
+def process(df: pd.DataFrame, *, use_arrow: bool = False) -> pd.DataFrame:
     frame = df.copy()
-    text_columns = frame.select_dtypes(include=["object", "string"]).columns
-    if not len(text_columns):
-        return frame
-    frame[text_columns] = frame[text_columns].apply(lambda column: column.map(_trim_value))
+    for position, dtype in enumerate(frame.dtypes):
+        if dtype == object or isinstance(dtype, (pd.StringDtype, pd.CategoricalDtype)):
+            frame.isetitem(position, trim_series(frame.iloc[:, position], use_arrow=use_arrow))
     return frame
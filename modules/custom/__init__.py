@@ -19,7 +19,15 @@ META = {
     "key": "my_plugin_key",          # Benzersiz ID
     "name": "Plugin Görünen Adı",    # GUI'de görünecek isim
     "description": "Ne işe yarar?",  # Açıklama
-    "defaults": {}                   # Varsayılan parametreler (Opsiyonel)
+    "defaults": {},                  # Varsayılan parametreler (Opsiyonel)
+    "capabilities": {                # Yürütücü ipuçları (Opsiyonel, varsayılan: hepsi False/None)
+        "chunk_safe": True,          # Satır parçalarında çalıştırıp birleştirmek = tüm veride çalıştırmak
+        "column_wise": False,        # Her çıktı sütunu yalnızca kendi girdi sütununa bağlı (satırlar korunur)
+        "pure": True,                # Yan etkisiz ve deterministik (sonuç önbelleğe alınabilir)
+        "in_place_safe": True,       # Gelen df'i değiştirmez (savunmacı kopya gerekmez)
+        "columns_read": ["name"],    # Okunan sabit sütunlar (None = bilinmiyor/tümü)
+        "columns_written": ["name"], # Yazılan sabit sütunlar (None = bilinmiyor/tümü)
+    },
 }
 
 def process(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
@@ -1,30 +1,58 @@
 import pandas as pd
 import re
 
+from modules.categorical import apply_by_category, is_categorical, transform_categories
+
 META = {
     "key": "clean_akakce_data",
     "name": "Akakçe Verisi Temizleme",
     "description": "Akakçe'den çekilen verilerde fiyat ve ürün isimlerini temizler.",
-    "defaults": {}
+    "defaults": {},
+    "capabilities": {
+        "chunk_safe": True,
+        "pure": True,
+        "in_place_safe": True,
+        "columns_read": ["name", "price"],
+        "columns_written": ["price", "brand", "model"],
+    },
 }
 
+# '+116 FİYAT' gibi satıcı sayısı ekleri
+_OFFER_COUNT = re.compile(r'\+\d+\s*FİYAT')
+
+
+def _clean_prices(prices: pd.Series) -> pd.Series:
+    cleaned = prices.str.replace(_OFFER_COUNT, '', regex=True).str.strip()
+    # metin olmayan hücreler (sayı, eksik değer) olduğu gibi kalır
+    return cleaned.where(cleaned.notna(), prices)
+
+
+def _split_names(names: pd.Series) -> pd.DataFrame:
+    # İlk boşluğa göre böl: boşluk yoksa marka tüm isimdir, model None
+    parts = names.str.split(' ', n=1, expand=True)
+    brand = parts[0] if parts.shape[1] > 0 else names
+    model = parts[1] if parts.shape[1] > 1 else pd.Series(index=names.index, dtype=object)
+    model = model.astype(object).where(model.notna(), None)
+    return pd.DataFrame({"brand": brand.where(brand.notna(), names), "model": model}, index=names.index)
+
+
 def process(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
     df_copy = df.copy()
 
     # Fiyat sütunundaki '+116 FİYAT' gibi ifadeleri temizle
-    df_copy['price'] = df_copy['price'].apply(lambda x: re.sub(r'\+\d+\s*FİYAT', '', x).strip())
-
-    # 'name' sütununu 'marka' ve 'model' olarak ayır
-    def split_name(name):
-        parts = name.split(' ', 1)  # İlk boşluğa göre böl
-        if len(parts) == 2:
-            return pd.Series({"brand": parts[0], "model": parts[1]})
-        return pd.Series({"brand": name, "model": None})
-
-    name_split = df_copy['name'].apply(split_name)
-    df_copy = pd.concat([df_copy, name_split], axis=1)
+    if 'price' in df_copy.columns:
+        if is_categorical(df_copy['price']):
+            # kategoriler temizlenir, satırlar kodlar üzerinden eşlenir
+            df_copy['price'] = transform_categories(df_copy['price'], _clean_prices)
+        else:
+            df_copy['price'] = _clean_prices(df_copy['price'])
 
-    # 'name' sütununu kaldır
-    df_copy.drop(columns=['name'], inplace=True)
+    # 'name' sütununu 'marka' ve 'model' olarak ayır, ardından 'name' sütununu kaldır
+    if 'name' in df_copy.columns:
+        if is_categorical(df_copy['name']):
+            name_split = apply_by_category(df_copy['name'], _split_names)
+        else:
+            name_split = _split_names(df_copy['name'])
+        df_copy = pd.concat([df_copy.drop(columns=['name']), name_split], axis=1)
 
-    return df_copy
\ No newline at end of file
+    return df_copy
@@ -1,11 +1,13 @@
 import pandas as pd
 from typing import Optional, List
-from modules.core.text_normalize import clean_text_pipeline
-from pathlib import Path
+from modules.audit import record_rows
+from modules.categorical import apply_by_category, is_categorical, transform_categories
+from modules.core.parse_numbers import parse_number_series
+from modules.core.text_normalize import apply_on_uniques, clean_text_pipeline
+from modules.json_fields import flatten_json_series, json_text_series, parse_json_series
 import os
+import re
 import unicodedata
-import json
-import ast
 
 META = {
     "name": "clean_hepsiburada_scrape",
@@ -14,6 +16,12 @@ META = {
     "author": "hazarute",
     "params": {
         "fix_mojibake": True,
+        "flatten_extra": False,
+    },
+    "capabilities": {
+        # row-wise cleaning; not pure because invalid prices are logged to disk
+        "chunk_safe": True,
+        "in_place_safe": True,
     },
 }
 
@@ -34,25 +42,28 @@ def _replace_nbsp(s: str) -> str:
     return s.replace("\u00a0", " ")
 
 
+# Unicode quote-like characters and their ASCII equivalents, as one translate table
+_QUOTES = str.maketrans({
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u201e": '"',
+    "\u201f": '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u00b4": "'",
+    "\u02bc": "'",
+    "\u2032": "'",  # prime
+    "\u2033": '"',  # double prime
+})
+# characters removed from review counts such as "(1.234)"
+_REVIEW_NON_DIGITS = re.compile(r'[^0-9\-]')
+
+
 def _replace_smart_quotes_and_primes(s: str) -> str:
     # Replace multiple Unicode quote-like characters with ASCII equivalents
-    mapping = {
-        "\u201c": '"',
-        "\u201d": '"',
-        "\u201e": '"',
-        "\u201f": '"',
-        "\u2018": "'",
-        "\u2019": "'",
-        "\u2013": "-",
-        "\u2014": "-",
-        "\u00b4": "'",
-        "\u02bc": "'",
-        "\u2032": "'",  # prime
-        "\u2033": '"',  # double prime
-    }
-    for k, v in mapping.items():
-        if k in s:
-            s = s.replace(k, v)
+    s = s.translate(_QUOTES)
     # Fix two apostrophes used to indicate inches -> to double quote
     s = s.replace("''", '"')
     # Convert double double-quotes previously output by scrapers
@@ -105,65 +116,35 @@ def _clean_price(series: pd.Series) -> pd.Series:
     # - 1,234.56  (comma thousands, dot decimal)
     # - 1234.56   (dot decimal)
     # - 1234,56   (comma decimal)
-    import re
-
-    def normalize_price_text(text: str) -> str:
-        if text is None:
-            return ''
-        s = str(text).strip()
-        # drop currency abbreviations and NBSP
-        s = s.replace('\u00a0', ' ')
-        s = re.sub(r"[^0-9,\.\-]", "", s)
-        if s == "":
-            return s
-
-        # European style: dots as thousand sep, comma as decimal (e.g. 1.234,56)
-        euro_re = re.compile(r'^\d{1,3}(?:\.\d{3})*(?:,\d+)?$')
-        # US style: commas as thousand sep, dot as decimal (e.g. 1,234.56)
-        us_re = re.compile(r'^\d{1,3}(?:,\d{3})*(?:\.\d+)?$')
-
-        if euro_re.match(s):
-            s = s.replace('.', '')
-            s = s.replace(',', '.')
-            return s
-        if us_re.match(s):
-            s = s.replace(',', '')
-            return s
-
-        # Mixed or ambiguous cases: fallback heuristics
-        # If there is both '.' and ',' decide based on last separator
-        if ',' in s and '.' in s:
-            if s.rfind(',') > s.rfind('.'):
-                # comma likely decimal
-                s = s.replace('.', '')
-                s = s.replace(',', '.')
-            else:
-                # dot likely decimal
-                s = s.replace(',', '')
-            return s
-
-        # Only commas -> treat comma as decimal
-        if ',' in s and '.' not in s:
-            s = s.replace(',', '.')
-            return s
-
-        # Only dots -> if single dot and <=2 digits after it => decimal, else remove dots
-        if '.' in s and ',' not in s:
-            parts = s.split('.')
-            if len(parts) == 2 and 1 <= len(parts[1]) <= 2:
-                # looks like decimal
-                return s
-            # otherwise remove dots (thousand separators)
-            s = s.replace('.', '')
-            return s
+    # Ambiguous cells follow the heuristic rules of `parse_number_series`.
+    return parse_number_series(series, locale="heuristic")
+
+
+def _clean_name_values(names: pd.Series, fix_mojibake: bool) -> pd.Series:
+    cleaned_names = names.map(lambda s: _clean_name(s, fix_mojibake=fix_mojibake))
+    mask_item = cleaned_names.notna()
+    try:
+        cleaned_names.loc[mask_item] = clean_text_pipeline(
+            cleaned_names.loc[mask_item], fix_mojibake_opt=True, use_unidecode=False, memoize=False
+        )
+    except Exception:
+        # if pipeline fails, keep our normalized names
+        pass
+    return cleaned_names
 
-        return s
 
-    s = series.astype(str).fillna("")
-    normalized = s.map(normalize_price_text)
-    # empty strings -> NA
-    normalized = normalized.replace('', pd.NA)
-    return pd.to_numeric(normalized, errors='coerce')
+def _clean_names(names: pd.Series, fix_mojibake: bool = True) -> pd.Series:
+    # every step is per value, so scraped dumps full of repeated names are
+    # cleaned once per distinct name and mapped back by code
+    return apply_on_uniques(names.astype(str), lambda values: _clean_name_values(values, fix_mojibake))
+
+
+def _clean_reviews(reviews: pd.Series) -> pd.Series:
+    # "(1.234)" -> "1234": brackets and dots are among the dropped characters,
+    # so one pass over the distinct values does what separate passes did
+    r = apply_on_uniques(reviews.astype(str), lambda values: values.str.replace(_REVIEW_NON_DIGITS, '', regex=True))
+    r = r.replace('', pd.NA)
+    return pd.to_numeric(r, errors='coerce', downcast='integer')
 
 
 def _parse_extra(info):
@@ -171,34 +152,21 @@ def _parse_extra(info):
 
     Returns a dict for valid JSON/dict-like input, or {} for empty/invalid values.
     Ensures we never call string methods on NaN (which caused crashes).
+    Whole columns go through `modules.json_fields`, which applies the same
+    rules once per distinct value.
     """
-    if pd.isna(info):
-        return {}
-    if isinstance(info, dict):
-        return info
-    s = str(info).strip()
-    if s == "":
-        return {}
-    # Try JSON first, fall back to ast.literal_eval, then to a lax replace-based attempt
-    try:
-        return json.loads(s)
-    except Exception:
-        try:
-            return ast.literal_eval(s)
-        except Exception:
-            try:
-                return json.loads(s.replace("'", '"'))
-            except Exception:
-                return {}
+    return parse_json_series(pd.Series([info], dtype=object)).iat[0]
 
 
-def run(df: pd.DataFrame, fix_mojibake: bool = True) -> pd.DataFrame:
+def run(df: pd.DataFrame, fix_mojibake: bool = True, flatten_extra: bool = False) -> pd.DataFrame:
     """Plugin to clean hepsiburada-like scraped product rows.
 
     Improvements:
     - Robust price parsing (handles both ' TL' and 'TL', removes '.' thousands and converts ',' to '.')
     - Reviews count cleansing (removes parentheses and '.' thousands separators)
     - Safe parsing of extra/info JSON-like fields (returns {} for NaN / empty cells)
+    - With ``flatten_extra`` the parsed extra keys become typed ``{extra}_{key}``
+      columns instead of being re-serialized into the extra column
 
     Returns the DataFrame with added columns: `Clean_Name`, `Cleaned_Price`,
     `Cleaned_Reviews` (if a reviews column is present) and `Extra_Parsed` (if an extra/info column exists).
@@ -213,20 +181,22 @@ def run(df: pd.DataFrame, fix_mojibake: bool = True) -> pd.DataFrame:
 
     # Clean names in-place (replace original column values)
     if name_col and name_col in df.columns:
-        df[name_col] = df[name_col].astype(str)
-        cleaned_names = df[name_col].apply(lambda s: _clean_name(s, fix_mojibake=fix_mojibake))
-        mask_item = cleaned_names.notna()
-        try:
-            cleaned_names.loc[mask_item] = clean_text_pipeline(cleaned_names.loc[mask_item], fix_mojibake_opt=True, use_unidecode=False)
-        except Exception:
-            # if pipeline fails, keep our normalized names
-            pass
-        df[name_col] = cleaned_names
+        names = df[name_col]
+        if is_categorical(names):
+            # astype(str) below spells missing names "nan"; keep that as a category
+            if names.isna().any():
+                if "nan" not in names.cat.categories:
+                    names = names.cat.add_categories("nan")
+                names = names.fillna("nan")
+            df[name_col] = transform_categories(names, lambda values: _clean_names(values, fix_mojibake))
+        else:
+            df[name_col] = _clean_names(names, fix_mojibake)
 
     # Clean price in-place: preserve original text for logging then overwrite column
     if price_col and price_col in df.columns:
         orig_price = df[price_col].copy()
         try:
+            # works on distinct values, so category columns stay cheap
             cleaned_prices = _clean_price(orig_price)
         except Exception:
             s = orig_price.astype(str).str.replace('\u00a0', ' ', regex=False)
@@ -240,34 +210,28 @@ def run(df: pd.DataFrame, fix_mojibake: bool = True) -> pd.DataFrame:
         # Log rows where original had text but cleaned price is NA
         bad_price_mask = cleaned_prices.isna() & orig_price.notna()
         if bad_price_mask.any():
-            log_filename = "deleted_records_log.csv"
-            invalid_rows = df.loc[bad_price_mask].copy()
-            invalid_rows["Orig_Price_Text"] = orig_price.loc[bad_price_mask].astype(str)
-            invalid_rows["Row_Index"] = invalid_rows.index
-            invalid_rows["Reason"] = "Invalid Price"
-            write_header = not Path(log_filename).exists()
-            invalid_rows.to_csv(log_filename, mode="a", header=write_header, index=False, encoding="utf-8")
+            record_rows(
+                df,
+                bad_price_mask,
+                "Invalid Price",
+                extra={"Orig_Price_Text": orig_price.astype(str), "Row_Index": df.index},
+                source=META["name"],
+            )
 
     # Clean reviews in-place (replace original column values)
     if reviews_col and reviews_col in df.columns:
-        r = df[reviews_col].astype(str).fillna('')
-        r = r.str.replace(r'[\(\)]', '', regex=True)
-        r = r.str.replace(r'\.', '', regex=True)
-        r = r.str.replace(r'[^0-9\-]', '', regex=True)
-        r = r.replace('', pd.NA)
-        cleaned_reviews = pd.to_numeric(r, errors='coerce', downcast='integer')
-        df[reviews_col] = cleaned_reviews
+        if is_categorical(df[reviews_col]):
+            df[reviews_col] = apply_by_category(df[reviews_col], _clean_reviews)
+        else:
+            df[reviews_col] = _clean_reviews(df[reviews_col])
 
     # Optionally parse extra/info column but keep it in the same column (stringified JSON)
     if extra_col and extra_col in df.columns:
-        def _to_jsonish(x):
-            parsed = _parse_extra(x)
-            try:
-                return json.dumps(parsed, ensure_ascii=False)
-            except Exception:
-                return str(x) if not pd.isna(x) else x
-
-        df[extra_col] = df[extra_col].apply(lambda x: _to_jsonish(x) if not pd.isna(x) else x)
+        if flatten_extra:
+            flat = flatten_json_series(df[extra_col].astype(object))
+            df = pd.concat([df, flat.drop(columns=[c for c in flat.columns if c in df.columns])], axis=1)
+        else:
+            df[extra_col] = json_text_series(df[extra_col].astype(object))
 
     return df
 
@@ -1,6 +1,22 @@
+import numpy as np
 import pandas as pd
-import os
-from typing import Optional, List
+from typing import List, Optional, Tuple
+
+from modules.audit import record_rows
+from modules.categorical import apply_by_category, is_categorical, transform_categories
+from modules.core.parse_numbers import parse_number_series
+
+META = {
+    "key": "fix_cafe_business_logic",
+    "name": "Fix Cafe Business Logic",
+    "description": "Kafe satış verileri için iş mantığı temizliği (fiyat, tarih, mükerrer ve geçersiz kayıtlar).",
+    "defaults": {},
+    "capabilities": {
+        # removes duplicates across the whole frame and logs invalid rows to disk
+        "chunk_safe": False,
+        "in_place_safe": True,
+    },
+}
 
 
 def _choose_column(cols: List[str], candidates: List[str]) -> Optional[str]:
@@ -10,11 +26,77 @@ def _choose_column(cols: List[str], candidates: List[str]) -> Optional[str]:
     return None
 
 
+PLACEHOLDER_TOKENS = {"UNKNOWN", "ERROR", "NA", "N/A", "NONE", "-"}
+ITEM_CORRECTIONS = {"Expresso": "Espresso", "Tea - Hot": "Tea", "Tea - Iced": "Iced Tea", "Cappucino": "Cappuccino"}
+
+
 def _parse_numeric_series(series: pd.Series) -> pd.Series:
-    # Convert to string, replace comma with dot, then remove non-numeric
-    s = series.astype(str).str.replace(",", ".")
-    cleaned = s.str.replace(r"[^0-9.\-]", "", regex=True)
-    return pd.to_numeric(cleaned, errors="coerce")
+    # comma -> dot, then drop anything non-numeric (vectorized over distinct values)
+    return parse_number_series(series, locale="plain")
+
+
+def _is_placeholder(values: pd.Series) -> pd.Series:
+    return values.astype(str).str.strip().str.upper().isin(PLACEHOLDER_TOKENS)
+
+
+def _title(values: pd.Series) -> pd.Series:
+    return values.astype(str).str.strip().str.title()
+
+
+def _item_names(values: pd.Series) -> pd.Series:
+    return _title(values).replace(ITEM_CORRECTIONS)
+
+
+def _normalize_text_column(values: pd.Series, clean=None) -> Tuple[pd.Series, pd.Series]:
+    """(cleaned column, placeholder mask) of an object column, computed on its distinct texts.
+
+    Present cells are read as ``str(value)`` and factorized, so ``clean``
+    (applied to the present cells only) and the placeholder test run once
+    per distinct text. Placeholder cells become ``pd.NA``; without ``clean``
+    the other cells keep their original values.
+    """
+    present = values.notna().to_numpy()
+    codes, uniques = pd.factorize(values[present].astype(str))
+    uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    if clean is not None:
+        uniques = clean(uniques)
+    placeholder = np.empty(len(values), dtype=bool)
+    placeholder[present] = _is_placeholder(uniques).to_numpy()[codes]
+    # missing cells too: str(None) is "None", a placeholder
+    placeholder[~present] = _is_placeholder(values[~present]).to_numpy()
+
+    result = values.to_numpy(dtype=object, copy=True)
+    if clean is not None:
+        result[present] = uniques.to_numpy(dtype=object)[codes]
+    result[placeholder] = pd.NA
+    return (
+        pd.Series(result, index=values.index, name=values.name, dtype=object),
+        pd.Series(placeholder, index=values.index),
+    )
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    # the same two passes as pd.to_datetime on the whole column, run once per
+    # distinct value: the format (and day/month order) is inferred from the
+    # first value, and values it cannot parse are retried day-first
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    parsed = pd.to_datetime(uniques, errors="coerce")
+    retry = parsed.isna() & uniques.notna()
+    if retry.any():
+        try:
+            parsed.loc[retry] = pd.to_datetime(uniques[retry], errors="coerce", dayfirst=True)
+        except (TypeError, ValueError):
+            pass
+    dates = parsed.array.take(codes, allow_fill=True)
+    return pd.Series(dates, index=values.index, name=values.name)
+
+
+def _format_dates(dates: pd.Series) -> pd.Series:
+    # strftime once per distinct date; NaT stays missing
+    codes, uniques = pd.factorize(dates)
+    table = np.append(pd.Series(uniques).dt.strftime("%Y-%m-%d").to_numpy(dtype=object), np.nan)
+    return pd.Series(table[codes], index=dates.index, name=dates.name, dtype=object)
 
 
 def run(df: pd.DataFrame) -> pd.DataFrame:
@@ -24,16 +106,13 @@ def run(df: pd.DataFrame) -> pd.DataFrame:
     - Sütun isimlerinin varyasyonlarını destekler (Item / Item Ordered, Transaction Date / Order Date, Total Spent / Price).
     - Fiyatı `Total Spent` olarak önceliklendirir; yoksa `Price Per Unit * Quantity` deneyerek hesaplar.
     - Tarih parse'ı esnektir (ilk deneme infer, ikinci deneme dayfirst=True).
-    - Parse edilemeyen Tarih veya Fiyat satırları `deleted_records_log.csv` dosyasına yazılır ("Reason" sütunu ile).
+    - Parse edilemeyen Tarih veya Fiyat satırları denetim kaydına (`modules.audit`; varsayılan `deleted_records_log.csv`) "Reason" sütunu ile yazılır.
     - Mükerrer silme tüm satır eşleşmesine göre yapılır (tüm sütunlar).
     - Kategori ve Ürün isimlerini baş harfleri büyük olacak şekilde düzenler.
     """
 
     initial_count = len(df)
 
-    # Audit copy for logging
-    df_audit = df.copy()
-
     # Normalize column selection
     cols = list(df.columns)
     txn_col = _choose_column(cols, ["Transaction ID", "Txn ID", "TransactionID", "transaction_id", "order_id"])
@@ -44,35 +123,43 @@ def run(df: pd.DataFrame) -> pd.DataFrame:
     quantity_col = _choose_column(cols, ["Quantity", "Qty", "quantity"])
     date_col = _choose_column(cols, ["Order Date", "OrderDate", "Transaction Date", "TransactionDate", "date"])
 
-    # 1) Drop exact duplicate rows only
-    df = df.drop_duplicates(keep="last")
-
-    # 2) Standardize item names if present (do not coerce missing -> 'Nan')
+    # 1) Work on a shallow copy: cleaned columns replace the copy's columns
+    # and the input frame is never modified, so it serves as the audit source.
+    # Exact duplicates are not dropped here: the single full-row pass at the
+    # end removes them together with rows that only become equal after
+    # cleaning (cleaning is per value, so exact duplicates stay equal).
+    original = df
+    df = df.copy(deep=False)
+
+    # 2) Standardize item and category names (do not coerce missing -> 'Nan'),
+    # then turn placeholder tokens (UNKNOWN, ERROR, N/A) into missing values.
+    # Both happen in one pass over the distinct values of each text column;
+    # the placeholder masks keep marking those cells as 'original content' for logging.
+    cleaners = {}
     if item_col:
-        # operate only on non-null values
-        mask_item = df[item_col].notna()
-        df.loc[mask_item, item_col] = (
-            df.loc[mask_item, item_col].astype(str).str.strip().str.title()
-        )
-        corrections = {"Expresso": "Espresso", "Tea - Hot": "Tea", "Tea - Iced": "Iced Tea", "Cappucino": "Cappuccino"}
-        df.loc[mask_item, item_col] = df.loc[mask_item, item_col].replace(corrections)
-
-    # 2.1) Standardize category names if present
+        cleaners[item_col] = _item_names
     if category_col:
-        mask_cat = df[category_col].notna()
-        df.loc[mask_cat, category_col] = (
-            df.loc[mask_cat, category_col].astype(str).str.strip().str.title()
-        )
+        cleaners.setdefault(category_col, _title)
+    for c, clean in cleaners.items():
+        if not is_categorical(df[c]) and df[c].dtype != object:
+            # e.g. Arrow strings: clean row-wise, only non-null values
+            mask = df[c].notna()
+            cleaned = df[c].copy()
+            cleaned[mask] = clean(df.loc[mask, c])
+            df[c] = cleaned
 
-    # Normalize common placeholder tokens (UNKNOWN, ERROR, N/A) to actual missing values
-    placeholder_tokens = {"UNKNOWN", "ERROR", "NA", "N/A", "NONE", "-"}
-    # Compute placeholder masks BEFORE we replace them so we can still treat them as 'original content' for logging
     placeholder_mask = {}
-    for c in df.select_dtypes(include=[object]).columns:
-        mask = df[c].astype(str).str.strip().str.upper().isin(placeholder_tokens)
-        placeholder_mask[c] = mask
-    for c in df.select_dtypes(include=[object]).columns:
-        df[c] = df[c].where(~df[c].astype(str).str.strip().str.upper().isin(placeholder_tokens), other=pd.NA)
+    for c in df.select_dtypes(include=[object, "category"]).columns:
+        clean = cleaners.get(c)
+        if is_categorical(df[c]):
+            # clean the categories only; names that collide after cleaning are merged
+            if clean is not None:
+                df[c] = transform_categories(df[c], clean)
+            placeholder_mask[c] = apply_by_category(df[c], _is_placeholder, missing=False)
+            # placeholder categories are dropped, their rows become missing
+            df[c] = transform_categories(df[c], lambda values: values.where(~_is_placeholder(values)))
+        else:
+            df[c], placeholder_mask[c] = _normalize_text_column(df[c], clean)
 
     # 3) Parse/compute price
     price_parsed = None
@@ -98,16 +185,7 @@ def run(df: pd.DataFrame) -> pd.DataFrame:
     # 4) Parse dates flexibly
     date_parsed = None
     if date_col:
-        # first attempt: flexible parse
-        date_parsed = pd.to_datetime(df[date_col], errors="coerce")
-        try:
-            mask = date_parsed.isna() & df[date_col].notna()
-            if mask.any():
-                # second attempt with dayfirst
-                second = pd.to_datetime(df.loc[mask, date_col], errors="coerce", dayfirst=True)
-                date_parsed.loc[mask] = second
-        except Exception:
-            pass
+        date_parsed = _parse_dates(df[date_col])
     else:
         date_parsed = pd.Series([pd.NaT] * len(df), index=df.index)
 
@@ -127,33 +205,42 @@ def run(df: pd.DataFrame) -> pd.DataFrame:
 
     invalid_mask = invalid_price_mask | invalid_date_mask
 
-    # 6) Log deleted records with reasons
+    # 6) Log deleted records (original values) with reasons
+    # (exact copies of an invalid row are invalid too; like the rows that are
+    # kept, each group is logged once, by its last occurrence)
     if invalid_mask.any():
-        invalid_rows = df_audit.loc[invalid_mask].copy()
-        invalid_rows["Reason"] = ""
-        invalid_rows.loc[invalid_price_mask, "Reason"] = invalid_rows.loc[invalid_price_mask, "Reason"] + "Invalid Price"
-        invalid_rows.loc[invalid_date_mask, "Reason"] = invalid_rows.loc[invalid_date_mask, "Reason"] + ("; " if invalid_rows.loc[invalid_date_mask, "Reason"].astype(str).ne("").any() else "") + "Invalid Date"
-
-        log_filename = "deleted_records_log.csv"
-        write_header = not os.path.exists(log_filename)
-        invalid_rows.to_csv(log_filename, mode="a", header=write_header, index=False, encoding="utf-8")
+        reasons = np.where(
+            invalid_price_mask & invalid_date_mask,
+            "Invalid Price; Invalid Date",
+            np.where(invalid_price_mask, "Invalid Price", "Invalid Date"),
+        )
+        invalid = invalid_mask.to_numpy()
+        positions = np.flatnonzero(invalid)
+        unique = ~original.iloc[positions].duplicated(keep="last").to_numpy()
+        audit_mask = np.zeros(len(original), dtype=bool)
+        audit_mask[positions[unique]] = True
+        audit_reasons = np.empty(len(original), dtype=object)
+        audit_reasons[audit_mask] = reasons[invalid][unique]
+        record_rows(original, audit_mask, audit_reasons, source=META["key"])
 
     # 7) Remove invalid rows from main df
-    df_clean = df.loc[~invalid_mask].copy()
+    valid = ~invalid_mask
+    df_clean = df.loc[valid].copy()
 
     # 8) Assign cleaned parsed values back into canonical column names for downstream
     # Update original columns if they exist
     if total_spent_col:
-        df_clean[total_spent_col] = price_parsed.loc[df_clean.index]
+        df_clean[total_spent_col] = price_parsed.loc[valid]
 
     if date_col:
-        df_clean[date_col] = pd.to_datetime(date_parsed.loc[df_clean.index], errors="coerce").dt.strftime("%Y-%m-%d")
+        df_clean[date_col] = _format_dates(pd.to_datetime(date_parsed.loc[valid], errors="coerce"))
 
     # 9) Convert Quantity to numeric if present
     if quantity_col and quantity_col in df_clean.columns:
         df_clean[quantity_col] = pd.to_numeric(df_clean[quantity_col], errors="coerce").astype('Int64')
 
-    # Final duplicates check across full rows (already done earlier but keep idempotent)
+    # The one full-row duplicate pass, on the cleaned rows: exact duplicates
+    # and rows cleaning made equal (e.g. "latte" / "Latte ", "5,5" / "5.5")
     df_clean = df_clean.drop_duplicates(keep="last")
 
     return df_clean
@@ -6,11 +6,42 @@ import csv
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 import chardet
 import pandas as pd
 
+from modules.incremental import read_tail
+
+try:
+    import pyarrow  # noqa: F401  (optional: Arrow-backed string columns)
+except Exception:
+    pyarrow = None
+
+ARROW_AVAILABLE = pyarrow is not None
+STRING_BACKENDS = ("python", "arrow")
+ARROW_STRING_DTYPE = "string[pyarrow]"
+
+
+def apply_string_backend(frame: pd.DataFrame, backend: str = "python") -> pd.DataFrame:
+    """Return ``frame`` with pure-text object columns stored as ``string[pyarrow]``.
+
+    ``backend="python"`` (or a missing pyarrow) returns the frame unchanged.
+    Mixed object columns are left alone so non-string values keep their type;
+    the frame is modified in place and returned.
+    """
+    if backend not in STRING_BACKENDS:
+        raise ValueError(f"Bilinmeyen metin altyapısı: {backend}")
+    if backend != "arrow" or pyarrow is None:
+        return frame
+    for position, dtype in enumerate(frame.dtypes):
+        if dtype != object:
+            continue
+        series = frame.iloc[:, position]
+        if pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+            frame.isetitem(position, series.astype(ARROW_STRING_DTYPE))
+    return frame
+
 
 @dataclass
 class DataLoaderConfig:
@@ -18,6 +49,30 @@ class DataLoaderConfig:
     fallback_encoding: str = "utf-8"
     default_delimiter: str = ","
     bad_lines_log: Path = Path("bad_lines.csv")
+    probe_rows: int = 5000
+    # "python" (object columns) or "arrow" (string[pyarrow], needs pyarrow)
+    string_backend: str = "python"
+
+
+@dataclass
+class DataProbe:
+    """Cheap size estimate of a file, built from a small leading sample."""
+
+    path: Path
+    file_size: int
+    encoding: Optional[str]
+    delimiter: Optional[str]
+    sample_rows: int
+    sample_memory: int
+    estimated_rows: int
+    estimated_memory: int
+
+    @property
+    def bytes_per_row(self) -> float:
+        """Average in-memory bytes per row observed in the sample."""
+        if not self.sample_rows:
+            return 0.0
+        return self.sample_memory / self.sample_rows
 
 
 class DataLoader:
@@ -43,6 +98,128 @@ class DataLoader:
                 delimiter = self.config.default_delimiter
         return encoding, delimiter
 
+    def probe(self, path: str, *, sample_rows: Optional[int] = None) -> DataProbe:
+        """Estimate row count and in-memory size without loading the whole file.
+
+        A leading sample is parsed and measured with ``memory_usage(deep=True)``;
+        the result is extrapolated by the byte share of the file it covered.
+        """
+        file_path = Path(path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Dosya bulunamadı: {path}")
+
+        sample_rows = sample_rows or self.config.probe_rows
+        file_size = file_path.stat().st_size
+        suffix = file_path.suffix.lower()
+
+        if suffix == ".csv":
+            encoding, delimiter = self.detect_encoding_and_delimiter(file_path)
+            sample = pd.read_csv(file_path, encoding=encoding, sep=delimiter, engine="python", nrows=sample_rows, on_bad_lines="skip")
+            sample = apply_string_backend(sample, self.config.string_backend)
+            sample_bytes = self._leading_bytes(file_path, len(sample) + 1)
+            ratio = file_size / sample_bytes if sample_bytes else 1.0
+            if len(sample) < sample_rows:
+                # the whole file fitted in the sample
+                ratio = 1.0
+            sample_memory = int(sample.memory_usage(deep=True).sum())
+            return DataProbe(
+                path=file_path,
+                file_size=file_size,
+                encoding=encoding,
+                delimiter=delimiter,
+                sample_rows=len(sample),
+                sample_memory=sample_memory,
+                estimated_rows=int(round(len(sample) * ratio)),
+                estimated_memory=int(sample_memory * ratio),
+            )
+
+        if suffix in {".xlsx", ".xls", ".xlsm"}:
+            sample = apply_string_backend(pd.read_excel(file_path, nrows=sample_rows), self.config.string_backend)
+            total_rows = len(sample)
+            if len(sample) >= sample_rows:
+                total_rows = self._excel_row_count(file_path) or total_rows
+            sample_memory = int(sample.memory_usage(deep=True).sum())
+            per_row = sample_memory / len(sample) if len(sample) else 0
+            return DataProbe(
+                path=file_path,
+                file_size=file_size,
+                encoding=None,
+                delimiter=None,
+                sample_rows=len(sample),
+                sample_memory=sample_memory,
+                estimated_rows=total_rows,
+                estimated_memory=int(per_row * total_rows),
+            )
+
+        raise ValueError(f"Desteklenmeyen dosya formatı: {suffix}")
+
+    def iter_chunks(
+        self,
+        path: str,
+        chunksize: int,
+        *,
+        encoding: Optional[str] = None,
+        delimiter: Optional[str] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the file as consecutive dataframes of at most ``chunksize`` rows.
+
+        Excel workbooks cannot be streamed by pandas and are yielded as one frame.
+        """
+        file_path = Path(path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Dosya bulunamadı: {path}")
+
+        suffix = file_path.suffix.lower()
+        if suffix in {".xlsx", ".xls", ".xlsm"}:
+            self.logger.info("Excel dosyaları parçalı okunamaz; tek parça olarak yükleniyor.")
+            yield self.load(path)
+            return
+        if suffix != ".csv":
+            raise ValueError(f"Desteklenmeyen dosya formatı: {suffix}")
+
+        if encoding is None or delimiter is None:
+            detected_encoding, detected_delimiter = self.detect_encoding_and_delimiter(file_path)
+            encoding = encoding or detected_encoding
+            delimiter = delimiter or detected_delimiter
+        bad_lines = []
+
+        def _capture_bad_lines(line):
+            bad_lines.append(line)
+
+        reader = pd.read_csv(
+            file_path,
+            encoding=encoding,
+            sep=delimiter,
+            engine="python",
+            on_bad_lines=_capture_bad_lines,
+            chunksize=chunksize,
+        )
+        total = 0
+        with reader:
+            for chunk in reader:
+                total += len(chunk)
+                yield apply_string_backend(chunk, self.config.string_backend)
+        if bad_lines:
+            self._append_bad_lines(bad_lines, encoding)
+            self.logger.warning("%s satır bad_lines.csv dosyasına kaydedildi.", len(bad_lines))
+        self.logger.info("%s parçalı olarak okundu (satır: %s)", path, total)
+
+    def load_tail(self, path: str, offset: int, *, encoding: str, delimiter: str) -> Tuple[pd.DataFrame, int]:
+        """Read the complete CSV lines appended after byte ``offset`` (see `read_tail`).
+
+        Malformed lines go to ``bad_lines_log`` like in `load`.
+        """
+        bad_lines = []
+
+        def _capture_bad_lines(line):
+            bad_lines.append(line)
+
+        frame, end = read_tail(Path(path), offset, encoding=encoding, delimiter=delimiter, on_bad_lines=_capture_bad_lines)
+        if bad_lines:
+            self._append_bad_lines(bad_lines, encoding)
+            self.logger.warning("%s satır bad_lines.csv dosyasına kaydedildi.", len(bad_lines))
+        return apply_string_backend(frame, self.config.string_backend), end
+
     def load(self, path: str, *, encoding: Optional[str] = None, delimiter: Optional[str] = None) -> pd.DataFrame:
         file_path = Path(path)
         if not file_path.exists():
@@ -95,15 +272,43 @@ class DataLoader:
                 self._append_bad_lines(bad_lines, encoding)
                 self.logger.warning("%s satır bad_lines.csv dosyasına kaydedildi.", len(bad_lines))
             self.logger.info("%s başarıyla okundu (satır: %s)", path, len(frame))
-            return frame
+            return apply_string_backend(frame, self.config.string_backend)
 
         if suffix in {".xlsx", ".xls", ".xlsm"}:
             frame = pd.read_excel(file_path)
             self.logger.info("%s başarıyla okundu (satır: %s)", path, len(frame))
-            return frame
+            return apply_string_backend(frame, self.config.string_backend)
 
         raise ValueError(f"Desteklenmeyen dosya formatı: {suffix}")
 
+    @staticmethod
+    def _leading_bytes(file_path: Path, line_count: int) -> int:
+        consumed = 0
+        with file_path.open("rb") as handle:
+            for _ in range(line_count):
+                line = handle.readline()
+                if not line:
+                    break
+                consumed += len(line)
+        return consumed
+
+    @staticmethod
+    def _excel_row_count(file_path: Path) -> Optional[int]:
+        try:
+            from openpyxl import load_workbook
+        except Exception:
+            return None
+        try:
+            workbook = load_workbook(file_path, read_only=True)
+            try:
+                sheet = workbook.worksheets[0]
+                # first row is the header
+                return max((sheet.max_row or 1) - 1, 0)
+            finally:
+                workbook.close()
+        except Exception:
+            return None
+
     def _append_bad_lines(self, bad_lines, encoding: str) -> None:
         destination = self.config.bad_lines_log
         destination.parent.mkdir(parents=True, exist_ok=True)
@@ -113,4 +318,4 @@ class DataLoader:
                 writer.writerow(line)
 
 
-__all__ = ["DataLoader", "DataLoaderConfig"]
\ No newline at end of file
+__all__ = ["DataLoader", "DataLoaderConfig", "DataProbe", "apply_string_backend", "ARROW_AVAILABLE", "STRING_BACKENDS"]
\ No newline at end of file
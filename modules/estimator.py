@@ -0,0 +1,173 @@
+"""Estimate pipeline run time and memory from a stratified sample of the input."""
+
+from __future__ import annotations
+
+import io
+import logging
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from modules.audit import NullAuditSink, use_sink
+from modules.data_loader import DataLoader, DataProbe
+from modules.pipeline_manager import PipelineManager
+
+
+@dataclass
+class StepEstimate:
+    key: str
+    name: str
+    sample_seconds: float
+    sample_peak_bytes: int
+    rows_in: int
+    rows_out: int
+    estimated_seconds: float = 0.0
+    estimated_peak_bytes: int = 0
+
+
+@dataclass
+class CostEstimate:
+    file: str
+    file_size: int
+    sample_rows: int
+    estimated_rows: int
+    scale: float
+    load_seconds: float
+    steps: List[StepEstimate] = field(default_factory=list)
+
+    @property
+    def estimated_seconds(self) -> float:
+        return self.load_seconds + sum(step.estimated_seconds for step in self.steps)
+
+    @property
+    def estimated_peak_bytes(self) -> int:
+        return max((step.estimated_peak_bytes for step in self.steps), default=0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["estimated_seconds"] = self.estimated_seconds
+        data["estimated_peak_bytes"] = self.estimated_peak_bytes
+        return data
+
+
+class PipelineEstimator:
+    """Runs the selected modules on a sample and extrapolates to the full file.
+
+    The sample is stratified by file position: equal slices of rows are read
+    from evenly spaced byte offsets, so sorted or appended files are not
+    represented by their head only. Time and memory are measured in separate
+    passes so tracemalloc overhead does not distort the timings.
+    """
+
+    def __init__(
+        self,
+        data_loader: Optional[DataLoader] = None,
+        pipeline_manager: Optional[PipelineManager] = None,
+    ) -> None:
+        self.data_loader = data_loader or DataLoader()
+        self.pipeline_manager = pipeline_manager or PipelineManager()
+        self.logger = logging.getLogger("PipelineEstimator")
+
+    def sample(self, path: str, probe: DataProbe, sample_rows: int, strata: int = 10) -> pd.DataFrame:
+        """Return up to ``sample_rows`` rows drawn from ``strata`` positions of the file."""
+        if probe.estimated_rows <= sample_rows or probe.path.suffix.lower() != ".csv":
+            if probe.path.suffix.lower() == ".csv":
+                return self.data_loader.load(path, encoding=probe.encoding, delimiter=probe.delimiter)
+            return pd.read_excel(path, nrows=sample_rows)
+
+        strata = max(1, strata)
+        rows_per_stratum = max(1, sample_rows // strata)
+        with Path(path).open("rb") as handle:
+            header = handle.readline()
+            body_start = handle.tell()
+            span = max(probe.file_size - body_start, 1)
+            lines: List[bytes] = []
+            for index in range(strata):
+                handle.seek(body_start + span * index // strata)
+                if index:
+                    handle.readline()  # skip the partial line we landed in
+                for _ in range(rows_per_stratum):
+                    line = handle.readline()
+                    if not line:
+                        break
+                    lines.append(line if line.endswith(b"\n") else line + b"\n")
+
+        text = (header + b"".join(lines)).decode(probe.encoding or "utf-8", errors="replace")
+        return pd.read_csv(io.StringIO(text), sep=probe.delimiter or ",", engine="python", on_bad_lines="skip")
+
+    def estimate(
+        self,
+        path: str,
+        modules: Iterable[str],
+        *,
+        sample_rows: int = 10000,
+        strata: int = 10,
+        measure_memory: bool = True,
+    ) -> CostEstimate:
+        probe = self.data_loader.probe(path)
+
+        load_started = perf_counter()
+        sample = self.sample(path, probe, sample_rows, strata)
+        load_seconds = perf_counter() - load_started
+
+        scale = probe.estimated_rows / len(sample) if len(sample) else 1.0
+        estimate = CostEstimate(
+            file=str(path),
+            file_size=probe.file_size,
+            sample_rows=len(sample),
+            estimated_rows=probe.estimated_rows,
+            scale=scale,
+            load_seconds=load_seconds * scale,
+        )
+
+        self.pipeline_manager.selected_modules_list = list(modules)
+        descriptors = self.pipeline_manager.selected_descriptors() if self.pipeline_manager.selected_modules_list else []
+
+        # plugins run on a sample here; their rejected rows are not real audit records
+        with use_sink(NullAuditSink()):
+            frame = sample
+            timed: List[StepEstimate] = []
+            for descriptor in descriptors:
+                started = perf_counter()
+                result = self.pipeline_manager.run_step(frame, descriptor)
+                timed.append(
+                    StepEstimate(
+                        key=descriptor.key,
+                        name=descriptor.name,
+                        sample_seconds=perf_counter() - started,
+                        sample_peak_bytes=int(frame.memory_usage(deep=True).sum()),
+                        rows_in=len(frame),
+                        rows_out=len(result),
+                    )
+                )
+                frame = result
+
+            if measure_memory and descriptors:
+                frame = sample
+                for descriptor, step in zip(descriptors, timed):
+                    input_bytes = int(frame.memory_usage(deep=True).sum())
+                    tracemalloc.start()
+                    try:
+                        frame = self.pipeline_manager.run_step(frame, descriptor)
+                        _, peak = tracemalloc.get_traced_memory()
+                    finally:
+                        tracemalloc.stop()
+                    step.sample_peak_bytes = input_bytes + peak
+
+        for step in timed:
+            step.estimated_seconds = step.sample_seconds * scale
+            step.estimated_peak_bytes = int(step.sample_peak_bytes * scale)
+        estimate.steps = timed
+        return estimate
+
+
+def estimate_pipeline_cost(path: str, modules: Iterable[str], **kwargs) -> CostEstimate:
+    """Convenience wrapper around `PipelineEstimator.estimate`."""
+    return PipelineEstimator().estimate(path, modules, **kwargs)
+
+
+__all__ = ["CostEstimate", "PipelineEstimator", "StepEstimate", "estimate_pipeline_cost"]
@@ -0,0 +1,163 @@
+"""Persisted per-source state for incremental (append-only) processing."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import json
+import logging
+import shutil
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_STATE_DIR = Path(".neatdata_state")
+_HEAD_BYTES = 65536
+
+
+@dataclass
+class SourceState:
+    """What has already been processed from one growing source file."""
+
+    source: str
+    byte_offset: int = 0
+    rows_processed: int = 0
+    head_digest: str = ""
+    encoding: Optional[str] = None
+    delimiter: Optional[str] = None
+    modules: List[str] = field(default_factory=list)
+    output_path: Optional[str] = None
+    step_states: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+def head_digest(path: Path, length: int) -> str:
+    """SHA-1 of the first ``length`` bytes (capped), used to detect rewritten files."""
+    with path.open("rb") as handle:
+        data = handle.read(min(length, _HEAD_BYTES))
+    return hashlib.sha1(data).hexdigest()
+
+
+def read_tail(
+    path: Path,
+    offset: int,
+    *,
+    encoding: str,
+    delimiter: str,
+    on_bad_lines: Optional[Callable[[List[str]], None]] = None,
+) -> Tuple[pd.DataFrame, int]:
+    """Parse complete lines after ``offset`` (0 = whole file) using the file's header.
+
+    Returns the frame and the byte offset just after the last complete line, so a
+    line still being written is picked up by the next run. Malformed lines are
+    passed to ``on_bad_lines`` (see `DataLoader.load_tail`); without it they raise.
+    """
+    with path.open("rb") as handle:
+        header = handle.readline()
+        start = max(offset, len(header))
+        handle.seek(start)
+        data = handle.read()
+
+    last_newline = data.rfind(b"\n")
+    if last_newline < 0:
+        return pd.DataFrame(), start
+    data = data[: last_newline + 1]
+    end = start + len(data)
+    if not data.strip():
+        return pd.DataFrame(), end
+
+    frame = pd.read_csv(io.BytesIO(header + data), encoding=encoding, sep=delimiter, engine="python", on_bad_lines=on_bad_lines or "error")
+    return frame, end
+
+
+def _encode_step_state(value: Any) -> Any:
+    """Make a step state JSON-serialisable; numpy arrays become tagged base64 blobs."""
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        return {
+            "__ndarray__": array.dtype.str,
+            "shape": list(array.shape),
+            "data": base64.b64encode(array.tobytes()).decode("ascii"),
+        }
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(key): _encode_step_state(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_step_state(item) for item in value]
+    return value
+
+
+def _decode_step_state(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "__ndarray__" in value:
+            data = base64.b64decode(value["data"])
+            return np.frombuffer(data, dtype=np.dtype(value["__ndarray__"])).reshape(value["shape"]).copy()
+        return {key: _decode_step_state(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_step_state(item) for item in value]
+    return value
+
+
+class IncrementalStateStore:
+    """Stores one `SourceState` per source as ``root/<sha1(path)>/state.json``.
+
+    Step states may hold numpy arrays (e.g. the drop_duplicates hash set);
+    they are stored in the same JSON file as dtype-tagged base64 blobs. The
+    runner keeps ``root`` next to the output (see `for_output`).
+    """
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root or DEFAULT_STATE_DIR)
+        self.logger = logging.getLogger("IncrementalStateStore")
+
+    @classmethod
+    def for_output(cls, output_path: Path) -> "IncrementalStateStore":
+        """Store kept in ``DEFAULT_STATE_DIR`` beside ``output_path``."""
+        return cls(root=Path(output_path).parent / DEFAULT_STATE_DIR)
+
+    def directory_for(self, source: str) -> Path:
+        key = hashlib.sha1(str(Path(source).resolve()).encode("utf-8")).hexdigest()[:16]
+        return self.root / key
+
+    def load(self, source: str) -> Optional[SourceState]:
+        directory = self.directory_for(source)
+        meta_path = directory / "state.json"
+        if not meta_path.exists():
+            return None
+        try:
+            data = json.loads(meta_path.read_text(encoding="utf-8"))
+            data["step_states"] = _decode_step_state(data["step_states"])
+            return SourceState(**data)
+        except Exception as exc:  # pylint: disable=broad-except
+            self.logger.warning("Artımlı durum okunamadı (%s): %s", source, exc)
+            return None
+
+    def save(self, state: SourceState) -> None:
+        directory = self.directory_for(state.source)
+        directory.mkdir(parents=True, exist_ok=True)
+        data = asdict(state)
+        data["step_states"] = _encode_step_state(data["step_states"])
+        meta_tmp = directory / "state.json.tmp"
+        meta_tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        meta_tmp.replace(directory / "state.json")
+
+    def clear(self, source: str) -> None:
+        shutil.rmtree(self.directory_for(source), ignore_errors=True)
+
+    def is_continuation(self, state: SourceState, modules: List[str], output_path: Path) -> bool:
+        """True when the source only grew since ``state`` and the same output can be appended to."""
+        path = Path(state.source)
+        if not path.exists() or path.stat().st_size < state.byte_offset:
+            return False
+        if state.modules != list(modules):
+            return False
+        if not state.output_path or Path(state.output_path) != output_path or not output_path.exists():
+            return False
+        return head_digest(path, state.byte_offset) == state.head_digest
+
+
+__all__ = ["IncrementalStateStore", "SourceState", "head_digest", "read_tail", "DEFAULT_STATE_DIR"]
@@ -0,0 +1,188 @@
+"""Batch parsing of JSON-like text columns (scraped ``extra``/``info`` fields).
+
+Scraped exports carry per-row metadata as JSON (``{"k": 1}``) or as Python
+reprs (``{'k': 1}``), with the same few blobs repeated over many rows. The
+helpers here parse every distinct (stripped) string once, sniff on a sample
+which parser to try first, and only run the slower fallbacks for values the
+first parser rejects. A value's result never depends on the sniffed order:
+it is the same as trying ``json.loads``, ``ast.literal_eval`` and a
+quote-replacing ``json.loads`` in turn, with ``{}`` for empty or invalid text.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+FORMATS = ("json", "python")
+# distinct values used to pick the first parser of a column
+SNIFF_SIZE = 200
+
+
+def _json(text: str):
+    return json.loads(text)
+
+
+def _literal(text: str):
+    return ast.literal_eval(text)
+
+
+def _lax_json(text: str):
+    return json.loads(text.replace("'", '"'))
+
+
+def _parsers(fmt: str, text: str):
+    # both grammars agree on values they share except for backslash escapes
+    # (``\\/``, surrogate pairs), so those always get JSON's reading first
+    if fmt == "python" and "\\" not in text:
+        return (_literal, _json, _lax_json)
+    return (_json, _literal, _lax_json)
+
+
+def _parse_text(text: str, fmt: str) -> Tuple[Any, int]:
+    """(parsed value, index of the parser that succeeded or -1)."""
+    if text == "":
+        return {}, -1
+    for position, parser in enumerate(_parsers(fmt, text)):
+        try:
+            return parser(text), position
+        except Exception:
+            continue
+    return {}, -1
+
+
+def sniff_format(texts) -> str:
+    """``"json"`` unless most of ``texts`` are rejected by ``json.loads``."""
+    sample = [text for text in texts if text]
+    if not sample:
+        return "json"
+    step = max(1, len(sample) // SNIFF_SIZE)
+    sample = sample[::step]
+    hits = 0
+    for text in sample:
+        try:
+            json.loads(text)
+            hits += 1
+        except Exception:
+            pass
+    return "json" if hits * 2 >= len(sample) else "python"
+
+
+def _parse_distinct(series: pd.Series, report: Optional[Dict[str, Any]]) -> Tuple[np.ndarray, List[Any]]:
+    """(codes, parsed values); missing cells get code -1.
+
+    Text cells are keyed by ``str(value).strip()`` and parsed once per key;
+    cells that already hold a dict are used as they are.
+    """
+    values = series.to_numpy(dtype=object)
+    missing = series.isna().to_numpy()
+    is_dict = np.fromiter((isinstance(value, dict) for value in values), dtype=bool, count=len(values))
+    text_positions = np.flatnonzero(~missing & ~is_dict)
+    dict_positions = np.flatnonzero(is_dict)
+
+    texts = pd.Series(values[text_positions], dtype=object).astype(str).str.strip()
+    text_codes, uniques = pd.factorize(texts)
+    uniques = list(uniques)
+    fmt = sniff_format(uniques)
+
+    table: List[Any] = []
+    used = np.empty(len(uniques), dtype=int)
+    for position, text in enumerate(uniques):
+        parsed, used[position] = _parse_text(text, fmt)
+        table.append(parsed)
+    table.extend(values[dict_positions])
+
+    codes = np.full(len(values), -1, dtype=np.intp)
+    codes[text_positions] = text_codes
+    codes[dict_positions] = len(uniques) + np.arange(len(dict_positions))
+
+    if report is not None:
+        rows = np.bincount(text_codes, minlength=len(uniques))
+        non_empty = np.array([text != "" for text in uniques], dtype=bool)
+        report["format"] = fmt
+        report["fallback"] = int(rows[used > 0].sum())
+        report["failed"] = int(rows[(used < 0) & non_empty].sum())
+    return codes, table
+
+
+def _object_array(items: List[Any]) -> np.ndarray:
+    # element-wise fill; np.array would unpack parsed lists into extra dimensions
+    array = np.empty(len(items), dtype=object)
+    for position, item in enumerate(items):
+        array[position] = item
+    return array
+
+
+def _dumps(parsed) -> Optional[str]:
+    try:
+        return json.dumps(parsed, ensure_ascii=False)
+    except Exception:
+        return None
+
+
+def parse_json_series(series: pd.Series, *, report: Optional[Dict[str, Any]] = None) -> pd.Series:
+    """Parsed value of each cell; missing, empty and invalid cells become ``{}``.
+
+    Equal cells share one parsed object, so copy a value before mutating it.
+    ``report``, when given, gets the sniffed ``format``, the rows that needed
+    a ``fallback`` parser and the non-empty rows that ``failed`` to parse.
+    """
+    codes, table = _parse_distinct(series, report)
+    # the trailing {} is what code -1 (missing) picks
+    lookup = _object_array(table + [{}])
+    return pd.Series(lookup[codes], index=series.index, name=series.name, dtype=object)
+
+
+def json_text_series(series: pd.Series, *, report: Optional[Dict[str, Any]] = None) -> pd.Series:
+    """Cells re-serialized as JSON text (``ensure_ascii=False``); missing cells stay missing.
+
+    Values that cannot be serialized (sets, bytes, ...) keep ``str`` of the
+    original cell.
+    """
+    codes, table = _parse_distinct(series, report)
+    dumped = _object_array([_dumps(parsed) for parsed in table])
+
+    result = series.to_numpy(dtype=object, copy=True)
+    present = codes >= 0
+    result[present] = dumped[codes[present]]
+    for position in np.flatnonzero(present & pd.isna(result)):
+        result[position] = str(series.iat[position])
+    return pd.Series(result, index=series.index, name=series.name, dtype=object)
+
+
+def flatten_json_series(
+    series: pd.Series,
+    *,
+    prefix: Optional[str] = None,
+    sep: str = "_",
+    report: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """Spread the keys of parsed dict cells into typed columns.
+
+    Nested keys are joined with ``sep`` and columns are named
+    ``{prefix}{sep}{key}`` (``prefix`` defaults to the series name). The
+    distinct values are flattened in one ``pd.json_normalize`` call and
+    expanded to the rows by code, so each column gets the dtype pandas
+    infers for it; rows without a key, or whose value is not a dict, are
+    missing.
+    """
+    codes, table = _parse_distinct(series, report)
+    records = [parsed if isinstance(parsed, dict) else {} for parsed in table]
+    if (codes < 0).any():
+        # trailing empty record for the missing rows; only added when needed
+        # so integer keys present in every row stay integers
+        records.append({})
+        codes = np.where(codes < 0, len(records) - 1, codes)
+    flat = pd.json_normalize(records, sep=sep)
+    frame = flat.iloc[codes].reset_index(drop=True).set_axis(series.index, axis=0)
+    prefix = series.name if prefix is None else prefix
+    if prefix is not None:
+        frame.columns = [f"{prefix}{sep}{column}" for column in frame.columns]
+    return frame.infer_objects()
+
+
+__all__ = ["FORMATS", "flatten_json_series", "json_text_series", "parse_json_series", "sniff_format"]
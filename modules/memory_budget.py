@@ -0,0 +1,122 @@
+"""Memory budget governor used to pick in-memory or chunked execution."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Union
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?i?b?)?\s*$", re.IGNORECASE)
+_UNITS = {
+    "": 1,
+    "b": 1,
+    "k": 1024,
+    "m": 1024 ** 2,
+    "g": 1024 ** 3,
+    "t": 1024 ** 4,
+}
+
+
+def parse_memory_size(value: Union[None, int, float, str]) -> Optional[int]:
+    """Convert ``512MB`` / ``2G`` / ``1.5GiB`` / plain byte counts to bytes.
+
+    Returns None for empty values so callers can treat "no budget" uniformly.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    text = str(value).strip()
+    if not text:
+        return None
+    match = _SIZE_RE.match(text)
+    if not match:
+        raise ValueError(f"Geçersiz bellek boyutu: {value}")
+    number = float(match.group(1))
+    unit = (match.group(2) or "").lower()[:1]
+    return int(number * _UNITS[unit]) or None
+
+
+def format_bytes(value: Optional[float]) -> str:
+    """Human readable byte count for log messages."""
+    if value is None:
+        return "-"
+    size = float(value)
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+@dataclass
+class ExecutionPlan:
+    """Outcome of a budget check: how the pipeline should be executed."""
+
+    mode: str
+    estimated_frame_bytes: int
+    estimated_peak_bytes: int
+    budget_bytes: Optional[int] = None
+    chunksize: Optional[int] = None
+
+    @property
+    def chunked(self) -> bool:
+        return self.mode == "chunked"
+
+
+@dataclass
+class MemoryBudget:
+    """Predicts the per-step peak of a pipeline and compares it to a budget.
+
+    Every step receives a frame and returns a (usually copied) frame, and the
+    caller keeps the loaded frame alive, so the peak of a step is modelled as
+    ``frame * (1 + step_peak_factor)``.
+    """
+
+    limit_bytes: Optional[int] = None
+    step_peak_factor: float = 3.0
+    chunk_fill_ratio: float = 0.5
+    min_chunk_rows: int = 1000
+
+    @classmethod
+    def from_value(cls, value: Union[None, int, float, str, "MemoryBudget"]) -> "MemoryBudget":
+        if isinstance(value, MemoryBudget):
+            return value
+        return cls(limit_bytes=parse_memory_size(value))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.limit_bytes)
+
+    def predict_peak(self, frame_bytes: int, step_count: int) -> int:
+        if step_count <= 0:
+            return int(frame_bytes)
+        return int(frame_bytes * (1 + self.step_peak_factor))
+
+    def chunk_rows(self, bytes_per_row: float) -> int:
+        """Largest row count whose predicted step peak fits in the budget."""
+        if not self.limit_bytes or bytes_per_row <= 0:
+            return self.min_chunk_rows
+        per_row_peak = bytes_per_row * (1 + self.step_peak_factor)
+        rows = int(self.limit_bytes * self.chunk_fill_ratio / per_row_peak)
+        return max(rows, self.min_chunk_rows)
+
+    def plan(self, frame_bytes: int, rows: int, step_count: int) -> ExecutionPlan:
+        peak = self.predict_peak(frame_bytes, step_count)
+        if not self.limit_bytes or peak <= self.limit_bytes or rows <= 0:
+            return ExecutionPlan(
+                mode="memory",
+                estimated_frame_bytes=int(frame_bytes),
+                estimated_peak_bytes=peak,
+                budget_bytes=self.limit_bytes,
+            )
+        return ExecutionPlan(
+            mode="chunked",
+            estimated_frame_bytes=int(frame_bytes),
+            estimated_peak_bytes=peak,
+            budget_bytes=self.limit_bytes,
+            chunksize=self.chunk_rows(frame_bytes / rows),
+        )
+
+
+__all__ = ["ExecutionPlan", "MemoryBudget", "format_bytes", "parse_memory_size"]
@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import logging
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 import pandas as pd
 
-from modules.core import ModuleDescriptor, load_core_modules
+from modules.audit import AuditSink, active_sink, audited, use_sink
+from modules.checkpoint import CheckpointStore
+from modules.core import ModuleCapabilities, ModuleDescriptor, load_core_modules
+from modules.data_loader import STRING_BACKENDS, apply_string_backend
+from modules.memory_budget import MemoryBudget, format_bytes
+from modules.plugin_pool import PluginWorkerPool
+from modules.profiling import DataProfiler
+
+
+def discover_custom_modules(custom_path: Path) -> Dict[str, ModuleDescriptor]:
+    """Load every plugin file in ``custom_path`` into descriptors keyed by META key."""
+    registry: Dict[str, ModuleDescriptor] = {}
+    if not custom_path.exists():
+        return registry
+    for file in sorted(custom_path.glob("*.py")):
+        if file.name.startswith("_"):
+            continue
+        module_name = f"modules.custom.{file.stem}"
+        spec = importlib.util.spec_from_file_location(module_name, file)
+        if not spec or not spec.loader:
+            continue
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)  # type: ignore[attr-defined]
+        meta = getattr(module, "META", {})
+        key = meta.get("key", file.stem)
+        descriptor = ModuleDescriptor(
+            key=key,
+            name=meta.get("name", file.stem.replace("_", " ").title()),
+            description=meta.get("description", "Özel eklenti"),
+            defaults=meta.get("defaults", {}),
+            process=getattr(module, "process"),
+            capabilities=ModuleCapabilities.from_meta(meta),
+            process_stateful=getattr(module, "process_stateful", None),
+            process_chunked=getattr(module, "process_chunked", None),
+        )
+        registry[key] = descriptor
+    return registry
 
 
 @dataclass
@@ -25,13 +65,46 @@ class PipelineStep:
 class PipelineManager:
     """Builds and executes a dataframe cleaning pipeline."""
 
-    def __init__(self, custom_path: Optional[str] = None, selected_modules_list: Optional[Iterable[str]] = None) -> None:
+    def __init__(
+        self,
+        custom_path: Optional[str] = None,
+        selected_modules_list: Optional[Iterable[str]] = None,
+        memory_budget: Union[None, int, str, MemoryBudget] = None,
+        max_workers: int = 1,
+        cache_results: bool = False,
+        string_backend: str = "python",
+        profile_points: Optional[Iterable[str]] = None,
+        audit_dir: Optional[str] = None,
+        plugin_workers: int = 0,
+        plugin_timeout: Optional[float] = None,
+        plugin_memory_limit: Union[None, int, str] = None,
+    ) -> None:
         """Initialize PipelineManager.
 
         Args:
             custom_path: optional path to `modules/custom` directory.
             selected_modules_list: iterable of module keys or names selected by the GUI.
                 If provided, `run_pipeline` will execute only the modules listed here.
+            memory_budget: optional budget (bytes or strings like ``"2GB"``). When the
+                predicted per-step peak of `run_pipeline` exceeds it, the frame is
+                processed in row slices instead of as a whole.
+            max_workers: threads used to run `column_wise` modules on column groups.
+            cache_results: cache outputs of `pure` modules keyed by input fingerprint.
+            string_backend: ``"arrow"`` stores pure-text columns as ``string[pyarrow]``
+                before the first step, so string modules run Arrow compute kernels.
+            profile_points: where to take a data-quality profile (`modules.profiling`):
+                ``"input"``, ``"output"``, ``"before:<key>"`` or ``"after:<key>"``.
+                Results are stored in ``profiles`` under the same names; chunked
+                runs profile the stream in the same pass.
+            audit_dir: when set, rows rejected by plugins (`modules.audit`) are written
+                to a new run directory below it (``audit_path``) instead of the legacy
+                ``deleted_records_log.csv`` in the working directory.
+            plugin_workers: when > 0, custom plugins run in that many warm worker
+                processes (`modules.plugin_pool`) instead of in this process, so a
+                runaway plugin cannot block the caller.
+            plugin_timeout: seconds one isolated plugin call may take (None: no limit).
+            plugin_memory_limit: memory one isolated plugin call may allocate
+                (bytes or strings like ``"2GB"``; POSIX only).
         """
         self.logger = logging.getLogger("PipelineManager")
         self.custom_path = Path(custom_path or Path(__file__).parent / "custom")
@@ -42,6 +115,23 @@ class PipelineManager:
         # list provided by GUI (module keys or display names)
         self.selected_modules_list: List[str] = list(selected_modules_list) if selected_modules_list is not None else []
         self.steps: List[PipelineStep] = []
+        self.memory_budget = MemoryBudget.from_value(memory_budget)
+        self.max_workers = max(1, int(max_workers or 1))
+        self.cache_results = cache_results
+        self._result_cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        self._cache_size = 8
+        if string_backend not in STRING_BACKENDS:
+            raise ValueError(f"Bilinmeyen metin altyapısı: {string_backend}")
+        self.string_backend = string_backend
+        self.profile_points = set(profile_points or [])
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self.audit_dir = audit_dir
+        self.audit_path: Optional[Path] = None
+        self.plugin_workers = max(0, int(plugin_workers or 0))
+        self.plugin_timeout = plugin_timeout
+        self.plugin_memory_limit = plugin_memory_limit
+        self._plugin_pool: Optional[PluginWorkerPool] = None
+        self._pool_signature: tuple = ()
 
     def available_core_modules(self) -> Dict[str, ModuleDescriptor]:
         return self.core_modules
@@ -55,6 +145,46 @@ class PipelineManager:
         self.custom_modules = self._discover_custom_modules()
         return self.custom_modules
 
+    def _custom_files_signature(self) -> tuple:
+        """(name, mtime, size) of every plugin file; changes when a plugin is edited, added or removed."""
+        if not self.custom_path.exists():
+            return ()
+        signature = []
+        for file in sorted(self.custom_path.glob("*.py")):
+            if file.name.startswith("_"):
+                continue
+            stat = file.stat()
+            signature.append((str(file), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def plugin_pool(self) -> Optional[PluginWorkerPool]:
+        """Worker pool for custom plugins, started on first use; None unless `plugin_workers` > 0."""
+        if self.plugin_workers <= 0:
+            self._close_plugin_pool()
+            return None
+        pool = self._plugin_pool
+        # workers keep the plugin files they imported; restart them only when those changed
+        if (
+            pool is None
+            or pool.size != self.plugin_workers
+            or pool.custom_path != self.custom_path
+            or self._pool_signature != self._custom_signature
+        ):
+            self._close_plugin_pool()
+            self.logger.info("Eklenti işçileri başlatılıyor: %d süreç", self.plugin_workers)
+            pool = self._plugin_pool = PluginWorkerPool(self.custom_path, size=self.plugin_workers)
+            self._pool_signature = self._custom_signature
+        return pool
+
+    def close(self) -> None:
+        """Stop the plugin worker processes, if any were started."""
+        self._close_plugin_pool()
+
+    def _close_plugin_pool(self) -> None:
+        if self._plugin_pool is not None:
+            self._plugin_pool.close()
+            self._plugin_pool = None
+
     def build_pipeline(
         self,
         *,
@@ -140,57 +270,342 @@ class PipelineManager:
                 return d
         return None
 
-    def run_pipeline(self, df: pd.DataFrame) -> pd.DataFrame:
+    def run_pipeline(self, df: pd.DataFrame, *, checkpoint: Optional[CheckpointStore] = None) -> pd.DataFrame:
         """Run only the modules listed in `selected_modules_list`.
 
         Behavior:
         - If `selected_modules_list` is empty or None, the pipeline is a no-op and returns the input frame.
         - Each entry in `selected_modules_list` may be a module `key` or a human-friendly `name`.
         - Modules are executed in the order provided by `selected_modules_list`.
+        - With a memory budget, frames whose predicted step peak exceeds it are
+          processed in row slices and concatenated afterwards.
+        - With a `checkpoint` store, the frame is saved after every completed step
+          and a previously interrupted run resumes after its last good step.
+        - With `audit_dir`, rows rejected by plugins go to a per-run audit directory.
         """
-        frame = df.copy()
+        with self._audit_run():
+            return self._run_pipeline(df, checkpoint)
+
+    def _run_pipeline(self, df: pd.DataFrame, checkpoint: Optional[CheckpointStore]) -> pd.DataFrame:
         if not self.selected_modules_list:
             self.logger.info("Hiç modül seçilmedi; pipeline çalıştırılmıyor.")
+            return df.copy()
+
+        descriptors = self.selected_descriptors()
+        df = self._apply_string_backend(df)
+        if checkpoint is not None:
+            self._profile("input", df)
+            return self._profile("output", self._run_with_checkpoints(df, descriptors, checkpoint))
+
+        if self.memory_budget.enabled and len(df):
+            frame_bytes = int(df.memory_usage(deep=True).sum())
+            plan = self.memory_budget.plan(frame_bytes, len(df), len(descriptors))
+            if plan.chunked:
+                self.logger.warning(
+                    "Tahmini tepe bellek %s > bütçe %s; %s satırlık dilimlerle çalıştırılıyor.",
+                    format_bytes(plan.estimated_peak_bytes),
+                    format_bytes(plan.budget_bytes),
+                    plan.chunksize,
+                )
+                slices = (df.iloc[start:start + plan.chunksize] for start in range(0, len(df), plan.chunksize))
+                parts = list(self.run_pipeline_chunked(slices, descriptors=descriptors))
+                if not parts:
+                    return df.iloc[0:0].copy()
+                combined = pd.concat(parts)
+                if not combined.index.is_unique:
+                    combined = combined.reset_index(drop=True)
+                return combined
+
+        self._profile("input", df)
+        return self._profile("output", self._run_owned(df, descriptors))
+
+    def run_pipeline_chunked(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        *,
+        descriptors: Optional[List[ModuleDescriptor]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Run the selected modules on each chunk and yield the cleaned chunks.
+
+        Steps are applied independently per chunk. Modules that are not
+        `chunk_safe` but provide `process_chunked` (such as duplicate removal)
+        receive the whole chunk stream instead. Other non-chunk-safe modules
+        cannot be split, so the stream is gathered and they run once on all
+        rows (the memory budget does not hold for them); later steps continue
+        on that single frame.
+        """
+        if descriptors is None:
+            descriptors = self.selected_descriptors() if self.selected_modules_list else []
+        unsafe = [
+            descriptor.key
+            for descriptor in descriptors
+            if not descriptor.capabilities.chunk_safe and descriptor.process_chunked is None
+        ]
+        if unsafe:
+            self.logger.warning(
+                "Parçalı modda şu adımlar chunk_safe değil; tüm satırlar birleştirilip tek seferde çalıştırılacak "
+                "(bellek bütçesi aşılabilir): %s",
+                ", ".join(unsafe),
+            )
+
+        owned = all(descriptor.capabilities.in_place_safe for descriptor in descriptors)
+        stream: Iterator[pd.DataFrame] = (
+            self._apply_string_backend(chunk if owned else chunk.copy()) for chunk in chunks
+        )
+        stream = self._profile_stream(stream, "input")
+        for descriptor in descriptors:
+            stream = self._profile_stream(stream, f"before:{descriptor.key}")
+            stream = self._chunk_stage(stream, descriptor)
+            stream = self._profile_stream(stream, f"after:{descriptor.key}")
+        for chunk in self._audited(self._profile_stream(stream, "output")):
+            yield chunk
+
+    def _chunk_stage(self, stream: Iterator[pd.DataFrame], descriptor: ModuleDescriptor) -> Iterator[pd.DataFrame]:
+        if descriptor.process_chunked is not None and not descriptor.capabilities.chunk_safe:
+            params = getattr(descriptor, "defaults", {}) or {}
+            try:
+                yield from descriptor.process_chunked(stream, **params)
+            except RuntimeError:
+                raise  # already attributed by an upstream stage
+            except Exception as exc:  # pylint: disable=broad-except
+                raise RuntimeError(f"Seçili modül '{descriptor.key}' çalışırken hata: {exc}") from exc
+            return
+        if not descriptor.capabilities.chunk_safe:
+            # per-chunk results would differ from the in-memory run: run once on all rows
+            parts = list(stream)
+            if not parts:
+                return
+            frame = pd.concat(parts) if len(parts) > 1 else parts[0]
+            if not frame.index.is_unique:
+                frame = frame.reset_index(drop=True)
+            yield self.run_step(frame, descriptor)
+            return
+        for chunk in stream:
+            yield self.run_step(chunk, descriptor)
+
+    def run_pipeline_incremental(self, df: pd.DataFrame, step_states: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+        """Run the selected modules on newly appended rows only.
+
+        Steps exposing `process_stateful` receive their entry of `step_states`
+        (created on first use) and update it in place, so the caller can
+        persist it for the next run. Other non-`chunk_safe` steps only see the
+        new rows.
+        """
+        if not self.selected_modules_list:
+            return df.copy()
+        descriptors = self.selected_descriptors()
+        unsafe = [d.key for d in descriptors if not d.capabilities.chunk_safe and d.process_stateful is None]
+        if unsafe:
+            self.logger.warning("Artımlı modda şu adımlar yalnızca yeni satırlara uygulanır: %s", ", ".join(unsafe))
+
+        frame = self._apply_string_backend(df.copy())
+        with self._audit_run():
+            for descriptor in descriptors:
+                self.logger.info("Çalıştırılıyor: %s (%s)", descriptor.name, descriptor.key)
+                if descriptor.process_stateful is None:
+                    frame = self.run_step(frame, descriptor)
+                    continue
+                params = getattr(descriptor, "defaults", {}) or {}
+                state = step_states.setdefault(descriptor.key, {})
+                try:
+                    frame = descriptor.process_stateful(frame, state, **params)
+                except Exception as exc:  # pylint: disable=broad-except
+                    raise RuntimeError(f"Seçili modül '{descriptor.key}' çalışırken hata: {exc}") from exc
+        return frame
+
+    @contextmanager
+    def _audit_run(self) -> Iterator[None]:
+        """Send audit rows of one run to a fresh `AuditSink` when `audit_dir` is set."""
+        if not self.audit_dir or active_sink() is not None:
+            yield
+            return
+        with AuditSink(self.audit_dir) as sink, use_sink(sink):
+            self.audit_path = sink.path
+            yield
+
+    def _audited(self, stream: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Chunked counterpart of `_audit_run`: the sink is active only while a chunk is produced."""
+        if not self.audit_dir or active_sink() is not None:
+            yield from stream
+            return
+        with AuditSink(self.audit_dir) as sink:
+            self.audit_path = sink.path
+            yield from audited(stream, sink)
+
+    def _profile(self, point: str, frame: pd.DataFrame) -> pd.DataFrame:
+        """Profile ``frame`` into ``profiles[point]`` when that point was requested."""
+        if point in self.profile_points:
+            self.profiles[point] = DataProfiler().update(frame).result()
+        return frame
+
+    def _profile_stream(self, stream: Iterator[pd.DataFrame], point: str) -> Iterator[pd.DataFrame]:
+        """Pass chunks through, profiling them on the way when ``point`` was requested."""
+        if point not in self.profile_points:
+            yield from stream
+            return
+        profiler = DataProfiler()
+        for chunk in stream:
+            profiler.update(chunk)
+            yield chunk
+        self.profiles[point] = profiler.result()
+
+    def _apply_string_backend(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Convert text columns to the configured backend without touching the caller's frame."""
+        if self.string_backend == "python":
             return frame
+        return apply_string_backend(frame.copy(deep=False), self.string_backend)
 
-        # Ensure we have up-to-date custom modules
-        self.refresh_custom_modules()
+    def selected_descriptors(self) -> List[ModuleDescriptor]:
+        """Resolve `selected_modules_list` into descriptors, skipping unknown entries."""
+        # Ensure we have up-to-date custom modules; unchanged plugin files are not re-imported
+        if self._custom_files_signature() != self._custom_signature:
+            self.refresh_custom_modules()
 
+        descriptors: List[ModuleDescriptor] = []
         for sel in self.selected_modules_list:
             descriptor = self._find_descriptor(sel)
             if not descriptor:
                 self.logger.warning("Seçili modül bulunamadı: %s (atlandı)", sel)
                 continue
-            self.logger.info("Çalıştırılıyor: %s (%s)", descriptor.name, descriptor.key)
-            params = getattr(descriptor, "defaults", {}) or {}
-            try:
-                frame = descriptor.process(frame, **params)
-            except Exception as exc:  # pylint: disable=broad-except
-                raise RuntimeError(f"Seçili modül '{descriptor.key}' çalışırken hata: {exc}") from exc
+            descriptors.append(descriptor)
+        return descriptors
+
+    def resume_point(self, checkpoint: CheckpointStore, descriptors: Optional[List[ModuleDescriptor]] = None) -> int:
+        """Number of leading steps already completed by `checkpoint` (0 if it does not fit the selection)."""
+        completed = checkpoint.completed_steps()
+        if not completed:
+            return 0
+        if descriptors is None:
+            descriptors = self.selected_descriptors()
+        expected = [descriptor.key for descriptor in descriptors[: len(completed)]]
+        if completed != expected or len(completed) > len(descriptors):
+            self.logger.warning("Checkpoint adımları seçimle uyuşmuyor; baştan çalıştırılıyor.")
+            return 0
+        return len(completed)
+
+    def _run_with_checkpoints(
+        self,
+        df: pd.DataFrame,
+        descriptors: List[ModuleDescriptor],
+        checkpoint: CheckpointStore,
+    ) -> pd.DataFrame:
+        start = 0
+        frame = None
+        if self.resume_point(checkpoint, descriptors):
+            resumed = checkpoint.latest()
+            if resumed is not None:
+                start, frame = resumed
+                self.logger.info("Checkpoint bulundu (%s); %s. adımdan devam ediliyor.", checkpoint.run_id, start + 1)
+            else:
+                self.logger.warning("Checkpoint verisi bulunamadı (%s); verilen tablo baştan işleniyor.", checkpoint.run_id)
+        if frame is None:
+            frame = df.copy()
 
+        for index, descriptor in enumerate(descriptors[start:], start=start + 1):
+            frame = self._run_descriptors(frame, [descriptor])
+            checkpoint.save(index, descriptor.key, frame)
         return frame
 
-    def _discover_custom_modules(self) -> Dict[str, ModuleDescriptor]:
-        registry: Dict[str, ModuleDescriptor] = {}
-        if not self.custom_path.exists():
-            return registry
-        for file in sorted(self.custom_path.glob("*.py")):
-            if file.name.startswith("_"):
-                continue
-            module_name = f"modules.custom.{file.stem}"
-            spec = importlib.util.spec_from_file_location(module_name, file)
-            if not spec or not spec.loader:
-                continue
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)  # type: ignore[attr-defined]
-            meta = getattr(module, "META", {})
-            key = meta.get("key", file.stem)
-            descriptor = ModuleDescriptor(
-                key=key,
-                name=meta.get("name", file.stem.replace("_", " ").title()),
-                description=meta.get("description", "Özel eklenti"),
-                defaults=meta.get("defaults", {}),
-                process=getattr(module, "process"),
+    def run_step(self, frame: pd.DataFrame, descriptor: ModuleDescriptor) -> pd.DataFrame:
+        """Run a single descriptor with its default parameters.
+
+        Declared capabilities steer execution: `pure` results are served from
+        the cache when enabled, and `column_wise` modules run on column groups
+        in parallel (or only on their declared `columns_read`). With
+        `plugin_workers`, custom plugins run in the worker pool.
+        """
+        params = getattr(descriptor, "defaults", {}) or {}
+        capabilities = descriptor.capabilities
+        cache_key = None
+        if self.cache_results and capabilities.pure:
+            cache_key = self._cache_key(frame, descriptor, params)
+            if cache_key is not None and cache_key in self._result_cache:
+                self._result_cache.move_to_end(cache_key)
+                self.logger.debug("Önbellekten döndürüldü: %s", descriptor.key)
+                return self._result_cache[cache_key].copy()
+        try:
+            if self.plugin_workers > 0 and self.custom_modules.get(descriptor.key) is descriptor:
+                descriptor = self._isolated(descriptor)
+            if capabilities.column_wise and (capabilities.columns_read is not None or self.max_workers > 1):
+                result = self._run_column_wise(frame, descriptor, params)
+            else:
+                result = descriptor.process(frame, **params)
+        except Exception as exc:  # pylint: disable=broad-except
+            raise RuntimeError(f"Seçili modül '{descriptor.key}' çalışırken hata: {exc}") from exc
+        if cache_key is not None:
+            self._result_cache[cache_key] = result.copy()
+            while len(self._result_cache) > self._cache_size:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _isolated(self, descriptor: ModuleDescriptor) -> ModuleDescriptor:
+        """``descriptor`` with `process` calls sent to the plugin worker pool."""
+        pool = self.plugin_pool()
+
+        def process(frame: pd.DataFrame, **params: Any) -> pd.DataFrame:
+            return pool.run(
+                descriptor.key, frame, params, timeout=self.plugin_timeout, memory_limit=self.plugin_memory_limit
             )
-            registry[key] = descriptor
-        return registry
+
+        return replace(descriptor, process=process)
+
+    def _run_owned(self, frame: pd.DataFrame, descriptors: List[ModuleDescriptor], *, log: bool = True) -> pd.DataFrame:
+        """Run descriptors without mutating `frame`.
+
+        The defensive copy is skipped when every step declares `in_place_safe`.
+        """
+        owned = all(descriptor.capabilities.in_place_safe for descriptor in descriptors)
+        result = self._run_descriptors(frame if owned else frame.copy(), descriptors, log=log)
+        return result.copy() if result is frame else result
+
+    def _run_column_wise(self, frame: pd.DataFrame, descriptor: ModuleDescriptor, params: Dict[str, Any]) -> pd.DataFrame:
+        capabilities = descriptor.capabilities
+        if capabilities.columns_read is not None:
+            read = [column for column in capabilities.columns_read if column in frame.columns]
+            written = capabilities.columns_written if capabilities.columns_written is not None else capabilities.columns_read
+            partial = descriptor.process(frame[read], **params)
+            result = frame.copy(deep=False)
+            for column in written:
+                if column in partial.columns:
+                    result[column] = partial[column]
+            return result
+
+        columns = list(range(frame.shape[1]))
+        workers = min(self.max_workers, len(columns))
+        if workers < 2:
+            return descriptor.process(frame, **params)
+        size = -(-len(columns) // workers)
+        groups = [columns[start:start + size] for start in range(0, len(columns), size)]
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            parts = list(executor.map(lambda group: descriptor.process(frame.iloc[:, group], **params), groups))
+        return pd.concat(parts, axis=1)
+
+    def _cache_key(self, frame: pd.DataFrame, descriptor: ModuleDescriptor, params: Dict[str, Any]) -> Optional[tuple]:
+        try:
+            hashes = pd.util.hash_pandas_object(frame, index=True)
+        except TypeError as exc:
+            # unhashable cells (lists, dicts) cannot be keyed; the step runs uncached
+            self.logger.debug("Önbellek anahtarı hesaplanamadı (%s): %s", descriptor.key, exc)
+            return None
+        # the digest covers row order too, unlike a sum of the row hashes
+        digest = hashlib.sha1(hashes.to_numpy().tobytes()).hexdigest()
+        return (
+            descriptor.key,
+            repr(sorted(params.items())),
+            tuple(map(str, frame.columns)),
+            tuple(map(str, frame.dtypes)),
+            frame.shape,
+            digest,
+        )
+
+    def _run_descriptors(self, frame: pd.DataFrame, descriptors: List[ModuleDescriptor], *, log: bool = True) -> pd.DataFrame:
+        for descriptor in descriptors:
+            if log:
+                self.logger.info("Çalıştırılıyor: %s (%s)", descriptor.name, descriptor.key)
+            self._profile(f"before:{descriptor.key}", frame)
+            frame = self._profile(f"after:{descriptor.key}", self.run_step(frame, descriptor))
+        return frame
+
+    def _discover_custom_modules(self) -> Dict[str, ModuleDescriptor]:
+        self._custom_signature = self._custom_files_signature()
+        return discover_custom_modules(self.custom_path)
@@ -0,0 +1,356 @@
+"""Run custom plugins in a pool of warm, isolated worker processes.
+
+A plugin from ``modules/custom`` normally runs inside the caller's process,
+so a slow or runaway one blocks the API worker or GUI thread and cannot be
+stopped. `PluginWorkerPool` starts worker processes (``spawn``) that import
+pandas and discover the plugins once, then serve calls:
+
+- Frames travel through shared memory: they are pickled with protocol 5 and
+  the out-of-band buffers (the column blocks) are copied into one
+  `SharedMemory` block instead of being streamed through the pipe. Unlike an
+  Arrow round trip this keeps object columns exactly as they are (NaN vs
+  None, mixed types, ``attrs``), so a plugin sees the same frame as in-process.
+- Every call has a time limit: on timeout the worker is killed and replaced,
+  and `PluginTimeoutError` is raised.
+- Every call may have a memory limit (``RLIMIT_AS``, POSIX only): the worker
+  may grow its address space by that much during the call. Allocations
+  beyond it raise `PluginMemoryError` and the worker is replaced.
+
+Rows a plugin logs with `modules.audit.record_rows` are collected in the
+worker and replayed into the caller's current sink, so audit output matches
+an in-process call.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+import traceback
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from modules.memory_budget import format_bytes, parse_memory_size
+
+try:
+    import resource  # POSIX only: per-call address space limit
+except Exception:
+    resource = None
+
+logger = logging.getLogger("PluginPool")
+
+# seconds a new worker may take to import pandas and the plugins
+START_TIMEOUT = 120.0
+
+
+class PluginWorkerError(RuntimeError):
+    """A plugin call failed in, or lost, its worker process."""
+
+
+class PluginTimeoutError(PluginWorkerError):
+    """A plugin call exceeded its time limit; the worker was replaced."""
+
+
+class PluginMemoryError(PluginWorkerError):
+    """A plugin call exceeded its memory limit; the worker was replaced."""
+
+
+def _write_shared(payload: Any) -> Tuple[shared_memory.SharedMemory, List[int]]:
+    """Pickle ``payload`` into a new shared memory block; returns it and the part sizes."""
+    buffers: List[pickle.PickleBuffer] = []
+    head = pickle.dumps(payload, protocol=5, buffer_callback=buffers.append)
+    views = [memoryview(head)] + [buffer.raw() for buffer in buffers]
+    sizes = [view.nbytes for view in views]
+    block = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+    offset = 0
+    for view, size in zip(views, sizes):
+        block.buf[offset:offset + size] = view
+        offset += size
+    return block, sizes
+
+
+def _read_shared(name: str, sizes: List[int]) -> Any:
+    """Unpickle a block written by `_write_shared`; the result owns its memory."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        head = bytes(block.buf[:sizes[0]])
+        buffers = []
+        offset = sizes[0]
+        for size in sizes[1:]:
+            buffers.append(bytearray(block.buf[offset:offset + size]))
+            offset += size
+        return pickle.loads(head, buffers=buffers)
+    finally:
+        block.close()
+
+
+def _address_space() -> int:
+    """Current address space of this process in bytes (Linux), else 0."""
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[0]) * resource.getpagesize()
+    except Exception:
+        return 0
+
+
+@contextmanager
+def _memory_limit(limit: Optional[int]) -> Iterator[None]:
+    """Let the address space grow by at most ``limit`` bytes inside the block."""
+    if not limit or resource is None:
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    cap = _address_space() + limit
+    if hard != resource.RLIM_INFINITY:
+        cap = min(cap, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (cap, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _worker_main(conn, custom_path: str) -> None:
+    """Worker loop: warm up once, then run ``(key, block, sizes, params, limit)`` requests."""
+    try:
+        from modules.audit import MemoryAuditSink, use_sink
+        from modules.pipeline_manager import discover_custom_modules
+
+        plugins = discover_custom_modules(Path(custom_path))
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        return
+    conn.send(("ready", sorted(plugins)))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        key, name, sizes, params, limit = message
+        block = None
+        try:
+            if key not in plugins:
+                raise KeyError(f"Eklenti bulunamadı: {key}")
+            frame = _read_shared(name, sizes)
+            sink = MemoryAuditSink()
+            with _memory_limit(limit), use_sink(sink):
+                result = plugins[key].process(frame, **params)
+            del frame
+            block, sizes = _write_shared((result, sink))
+            reply = ("ok", block.name, sizes)
+        except MemoryError:
+            reply = ("memory", traceback.format_exc())
+        except Exception as exc:
+            reply = ("error", f"{type(exc).__name__}: {exc}", traceback.format_exc())
+        conn.send(reply)
+        if block is not None:
+            # wait until the caller has copied the result out
+            conn.recv()
+            block.close()
+            block.unlink()
+
+
+class _Worker:
+    def __init__(self, context, custom_path: Path) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child, str(custom_path)), name="plugin-worker", daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def wait_ready(self, timeout: float) -> List[str]:
+        if not self.conn.poll(timeout):
+            self.kill()
+            raise PluginWorkerError(f"Eklenti işçisi {timeout:g} saniyede başlamadı.")
+        try:
+            message = self.conn.recv()
+        except EOFError:
+            self.kill()
+            raise PluginWorkerError(f"Eklenti işçisi başlarken sonlandı (çıkış kodu {self.process.exitcode}).") from None
+        if message[0] != "ready":
+            self.kill()
+            raise PluginWorkerError(f"Eklenti işçisi başlatılamadı: {message[1]}")
+        return message[1]
+
+    def stop(self, timeout: float = 5.0) -> None:
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.process.join(timeout)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class PluginWorkerPool:
+    """Pre-started worker processes that run custom plugins with time and memory limits.
+
+    Workers are started in the constructor and reused across calls; `run` is
+    thread-safe and waits for an idle worker. A worker that times out, runs
+    out of memory or dies is replaced before `run` raises. Call `close` (or
+    use the pool as a context manager) to stop the workers.
+    """
+
+    def __init__(
+        self,
+        custom_path: Union[None, str, Path] = None,
+        *,
+        size: int = 2,
+        timeout: Optional[float] = None,
+        memory_limit: Union[None, int, str] = None,
+        start_timeout: float = START_TIMEOUT,
+    ) -> None:
+        self.custom_path = Path(custom_path or Path(__file__).parent / "custom")
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.memory_limit = parse_memory_size(memory_limit)
+        self.start_timeout = start_timeout
+        self.plugins: List[str] = []
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        try:
+            # start all workers first so they warm up in parallel
+            self._workers = [_Worker(self._context, self.custom_path) for _ in range(self.size)]
+            for worker in self._workers:
+                self.plugins = worker.wait_ready(start_timeout)
+                self._idle.put(worker)
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def pids(self) -> List[int]:
+        """Process IDs of the current workers."""
+        return [worker.process.pid for worker in self._workers]
+
+    def run(
+        self,
+        key: str,
+        frame: pd.DataFrame,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+        memory_limit: Union[None, int, str] = None,
+    ) -> pd.DataFrame:
+        """Run plugin ``key`` on ``frame`` in a worker and return its result.
+
+        ``timeout`` (seconds) and ``memory_limit`` (bytes or e.g. ``"2GB"``)
+        override the pool defaults for this call.
+        """
+        if self._closed:
+            raise PluginWorkerError("Eklenti havuzu kapatıldı.")
+        timeout = self.timeout if timeout is None else timeout
+        limit = self.memory_limit if memory_limit is None else parse_memory_size(memory_limit)
+        if limit and resource is None:
+            logger.warning("Bu platformda bellek sınırı desteklenmiyor; '%s' sınırsız çalışıyor.", key)
+            limit = None
+
+        block, sizes = _write_shared(frame)
+        try:
+            worker = self._acquire()
+        except Exception:
+            block.close()
+            block.unlink()
+            raise
+        replace = False
+        try:
+            try:
+                worker.conn.send((key, block.name, sizes, dict(params or {}), limit))
+                if not worker.conn.poll(timeout):
+                    replace = True
+                    raise PluginTimeoutError(f"Eklenti '{key}' {timeout:g} saniyede tamamlanmadı; işçi süreci durduruldu.")
+                reply = worker.conn.recv()
+            except (EOFError, OSError):
+                replace = True
+                raise PluginWorkerError(
+                    f"Eklenti '{key}' çalışırken işçi süreci sonlandı (çıkış kodu {worker.process.exitcode})."
+                ) from None
+            status = reply[0]
+            if status == "memory":
+                replace = True
+                logger.debug(reply[1])
+                raise PluginMemoryError(f"Eklenti '{key}' bellek sınırını aştı ({format_bytes(limit)}).")
+            if status == "error":
+                logger.debug(reply[2])
+                raise PluginWorkerError(reply[1])
+            try:
+                result, audit = _read_shared(reply[1], reply[2])
+            finally:
+                worker.conn.send("release")
+        finally:
+            block.close()
+            block.unlink()
+            self._release(worker, replace)
+        audit.replay()
+        return result
+
+    def _acquire(self) -> _Worker:
+        while True:
+            if self._closed:
+                raise PluginWorkerError("Eklenti havuzu kapatıldı.")
+            if not self._workers:
+                raise PluginWorkerError("Eklenti havuzunda çalışan işçi kalmadı.")
+            try:
+                return self._idle.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+    def _release(self, worker: _Worker, replace: bool) -> None:
+        if replace:
+            worker.kill()
+            with self._lock:
+                if self._closed:
+                    return
+                fresh = _Worker(self._context, self.custom_path)
+                self._workers[self._workers.index(worker)] = fresh
+            try:
+                fresh.wait_ready(self.start_timeout)
+            except PluginWorkerError as exc:
+                logger.error("Eklenti işçisi yeniden başlatılamadı: %s", exc)
+                with self._lock:
+                    if fresh in self._workers:
+                        self._workers.remove(fresh)
+                return
+            worker = fresh
+        if not self._closed:
+            self._idle.put(worker)
+
+    def close(self) -> None:
+        """Stop all workers; calls still running fail with `PluginWorkerError`."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> "PluginWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = [
+    "PluginMemoryError",
+    "PluginTimeoutError",
+    "PluginWorkerError",
+    "PluginWorkerPool",
+]
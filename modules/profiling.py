@@ -0,0 +1,221 @@
+"""Single-pass data-quality profiles built from mergeable sketches.
+
+`DataProfiler` reads a frame (or a chunk stream) once and keeps, per column,
+the row/null counts, a `HyperLogLog` for distinct values, a `QuantileSketch`
+and `RunningMoments` for numbers, a `SpaceSaving` counter for top values,
+min/max and how many cells have each value type. Profilers of different
+chunks can be merged, so memory depends on the sketch sizes rather than on
+the number of rows.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from modules.sketches import HyperLogLog, QuantileSketch, RunningMoments, SpaceSaving
+
+TYPES = ("number", "numeric_text", "text", "bool", "datetime", "other")
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+def _kind(value) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return "bool"
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return "number"
+    if isinstance(value, (datetime.date, np.datetime64)):
+        return "datetime"
+    if isinstance(value, str):
+        return "text"
+    return "other"
+
+
+def _plain(value):
+    """JSON-friendly Python value for a scalar from a frame."""
+    if value is None:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (pd.Timestamp, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _better(current, candidate, pick):
+    if candidate is None:
+        return current
+    if current is None:
+        return candidate
+    try:
+        return pick(current, candidate)
+    except TypeError:  # e.g. a number column that later received text
+        return current
+
+
+class ColumnProfile:
+    """Mergeable statistics of one column."""
+
+    def __init__(self, *, top_k: int = 5, sketch_size: int = 1024, precision: int = 12) -> None:
+        self.top_k = top_k
+        self.rows = 0
+        self.nulls = 0
+        self.types: Dict[str, int] = {}
+        self.minimum = None
+        self.maximum = None
+        self.distinct = HyperLogLog(precision)
+        self.moments = RunningMoments()
+        self.quantiles = QuantileSketch(sketch_size)
+        self.top = SpaceSaving(max(sketch_size, top_k))
+
+    def _count_type(self, kind: str, count: int) -> None:
+        if count:
+            self.types[kind] = self.types.get(kind, 0) + int(count)
+
+    def _extend_range(self, low, high) -> None:
+        self.minimum = _better(self.minimum, low, min)
+        self.maximum = _better(self.maximum, high, max)
+
+    def update(self, series: pd.Series) -> "ColumnProfile":
+        self.rows += len(series)
+        values = series.dropna()
+        self.nulls += len(series) - len(values)
+        if values.empty:
+            return self
+
+        dtype = values.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            self._count_type("bool", len(values))
+        elif pd.api.types.is_numeric_dtype(dtype):
+            self._count_type("number", len(values))
+            self.moments.update(values)
+            self.quantiles.update(values)
+            self._extend_range(values.min(), values.max())
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            self._count_type("datetime", len(values))
+            self._extend_range(values.min(), values.max())
+        else:
+            self._update_objects(values)
+            return self
+
+        counts = values.value_counts(sort=False)
+        self.top.update_counts(counts.index, counts.to_numpy())
+        self.distinct.update(counts.index.to_numpy())
+        return self
+
+    def _update_objects(self, values: pd.Series) -> None:
+        # classify distinct values only; counts come from the factorized codes
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+        counts = np.bincount(codes, minlength=len(uniques))
+        self.top.update_counts(uniques, counts)
+        self.distinct.update(uniques)
+        kinds = np.array([_kind(value) for value in uniques], dtype=object)
+        texts = kinds == "text"
+        if texts.any():
+            numeric = pd.to_numeric(uniques[texts].str.strip(), errors="coerce")
+            kinds[np.flatnonzero(texts)[numeric.notna().to_numpy()]] = "numeric_text"
+            strings = uniques[texts].tolist()
+            self._extend_range(min(strings), max(strings))
+        for kind in TYPES:
+            self._count_type(kind, counts[kinds == kind].sum())
+        numbers = kinds == "number"
+        if numbers.any():
+            # weight each distinct number by its row count
+            repeated = np.repeat(uniques[numbers].to_numpy(dtype="float64"), counts[numbers])
+            self.moments.update(repeated)
+            self.quantiles.update(repeated)
+
+    def merge(self, other: "ColumnProfile") -> "ColumnProfile":
+        self.rows += other.rows
+        self.nulls += other.nulls
+        for kind, count in other.types.items():
+            self._count_type(kind, count)
+        self._extend_range(other.minimum, other.maximum)
+        self.distinct.merge(other.distinct)
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+        self.top.merge(other.top)
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        present = self.rows - self.nulls
+        dominant = max(self.types, key=self.types.get) if self.types else None
+        numeric = self.types.get("number", 0) + self.types.get("numeric_text", 0)
+        profile: Dict[str, Any] = {
+            "rows": self.rows,
+            "nulls": self.nulls,
+            "null_ratio": self.nulls / self.rows if self.rows else 0.0,
+            "distinct": self.distinct.count(),
+            "distinct_exact": self.distinct.exact,
+            "min": _plain(self.minimum),
+            "max": _plain(self.maximum),
+            "top_values": [[_plain(value), count] for value, count in self.top.most_common(self.top_k)],
+            "types": dict(self.types),
+            "dominant_type": dominant,
+            "type_conformance": self.types[dominant] / present if dominant else None,
+            "numeric_ratio": numeric / present if present else None,
+        }
+        if self.moments.count:
+            profile["mean"] = _plain(self.moments.mean)
+            profile["std"] = _plain(math.sqrt(self.moments.variance)) if self.moments.count > 1 else None
+            profile["quantiles"] = {str(q): _plain(self.quantiles.quantile(q)) for q in QUANTILES}
+        return profile
+
+
+class DataProfiler:
+    """Profile a frame chunk by chunk: ``update`` per chunk, ``merge`` partials, ``result`` once."""
+
+    def __init__(self, *, top_k: int = 5, sketch_size: int = 1024, precision: int = 12) -> None:
+        self.options = {"top_k": top_k, "sketch_size": sketch_size, "precision": precision}
+        self.rows = 0
+        self.columns: Dict[str, ColumnProfile] = {}
+
+    def _column(self, name: str) -> ColumnProfile:
+        if name not in self.columns:
+            self.columns[name] = ColumnProfile(**self.options)
+        return self.columns[name]
+
+    def update(self, chunk: pd.DataFrame) -> "DataProfiler":
+        self.rows += len(chunk)
+        for position, column in enumerate(chunk.columns):
+            self._column(str(column)).update(chunk.iloc[:, position])
+        return self
+
+    def merge(self, other: "DataProfiler") -> "DataProfiler":
+        self.rows += other.rows
+        for name, column in other.columns.items():
+            self._column(name).merge(column)
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "columns": {name: column.result() for name, column in self.columns.items()},
+        }
+
+
+def profile_chunks(chunks: Iterable[pd.DataFrame], **options) -> Dict[str, Any]:
+    """Profile a chunk stream in one pass (see `DataProfiler`)."""
+    profiler = DataProfiler(**options)
+    for chunk in chunks:
+        profiler.update(chunk)
+    return profiler.result()
+
+
+def profile_frame(df: pd.DataFrame, *, chunk_size: Optional[int] = None, **options) -> Dict[str, Any]:
+    """Profile ``df``, optionally in row slices of ``chunk_size`` to bound the working memory."""
+    if not chunk_size or len(df) <= chunk_size:
+        return profile_chunks([df], **options)
+    return profile_chunks((df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)), **options)
+
+
+__all__ = ["ColumnProfile", "DataProfiler", "profile_chunks", "profile_frame"]
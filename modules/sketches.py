@@ -0,0 +1,286 @@
+"""Mergeable streaming aggregates used to compute statistics over chunks.
+
+Every sketch has ``update(values)`` for one batch and ``merge(other)`` to
+combine partial results, so statistics over a file larger than memory can be
+built chunk by chunk (or in parallel) and still answer the same question.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_array
+
+
+def _numeric(values) -> np.ndarray:
+    array = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return array[~np.isnan(array)]
+
+
+class RunningMoments:
+    """Count, mean and variance with Chan et al.'s pairwise merge."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, values) -> "RunningMoments":
+        array = _numeric(values)
+        if len(array):
+            mean = float(array.mean())
+            self._combine(len(array), mean, float(((array - mean) ** 2).sum()))
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        if other.count:
+            self._combine(other.count, other._mean, other._m2)
+        return self
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else float("nan")
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else float("nan")
+
+
+class QuantileSketch:
+    """KLL-style quantile sketch with ``k`` items per level.
+
+    When a level overflows it is sorted and every other item (random offset)
+    is promoted to the next level with twice the weight, so memory stays at
+    roughly ``k * log2(n / k)`` values. Until the first compaction the sketch
+    holds every value and answers exactly (with linear interpolation, like
+    ``Series.quantile``).
+    """
+
+    def __init__(self, k: int = 1024, seed: Optional[int] = 0) -> None:
+        self.k = max(2, int(k))
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0, dtype="float64")]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values) -> "QuantileSketch":
+        array = _numeric(values)
+        if len(array):
+            self.count += len(array)
+            self.levels[0] = np.concatenate([self.levels[0], array])
+            self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0, dtype="float64"))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                leftover = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[: len(items) - len(leftover)]
+                promoted = paired[int(self._rng.integers(2))::2]
+                self.levels[level] = leftover
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype="float64"))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    @property
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return float("nan")
+        if self.exact:
+            return float(np.quantile(self.levels[0], q))
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return float(values[order][min(position, len(values) - 1)])
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+
+class SpaceSaving:
+    """Heavy-hitter counter (Metwally et al.) keeping at most ``capacity`` keys.
+
+    Counts are exact while fewer than ``capacity`` distinct values were seen;
+    after that each count overestimates by at most ``errors[value]``.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.capacity = max(1, int(capacity))
+        self.counts: Dict[Any, int] = {}
+        self.errors: Dict[Any, int] = {}
+
+    def update(self, values) -> "SpaceSaving":
+        counts = pd.Series(values).value_counts(dropna=True, sort=False)
+        return self.update_counts(counts.index, counts.to_numpy())
+
+    def update_counts(self, values, counts) -> "SpaceSaving":
+        """Add already counted distinct ``values`` (one count per value)."""
+        values = values if isinstance(values, pd.Index) else pd.Index(values, dtype=object)
+        counts = np.asarray(counts, dtype=np.int64)
+        if len(counts) > self.capacity:
+            # new values compete on their batch count alone, so only the
+            # `capacity` largest of them (or values already tracked) can survive
+            keep = np.zeros(len(counts), dtype=bool)
+            keep[np.argpartition(-counts, self.capacity - 1)[: self.capacity]] = True
+            if self.counts:
+                keep |= values.isin(pd.Index(list(self.counts), dtype=object))
+            values, counts = values[keep], counts[keep]
+        self._combine(dict(zip(values.tolist(), counts.tolist())), {}, 0)
+        return self
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        self._combine(other.counts, other.errors, other._floor())
+        return self
+
+    def _floor(self) -> int:
+        # a value missing from a full summary occurred at most this often
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def _combine(self, counts: Dict[Any, int], errors: Dict[Any, int], other_floor: int) -> None:
+        """Merge another summary (Cafaro et al.) and keep the ``capacity`` largest counts.
+
+        A value missing from one side is charged that side's floor, in the
+        count and in the error bound. While everything fits nothing is
+        charged, so the counts stay exact.
+        """
+        if len(self.counts) + len(counts) <= self.capacity:
+            floor = other_floor = 0
+        else:
+            floor = self._floor()
+        merged: Dict[Any, int] = {}
+        merged_errors: Dict[Any, int] = {}
+        for value, count in self.counts.items():
+            merged[value] = count + counts.get(value, other_floor)
+            merged_errors[value] = self.errors[value] + errors.get(value, other_floor)
+        for value, count in counts.items():
+            if value not in merged:
+                merged[value] = floor + count
+                merged_errors[value] = floor + errors.get(value, 0)
+        if len(merged) > self.capacity:
+            merged = dict(heapq.nlargest(self.capacity, merged.items(), key=lambda item: item[1]))
+            merged_errors = {value: merged_errors[value] for value in merged}
+        self.counts, self.errors = merged, merged_errors
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def mode(self):
+        """Most frequent value; ties resolve to the smallest, like ``Series.mode``."""
+        if not self.counts:
+            return None
+        top = max(self.counts.values())
+        tied = [value for value, count in self.counts.items() if count == top]
+        try:
+            return sorted(tied)[0]
+        except TypeError:
+            return tied[0]
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Exact ``int.bit_length`` for a uint64 array."""
+    values = values.copy()
+    length = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >= np.uint64(1 << shift)
+        length += high * shift
+        values = np.where(high, values >> np.uint64(shift), values)
+    return length + (values > 0)
+
+
+class HyperLogLog:
+    """Distinct-value counter with ``2 ** precision`` registers (Flajolet et al.).
+
+    Values are hashed to 64 bits; the first ``precision`` bits pick a
+    register that keeps the longest run of leading zeros seen in the rest.
+    Like HLL++, the sketch stays sparse (the set of distinct hashes, so the
+    count is exact) until it holds as many hashes as it has registers. The
+    relative error afterwards is about ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        self.precision = min(max(int(precision), 4), 18)
+        self.registers: Optional[np.ndarray] = None
+        self._hashes = np.empty(0, dtype=np.uint64)
+
+    @property
+    def exact(self) -> bool:
+        return self.registers is None
+
+    def update(self, values) -> "HyperLogLog":
+        array = pd.Series(values).dropna().to_numpy()
+        if len(array):
+            if array.dtype.kind not in "biufcmM":
+                array = array.astype(object)
+            self._add_hashes(hash_array(array))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("HyperLogLog hassasiyetleri farklı")
+        if other.registers is None:
+            self._add_hashes(other._hashes)
+        else:
+            self._densify()
+            np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def _add_hashes(self, hashes: np.ndarray) -> None:
+        if self.registers is None:
+            self._hashes = pd.unique(np.concatenate([self._hashes, hashes]))
+            if len(self._hashes) > (1 << self.precision):
+                self._densify()
+            return
+        rest_bits = 64 - self.precision
+        index = (hashes >> np.uint64(rest_bits)).astype(np.int64)
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+        rank = (rest_bits - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def _densify(self) -> None:
+        if self.registers is None:
+            self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+            hashes, self._hashes = self._hashes, np.empty(0, dtype=np.uint64)
+            self._add_hashes(hashes)
+
+    def count(self) -> int:
+        if self.registers is None:
+            return int(len(self._hashes))
+        m = float(len(self.registers))
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        estimate = alpha * m * m / float(np.sum(np.exp2(-self.registers.astype(np.float64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # linear counting is more accurate while many registers are empty
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+__all__ = ["HyperLogLog", "RunningMoments", "QuantileSketch", "SpaceSaving"]
@@ -4,9 +4,12 @@ from time import perf_counter
 
 import pandas as pd
 from pathlib import Path
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Tuple, Union
 
-from modules.data_loader import DataLoader
+from modules.checkpoint import CheckpointStore, input_fingerprint
+from modules.data_loader import ARROW_AVAILABLE, DataLoader
+from modules.incremental import IncrementalStateStore, SourceState, head_digest
+from modules.memory_budget import ExecutionPlan, MemoryBudget, format_bytes
 from modules.pipeline_manager import PipelineManager
 from modules.save_output import save_csv, save_excel
 from .ui_state import UIState
@@ -23,19 +26,24 @@ class PipelineRunner:
     - Module selection
     - Pipeline execution
     - Output saving
+    - Memory budget checks (chunked execution for oversized files)
+    - Incremental runs over append-only CSV sources
     - Error handling and logging
     """
     
-    def __init__(self, logger: Optional[GuiLogger] = None):
+    def __init__(self, logger: Optional[GuiLogger] = None, memory_budget: Union[None, int, str] = None):
         """
         Initialize PipelineRunner.
         
         Args:
             logger: Optional GuiLogger for callbacks (if None, uses default logging)
+            memory_budget: Optional default budget (bytes or e.g. "2GB"); `UIState.memory_budget` overrides it
         """
         self.data_loader = DataLoader()
-        self.pipeline_manager = PipelineManager()
+        self.pipeline_manager = PipelineManager(memory_budget=memory_budget)
+        self.memory_budget = MemoryBudget.from_value(memory_budget)
         self.logger = logger or GuiLogger()
+        self.last_run_id: Optional[str] = None
     
     def run_file(
         self,
@@ -64,18 +72,70 @@ class PipelineRunner:
                 return False
 
             self._update_progress(progress_callback, 0.0)
-            self.logger.step("Dosya okunuyor...")
+            self._configure_string_backend(state)
+            self.pipeline_manager.audit_dir = state.audit_dir
+            self.pipeline_manager.audit_path = None
+            # the run's budget drives both the runner's plan and in-memory batching
+            self.pipeline_manager.memory_budget = (
+                MemoryBudget.from_value(state.memory_budget) if state.memory_budget else self.memory_budget
+            )
+            self.pipeline_manager.plugin_workers = max(0, int(state.plugin_workers or 0))
+            self.pipeline_manager.plugin_timeout = state.plugin_timeout
+            self.pipeline_manager.plugin_memory_limit = state.plugin_memory_limit
 
-            try:
-                dataframe = self.data_loader.load(state.file_path)
-            except Exception as exc:
-                self.logger.error(f"Dosya okunamadı: {exc}")
-                return False
+            selected_modules = state.get_all_selected_modules()
+            if state.incremental:
+                if Path(state.file_path).suffix.lower() == ".csv":
+                    return self._run_incremental(state, selected_modules, progress_callback, start_time)
+                self.logger.warning("Artımlı mod yalnızca CSV dosyalarında desteklenir; tüm dosya işleniyor.")
+
+            plan = self._plan_execution(state, selected_modules)
+            if plan is not None and plan.chunked:
+                if state.checkpoint or state.run_id:
+                    self.logger.warning("Parçalı modda checkpoint desteklenmiyor; checkpoint atlandı.")
+                try:
+                    initial_rows, final_rows, output_path = self._run_chunked(
+                        state, selected_modules, plan, progress_callback
+                    )
+                except Exception as exc:
+                    self.logger.error(f"Parçalı işlem hatası: {exc}")
+                    return False
+                self.logger.success(f"Kayıt Başarılı: {output_path}")
+                self._log_summary(perf_counter() - start_time, initial_rows, final_rows)
+                self._update_progress(progress_callback, 1.0)
+                self.logger.success("İŞLEM BAŞARIYLA TAMAMLANDI.")
+                return True
+
+            checkpoint = self._open_checkpoint(state, selected_modules)
+            resume_from = 0
+            if checkpoint is not None:
+                self.pipeline_manager.selected_modules_list = selected_modules
+                if checkpoint.matches(input_fingerprint(state.file_path, selected_modules)):
+                    resume_from = self.pipeline_manager.resume_point(checkpoint)
+                if resume_from and not checkpoint.has_frame():
+                    # e.g. deleted, or the run failed before the first save
+                    self.logger.warning("Checkpoint verisi bulunamadı; dosya yeniden okunuyor.")
+                    resume_from = 0
 
-            self.logger.success(f"Dosya yüklendi (Satır: {len(dataframe)})")
+            if resume_from:
+                initial_rows = int(checkpoint.manifest().get("input_rows", 0))
+                dataframe = pd.DataFrame()
+                self.logger.step(f"Checkpoint'ten devam ediliyor ({resume_from} adım tamamlanmış); dosya okuma atlandı.")
+            else:
+                self.logger.step("Dosya okunuyor...")
+
+                try:
+                    dataframe = self.data_loader.load(state.file_path)
+                except Exception as exc:
+                    self.logger.error(f"Dosya okunamadı: {exc}")
+                    return False
+
+                initial_rows = len(dataframe)
+                self.logger.success(f"Dosya yüklendi (Satır: {initial_rows})")
+                if checkpoint is not None:
+                    checkpoint.begin(input_fingerprint(state.file_path, selected_modules), initial_rows)
             self._update_progress(progress_callback, 0.2)
 
-            selected_modules = state.get_all_selected_modules()
             self.logger.step(
                 f"Pipeline Hazırlanıyor... (Seçili modül sayısı: {len(selected_modules)})"
             )
@@ -86,14 +146,22 @@ class PipelineRunner:
             else:
                 self.logger.step(f"Seçilen modüller: {selected_modules}")
                 try:
-                    cleaned_dataframe = self._execute_pipeline(dataframe, selected_modules)
+                    cleaned_dataframe = self._execute_pipeline(dataframe, selected_modules, checkpoint=checkpoint)
                 except Exception as exc:
                     self.logger.error(f"Pipeline hatası: {exc}")
+                    if checkpoint is not None:
+                        self.logger.warning(f"Kaldığı yerden devam etmek için run ID: {checkpoint.run_id}")
                     return False
 
                 self.logger.success(
-                    f"Pipeline tamamlandı ({len(dataframe)} → {len(cleaned_dataframe)} satır)"
+                    f"Pipeline tamamlandı ({initial_rows} → {len(cleaned_dataframe)} satır)"
                 )
+                dtype_report = cleaned_dataframe.attrs.get("optimize_dtypes")
+                if dtype_report:
+                    self.logger.info(
+                        f"Bellek optimizasyonu: {format_bytes(dtype_report['bytes_before'])} → "
+                        f"{format_bytes(dtype_report['bytes_after'])} ({len(dtype_report['columns'])} sütun)"
+                    )
 
             self._update_progress(progress_callback, 0.7)
 
@@ -107,19 +175,10 @@ class PipelineRunner:
 
             self._update_progress(progress_callback, 0.9)
 
-            duration = perf_counter() - start_time
-            initial_rows = len(dataframe)
-            final_rows = len(cleaned_dataframe)
-            deleted_rows = initial_rows - final_rows
-
-            self.logger.section("TEMİZLİK ÖZETİ")
-            self.logger.info(f"• Süre: {duration:.2f} sn")
-            self.logger.info(f"• Başlangıç: {initial_rows} Satır")
-            self.logger.info(f"• Bitiş: {final_rows} Satır")
-            if deleted_rows > 0:
-                self.logger.warning(f"• Silinen satır: {deleted_rows}")
-            else:
-                self.logger.success("• Silinen satır: 0")
+            if checkpoint is not None:
+                checkpoint.clear()
+
+            self._log_summary(perf_counter() - start_time, initial_rows, len(cleaned_dataframe))
 
             self._update_progress(progress_callback, 1.0)
             self.logger.success("İŞLEM BAŞARIYLA TAMAMLANDI.")
@@ -129,19 +188,240 @@ class PipelineRunner:
             self.logger.error(f"Beklenmeyen hata: {exc}")
             return False
     
-    def _execute_pipeline(self, dataframe: pd.DataFrame, selected_modules: List[str]) -> pd.DataFrame:
+    def _configure_string_backend(self, state: UIState) -> None:
+        backend = state.string_backend or "python"
+        if backend == "arrow" and not ARROW_AVAILABLE:
+            self.logger.warning("pyarrow kurulu değil; metin sütunları object olarak tutulacak.")
+            backend = "python"
+        elif backend == "arrow":
+            self.logger.info("Metin sütunları Arrow (string[pyarrow]) olarak tutuluyor.")
+        self.data_loader.config.string_backend = backend
+        self.pipeline_manager.string_backend = backend
+
+    def _log_summary(self, duration: float, initial_rows: int, final_rows: int) -> None:
+        deleted_rows = initial_rows - final_rows
+
+        self.logger.section("TEMİZLİK ÖZETİ")
+        self.logger.info(f"• Süre: {duration:.2f} sn")
+        self.logger.info(f"• Başlangıç: {initial_rows} Satır")
+        self.logger.info(f"• Bitiş: {final_rows} Satır")
+        if deleted_rows > 0:
+            self.logger.warning(f"• Silinen satır: {deleted_rows}")
+        else:
+            self.logger.success("• Silinen satır: 0")
+        audit_path = self.pipeline_manager.audit_path
+        if audit_path is not None and audit_path.exists():
+            self.logger.info(f"• Denetim kaydı: {audit_path}")
+
+    def _plan_execution(self, state: UIState, selected_modules: List[str]) -> Optional[ExecutionPlan]:
+        """
+        Probe the input file and compare the predicted peak against the memory budget.
+        
+        Returns:
+            ExecutionPlan, or None when no budget is configured or probing fails
+        """
+        budget = self.pipeline_manager.memory_budget
+        if not budget.enabled or not selected_modules:
+            return None
+        try:
+            probe = self.data_loader.probe(state.file_path)
+        except Exception as exc:
+            self.logger.warning(f"Dosya boyutu tahmin edilemedi, bellek kontrolü atlandı: {exc}")
+            return None
+
+        plan = budget.plan(probe.estimated_memory, probe.estimated_rows, len(selected_modules))
+        self.logger.info(
+            f"Tahmini boyut: ~{probe.estimated_rows} satır, {format_bytes(probe.estimated_memory)} "
+            f"(tepe: {format_bytes(plan.estimated_peak_bytes)}, bütçe: {format_bytes(plan.budget_bytes)})"
+        )
+        if plan.chunked and probe.path.suffix.lower() != ".csv":
+            self.logger.warning("Bütçe aşılıyor ancak yalnızca CSV dosyaları parçalı işlenebilir; bellekte çalıştırılıyor.")
+            plan.mode = "memory"
+        return plan
+
+    def _run_chunked(
+        self,
+        state: UIState,
+        selected_modules: List[str],
+        plan: ExecutionPlan,
+        progress_callback: Optional[Callable[[float], None]],
+    ) -> Tuple[int, int, Path]:
+        """
+        Stream the file through the pipeline chunk by chunk, spilling each cleaned
+        chunk straight to the output file so only one chunk is held in memory.
+        
+        Returns:
+            Tuple of (initial_rows, final_rows, output_path)
+        """
+        self.logger.warning(
+            f"Bellek bütçesi aşılacak; dosya {plan.chunksize} satırlık parçalarla işleniyor."
+        )
+        output_path = GuiIO.get_full_output_path(state.file_path, state.output_dir, state.output_type)
+        self.pipeline_manager.selected_modules_list = selected_modules
+        descriptors = self.pipeline_manager.selected_descriptors()
+
+        counts = {"in": 0}
+
+        def _counted(chunks):
+            for chunk in chunks:
+                counts["in"] += len(chunk)
+                yield chunk
+
+        chunks = _counted(self.data_loader.iter_chunks(state.file_path, plan.chunksize))
+        cleaned_chunks = self.pipeline_manager.run_pipeline_chunked(chunks, descriptors=descriptors)
+
+        final_rows = 0
+        is_excel = state.output_type.lower() in ["xlsx", "excel"]
+        if is_excel:
+            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+                for index, chunk in enumerate(cleaned_chunks):
+                    chunk.to_excel(writer, index=False, header=index == 0, startrow=0 if index == 0 else final_rows + 1)
+                    final_rows += len(chunk)
+                    self.logger.step(f"Parça {index + 1} yazıldı ({final_rows} satır)")
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with output_path.open("w", encoding="utf-8-sig", newline="") as handle:
+                for index, chunk in enumerate(cleaned_chunks):
+                    chunk.to_csv(handle, index=False, header=index == 0)
+                    final_rows += len(chunk)
+                    self.logger.step(f"Parça {index + 1} yazıldı ({final_rows} satır)")
+
+        self._update_progress(progress_callback, 0.9)
+        return counts["in"], final_rows, output_path
+
+    def _run_incremental(
+        self,
+        state: UIState,
+        selected_modules: List[str],
+        progress_callback: Optional[Callable[[float], None]],
+        start_time: float,
+    ) -> bool:
+        """
+        Process only rows appended since the previous incremental run and append
+        them to the existing output.
+        
+        Falls back to a full run (and resets the stored state) when the source
+        was rewritten or truncated, the module selection changed or the output
+        is missing.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        output_path = GuiIO.get_full_output_path(state.file_path, state.output_dir, state.output_type)
+        store = IncrementalStateStore.for_output(output_path)
+        source = str(Path(state.file_path).resolve())
+        previous = store.load(source)
+
+        if previous is not None and store.is_continuation(previous, selected_modules, output_path):
+            source_state = previous
+            self.logger.info(
+                f"Artımlı mod: {source_state.rows_processed} satır daha önce işlenmiş; yalnızca yeni satırlar okunuyor."
+            )
+        else:
+            if previous is not None:
+                self.logger.warning("Kaynak dosya, modül seçimi veya çıktı değişmiş; artımlı durum sıfırlanıyor.")
+            encoding, delimiter = self.data_loader.detect_encoding_and_delimiter(Path(source))
+            if encoding.lower() == "ascii":
+                # later tails may carry non-ASCII text the leading sample did not show
+                encoding = "utf-8"
+            source_state = SourceState(source=source, encoding=encoding, delimiter=delimiter, modules=list(selected_modules))
+
+        self.logger.step("Yeni satırlar okunuyor...")
+        try:
+            dataframe, end_offset = self.data_loader.load_tail(
+                source,
+                source_state.byte_offset,
+                encoding=source_state.encoding or "utf-8",
+                delimiter=source_state.delimiter or ",",
+            )
+        except Exception as exc:
+            self.logger.error(f"Dosya okunamadı: {exc}")
+            return False
+
+        appending = source_state.byte_offset > 0
+        if appending and dataframe.empty:
+            self.logger.success("Yeni satır yok; çıktı güncel.")
+            self._update_progress(progress_callback, 1.0)
+            return True
+        self.logger.success(f"Yeni satırlar yüklendi (Satır: {len(dataframe)})")
+        self._update_progress(progress_callback, 0.2)
+
+        cleaned_dataframe = dataframe
+        if selected_modules:
+            self.pipeline_manager.selected_modules_list = selected_modules
+            try:
+                cleaned_dataframe = self.pipeline_manager.run_pipeline_incremental(dataframe, source_state.step_states)
+            except Exception as exc:
+                self.logger.error(f"Pipeline hatası: {exc}")
+                return False
+        self._update_progress(progress_callback, 0.7)
+
+        self.logger.step("Sonuçlar kaydediliyor...")
+        try:
+            if appending:
+                self._append_output(state, output_path, cleaned_dataframe)
+            else:
+                output_path = self._save_output(state, cleaned_dataframe)
+            self.logger.success(f"Kayıt Başarılı: {output_path}")
+        except Exception as exc:
+            self.logger.error(f"Çıktı kaydedilemedi: {exc}")
+            return False
+
+        # state is persisted only after the output is written, so a failed run is retried in full
+        source_state.byte_offset = end_offset
+        source_state.rows_processed += len(dataframe)
+        source_state.head_digest = head_digest(Path(source), end_offset)
+        source_state.output_path = str(output_path)
+        store.save(source_state)
+
+        self._log_summary(perf_counter() - start_time, len(dataframe), len(cleaned_dataframe))
+        self._update_progress(progress_callback, 1.0)
+        self.logger.success("İŞLEM BAŞARIYLA TAMAMLANDI.")
+        return True
+
+    def _append_output(self, state: UIState, output_path: Path, dataframe: pd.DataFrame) -> None:
+        """Append cleaned rows to an existing output (CSV is appended, Excel is rewritten)."""
+        if state.output_type.lower() in ["xlsx", "excel"]:
+            existing = pd.read_excel(output_path)
+            save_excel(pd.concat([existing, dataframe], ignore_index=True), output_path)
+            return
+        with output_path.open("a", encoding="utf-8", newline="") as handle:
+            dataframe.to_csv(handle, index=False, header=False)
+
+    def _open_checkpoint(self, state: UIState, selected_modules: List[str]) -> Optional[CheckpointStore]:
+        """
+        Create the checkpoint store for this run when checkpoints are requested.
+        
+        Returns:
+            CheckpointStore, or None if checkpoints are disabled or nothing is selected
+        """
+        if not (state.checkpoint or state.run_id) or not selected_modules:
+            return None
+        checkpoint = CheckpointStore(run_id=state.run_id)
+        state.run_id = checkpoint.run_id
+        self.last_run_id = checkpoint.run_id
+        self.logger.info(f"Checkpoint run ID: {checkpoint.run_id}")
+        return checkpoint
+
+    def _execute_pipeline(
+        self,
+        dataframe: pd.DataFrame,
+        selected_modules: List[str],
+        checkpoint: Optional[CheckpointStore] = None,
+    ) -> pd.DataFrame:
         """
         Execute the pipeline with selected modules.
         
         Args:
             dataframe: Input dataframe
             selected_modules: List of selected module keys
+            checkpoint: Optional checkpoint store used to save/resume steps
             
         Returns:
             Cleaned dataframe
         """
         self.pipeline_manager.selected_modules_list = selected_modules
-        return self.pipeline_manager.run_pipeline(dataframe)
+        return self.pipeline_manager.run_pipeline(dataframe, checkpoint=checkpoint)
     
     def _save_output(self, state: UIState, dataframe: pd.DataFrame) -> Path:
         """
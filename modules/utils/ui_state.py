@@ -22,6 +22,33 @@ class UIState:
     
     file_path: Optional[str] = None
     """Input file path (CSV/XLSX)."""
+
+    memory_budget: Optional[str] = None
+    """Optional memory budget (e.g. '2GB'). Large files switch to chunked execution."""
+
+    checkpoint: bool = False
+    """Save a checkpoint after every completed step so a failed run can resume."""
+
+    run_id: Optional[str] = None
+    """Checkpoint run ID; set it to an earlier run's ID to resume that run."""
+
+    incremental: bool = False
+    """Process only rows appended to a CSV source since the last incremental run and append them to the output."""
+
+    string_backend: str = "python"
+    """Text column storage: 'python' (object) or 'arrow' (string[pyarrow], needs pyarrow)."""
+
+    audit_dir: Optional[str] = None
+    """Directory for per-run audit files of rejected rows; None keeps the legacy deleted_records_log.csv."""
+
+    plugin_workers: int = 0
+    """Run custom plugins in this many isolated worker processes; 0 runs them in-process."""
+
+    plugin_timeout: Optional[float] = None
+    """Seconds an isolated plugin call may take before its worker is stopped (None: no limit)."""
+
+    plugin_memory_limit: Optional[str] = None
+    """Memory an isolated plugin call may allocate (e.g. '2GB'; POSIX only)."""
     
     def get_all_selected_modules(self) -> List[str]:
         """Return all selected module keys (core + custom)."""
@@ -82,6 +82,80 @@ class TestPipeline:
         assert result_data["name"] == ["John", "Jane"]  # Trim edilmiş olmalı
         assert "trim_spaces" in data["modules_executed"]
     
+    def test_pipeline_estimate(self):
+        """POST /v1/pipeline/estimate endpoint'ini test et."""
+        csv_content = b"name,age\n  John  ,25\n  Jane  ,30\n  John  ,25"
+        upload_response = client.post(
+            "/v1/upload/csv",
+            files={"file": ("test_estimate.csv", csv_content, "text/csv")},
+            headers=get_headers_with_key()
+        )
+        assert upload_response.status_code == 200
+        upload_id = upload_response.json()["upload_id"]
+
+        payload = {"upload_id": upload_id, "modules": ["trim_spaces", "drop_duplicates"], "sample_rows": 100}
+        response = client.post("/v1/pipeline/estimate", json=payload, headers=get_headers_with_key())
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["estimated_rows"] == 3
+        assert [step["key"] for step in data["steps"]] == ["trim_spaces", "drop_duplicates"]
+        assert data["steps"][1]["rows_out"] == 2
+        assert data["estimated_peak_bytes"] > 0
+
+    def test_pipeline_profile(self):
+        """POST /v1/pipeline/profile endpoint'ini test et."""
+        csv_content = b"name,age\n  John  ,25\n  Jane  ,30\n  John  ,25\n,40"
+        upload_response = client.post(
+            "/v1/upload/csv",
+            files={"file": ("test_profile.csv", csv_content, "text/csv")},
+            headers=get_headers_with_key()
+        )
+        assert upload_response.status_code == 200
+        upload_id = upload_response.json()["upload_id"]
+
+        payload = {"upload_id": upload_id, "modules": ["trim_spaces", "drop_duplicates"], "chunk_size": 100}
+        response = client.post("/v1/pipeline/profile", json=payload, headers=get_headers_with_key())
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["before"]["rows"] == 4
+        assert data["before"]["columns"]["name"]["nulls"] == 1
+        assert data["before"]["columns"]["age"]["max"] == 40
+        assert data["after"]["rows"] == 3
+
+    def test_concurrent_runs_get_their_own_audit_log(self, tmp_path, monkeypatch):
+        """Aynı anda çalışan iki işin reddedilen satırları ayrı denetim dizinlerine yazılmalı."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from api_modules.utils import storage
+        from modules.audit import read_audit
+
+        monkeypatch.setattr(storage, "BASE_AUDIT_DIR", tmp_path / "audit")
+        monkeypatch.chdir(tmp_path)
+
+        def run(first_id):
+            rows = "".join(f"{first_id + i},coffee,BOZUK,2023-01-01\n" for i in range(200))
+            csv_content = ("Transaction ID,Item Ordered,Total Spent,Transaction Date\n" + rows).encode()
+            upload_response = client.post(
+                "/v1/upload/csv",
+                files={"file": (f"test_audit_{first_id}.csv", csv_content, "text/csv")},
+                headers=get_headers_with_key()
+            )
+            payload = {"upload_id": upload_response.json()["upload_id"], "modules": ["fix_cafe_business_logic"]}
+            return client.post("/v1/pipeline/run", json=payload, headers=get_headers_with_key())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            responses = list(executor.map(run, [1000, 2000]))
+
+        assert [response.status_code for response in responses] == [200, 200]
+        logged = sorted(
+            sorted(read_audit(run_dir)["Transaction ID"].tolist())
+            for run_dir in (tmp_path / "audit").iterdir()
+        )
+        assert logged == [list(range(1000, 1200)), list(range(2000, 2200))]
+        assert not (tmp_path / "deleted_records_log.csv").exists()
+
     def test_pipeline_run_missing_api_key(self):
         """POST /v1/pipeline/run endpoint'ini test et (missing API key)."""
         payload = {
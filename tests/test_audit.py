@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.audit import AuditSink, CsvAuditSink, NullAuditSink, _SinkBase, read_audit, record_rows, use_sink
+from modules.custom.fix_cafe_business_logic import run as cafe_run
+from modules.pipeline_manager import PipelineManager
+
+
+def _cafe_frame():
+    return pd.DataFrame(
+        {
+            "Transaction ID": [1, 1, 2, 3],
+            "Item Ordered": ["coffee", "coffee", "tea", "cake"],
+            "Total Spent": ["5.5", "5.5", "BOZUK", "4"],
+            "Transaction Date": ["2023-01-01", "2023-01-01", "2023-01-02", "tarih değil"],
+        }
+    )
+
+
+def test_sink_buffers_and_writes_parts(tmp_path):
+    frame = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", 2, None, "y"]})
+    with AuditSink(tmp_path, run_id="run1", flush_rows=2) as sink:
+        with use_sink(sink):
+            assert record_rows(frame, np.array([True, True, False, False]), "İlk", source="test") == 2
+            assert record_rows(frame, frame["a"] == 4, "Son", extra={"Row_Index": frame.index}) == 1
+    assert len(sink.parts()) == 2
+    logged = read_audit(tmp_path / "run1")
+    assert logged["Reason"].tolist() == ["İlk", "İlk", "Son"]
+    assert logged["b"].tolist() == ["x", "2", "y"]
+    assert logged["Row_Index"].tolist()[2] == 3
+
+
+def test_sink_rejects_misaligned_mask(tmp_path):
+    with pytest.raises(ValueError):
+        NullAuditSink().record(pd.DataFrame({"a": [1, 2]}), [True], "x")
+
+
+def test_sink_without_add_cannot_be_created():
+    class Incomplete(_SinkBase):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_cafe_logs_original_rows_to_active_sink(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sink = CsvAuditSink(tmp_path / "audit.csv")
+    with use_sink(sink):
+        result = cafe_run(_cafe_frame())
+    assert result["Transaction ID"].tolist() == [1]
+    logged = pd.read_csv(sink.path)
+    # duplicates no longer break the audit lookup; values are the raw input
+    assert logged["Item Ordered"].tolist() == ["tea", "cake"]
+    assert logged["Reason"].tolist() == ["Invalid Price", "Invalid Date"]
+    assert not os.path.exists("deleted_records_log.csv")
+
+    with use_sink(NullAuditSink()):
+        cafe_run(_cafe_frame())
+    assert len(pd.read_csv(sink.path)) == 2
+
+
+def test_pipeline_writes_per_run_audit(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runs = []
+    for _ in range(2):
+        manager = PipelineManager(selected_modules_list=["fix_cafe_business_logic"], audit_dir=str(tmp_path / "audit"))
+        manager.run_pipeline(_cafe_frame())
+        runs.append(manager.audit_path)
+    assert runs[0] != runs[1]
+    for path in runs:
+        logged = read_audit(path)
+        assert logged["Reason"].tolist() == ["Invalid Price", "Invalid Date"]
+        assert set(logged["Source"]) == {"fix_cafe_business_logic"}
+    assert not os.path.exists("deleted_records_log.csv")
+
+    chunked = PipelineManager(selected_modules_list=["clean_hepsiburada_scrape"], audit_dir=str(tmp_path / "audit"))
+    frame = pd.DataFrame({"name": ["a", "b", "c"], "price": ["10", "yok", "fiyat?"]})
+    parts = list(chunked.run_pipeline_chunked([frame.iloc[:2], frame.iloc[2:]]))
+    assert sum(len(part) for part in parts) == 3
+    assert read_audit(chunked.audit_path)["Orig_Price_Text"].tolist() == ["yok", "fiyat?"]
@@ -206,6 +206,69 @@ class TestCafeBusinessLogic(unittest.TestCase):
         # Sonuç boş olmalı
         self.assertEqual(len(result), 0)
 
+    def test_placeholders_and_names_in_one_pass(self):
+        """Yer tutucular ve isim düzeltmeleri tekrar eden değerlerde aynı sonucu vermeli"""
+        df = pd.DataFrame({
+            "Transaction ID": [1, 2, 3, 4, 4, 6],
+            "Item Ordered": [" expresso", "error", None, "latte", "LATTE ", "Unknown"],
+            "Category": ["hot drinks", "N/A", "Hot Drinks ", "hot drinks", "hot drinks", "-"],
+            "Total Spent": ["5,5", "3", "4", "4", "4", "6"],
+            "Transaction Date": ["2023-01-01", "2023-01-02", "2023-01-03", "2023-01-04", "2023-01-04", "2023-01-05"],
+        })
+
+        result = run(df)
+
+        # "latte" ve "LATTE " temizlendikten sonra aynı satır olur ve biri silinir
+        self.assertEqual(result["Transaction ID"].tolist(), [1, 2, 3, 4, 6])
+        items = result["Item Ordered"].tolist()
+        self.assertEqual(items[0], "Espresso")
+        self.assertEqual(items[3], "Latte")
+        self.assertTrue(pd.isna(items[1]) and pd.isna(items[2]) and pd.isna(items[4]))
+        self.assertEqual(result["Category"].tolist()[0], "Hot Drinks")
+        self.assertTrue(pd.isna(result["Category"].iloc[1]))
+        self.assertEqual(result["Transaction Date"].tolist()[-1], "2023-01-05")
+
+    def test_ambiguous_dates_follow_the_column(self):
+        """Belirsiz tarihler eski sürümdeki gibi okunmalı: sıra sütundan, hatalılar gün önce"""
+        month_first = pd.DataFrame({
+            "Transaction ID": [1, 2, 3],
+            "Total Spent": ["5", "5", "5"],
+            "Transaction Date": ["05/01/2023", "03/04/2023", "13/04/2023"],
+        })
+        day_first = month_first.assign(**{"Transaction Date": ["13/01/2023", "05/01/2023", "03/04/2023"]})
+
+        self.assertEqual(
+            run(month_first)["Transaction Date"].tolist(),
+            ["2023-05-01", "2023-03-04", "2023-04-13"],
+        )
+        self.assertEqual(
+            run(day_first)["Transaction Date"].tolist(),
+            ["2023-01-13", "2023-01-05", "2023-04-03"],
+        )
+
+    def test_output_matches_previous_version(self):
+        """Tekrarlı satırlar ve belirsiz tarihlerde çıktı önceki sürümle aynı olmalı"""
+        df = pd.DataFrame({
+            "Transaction ID": [1, 1, 2, 3, 3, 4],
+            "Item Ordered": ["coffee", "coffee", " tea", "cake", "cake", "Expresso"],
+            "Total Spent": ["5.5", "5.5", "4", "3", "3", "2"],
+            "Transaction Date": ["05/01/2023", "05/01/2023", "03/04/2023", "13/04/2023", "13/04/2023", "12/31/2023"],
+        })
+
+        result = run(df)
+
+        # what the previous (row-by-row) version of the plugin returned
+        expected = pd.DataFrame(
+            {
+                "Transaction ID": [1, 2, 3, 4],
+                "Item Ordered": ["Coffee", "Tea", "Cake", "Espresso"],
+                "Total Spent": [5.5, 4.0, 3.0, 2.0],
+                "Transaction Date": ["2023-05-01", "2023-03-04", "2023-04-13", "2023-12-31"],
+            },
+            index=[1, 2, 4, 5],
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for category-aware execution of the string modules and plugins."""
+
+import pandas as pd
+
+from modules.categorical import apply_by_category, transform_categories
+from modules.core import text_normalize, trim_spaces
+from modules.custom import clean_akakce_data, fix_cafe_business_logic
+
+
+def _category(values, **kwargs):
+    return pd.Series(pd.Categorical(values, **kwargs), name="c")
+
+
+def test_transform_categories_merges_collisions():
+    series = _category([" a", "a ", None, "b", "x"], categories=["x", "b", " a", "a "], ordered=True)
+    result = transform_categories(series, lambda values: values.str.strip().replace("x", None))
+    assert result.dropna().tolist() == ["a", "a", "b"]
+    assert list(result.cat.categories) == ["b", "a"]
+    assert result.cat.ordered
+    assert result.isna().tolist() == [False, False, True, False, True]
+
+
+def test_apply_by_category_expands_to_rows():
+    series = _category(["a b", None, "c", "a b"])
+    flags = apply_by_category(series, lambda values: values.str.contains(" "), missing=False)
+    assert flags.tolist() == [True, False, False, True]
+    parts = apply_by_category(series, lambda values: values.str.split(" ", n=1, expand=True))
+    assert parts[1].tolist()[0] == "b" and pd.isna(parts[0].iloc[1])
+
+
+def test_trim_spaces_keeps_category_dtype():
+    df = pd.DataFrame({"c": _category(["  x ", "x", None])})
+    result = trim_spaces.process(df)
+    assert isinstance(result["c"].dtype, pd.CategoricalDtype)
+    assert list(result["c"].cat.categories) == ["x"]
+    assert result["c"].tolist()[:2] == ["x", "x"]
+
+
+def test_text_normalize_matches_object_path():
+    values = ["“q”  a", "Ã§ilek", "q a", None, "\"q\" a"]
+    df = pd.DataFrame({"c": values})
+    expected = text_normalize.process(df)
+    result = text_normalize.process(df.astype("category"))
+    assert isinstance(result["c"].dtype, pd.CategoricalDtype)
+    assert result["c"].astype(object).where(result["c"].notna(), None).tolist() == expected["c"].tolist()
+    assert result.attrs["text_normalize"]["mojibake"]["c"]["checked"] == 4
+
+
+def test_plugins_accept_category_columns(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cafe = pd.DataFrame({
+        "Item": [" coffee", "Coffee", "expresso", "ERROR"],
+        "Category": ["drink", "drink", "UNKNOWN", "food"],
+        "Total Spent": ["1", "2", "3", "4"],
+        "Transaction Date": ["2023-01-01"] * 4,
+    })
+    expected = fix_cafe_business_logic.run(cafe.copy())
+    result = fix_cafe_business_logic.run(cafe.astype({"Item": "category", "Category": "category"}))
+    assert list(result["Item"].cat.categories) == ["Coffee", "Espresso"]
+    assert result["Item"].isna().tolist() == expected["Item"].isna().tolist()
+    assert result["Item"].dropna().tolist() == expected["Item"].dropna().tolist()
+    assert result["Category"].dropna().tolist() == expected["Category"].dropna().tolist()
+
+    akakce = pd.DataFrame({"name": ["Apple iPhone", "Sam"], "price": ["10 +3 FİYAT", "2"]})
+    pd.testing.assert_frame_equal(
+        clean_akakce_data.process(akakce.astype("category")).astype(object),
+        clean_akakce_data.process(akakce).astype(object),
+    )
@@ -0,0 +1,95 @@
+"""Tests for step checkpoints and resuming pipeline runs."""
+
+import pandas as pd
+import pytest
+
+from modules.checkpoint import CheckpointStore, input_fingerprint
+from modules.core import ModuleDescriptor
+from modules.pipeline_manager import PipelineManager
+from modules.utils import PipelineRunner, UIState
+
+
+def _descriptor(key, func):
+    return ModuleDescriptor(key=key, name=key, description="", defaults={}, process=func)
+
+
+class TestCheckpointStore:
+    def test_save_latest_and_clear(self, tmp_path):
+        store = CheckpointStore(run_id="run1", root=tmp_path)
+        store.begin({"file": "x"}, input_rows=2)
+        store.save(1, "a", pd.DataFrame({"v": [1, 2]}))
+        store.save(2, "b", pd.DataFrame({"v": [3]}))
+
+        done, frame = store.latest()
+        assert done == 2
+        assert frame["v"].tolist() == [3]
+        assert store.completed_steps() == ["a", "b"]
+        # only the latest step is kept on disk
+        assert len([p for p in store.directory.iterdir() if p.name.startswith("step_")]) == 1
+
+        store.clear()
+        assert not store.directory.exists()
+        assert store.latest() is None
+
+    def test_mixed_object_columns_fall_back(self, tmp_path):
+        store = CheckpointStore(run_id="run2", root=tmp_path)
+        store.save(1, "a", pd.DataFrame({"v": [1, "x", None]}))
+        _, frame = store.latest()
+        assert frame["v"].tolist()[:2] == [1, "x"]
+
+
+class TestResume:
+    def test_manager_resumes_after_failed_step(self, tmp_path):
+        calls = []
+
+        def first(df):
+            calls.append("first")
+            return df.assign(v=df["v"] + 1)
+
+        def boom(df):
+            raise ValueError("boom")
+
+        manager = PipelineManager(selected_modules_list=["first", "second"])
+        manager.core_modules["first"] = _descriptor("first", first)
+        manager.core_modules["second"] = _descriptor("second", boom)
+        store = CheckpointStore(run_id="resume", root=tmp_path)
+
+        with pytest.raises(RuntimeError):
+            manager.run_pipeline(pd.DataFrame({"v": [1, 2]}), checkpoint=store)
+        assert store.completed_steps() == ["first"]
+
+        manager.core_modules["second"] = _descriptor("second", lambda df: df.assign(v=df["v"] * 10))
+        result = manager.run_pipeline(pd.DataFrame({"v": [100, 200]}), checkpoint=store)
+        assert result["v"].tolist() == [20, 30]
+        assert calls == ["first"]
+
+    def test_runner_clears_checkpoints_on_success(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "data.csv"
+        pd.DataFrame({"name": ["  a  ", " b "]}).to_csv(path, index=False)
+        runner = PipelineRunner()
+        state = UIState(selected_core_keys=["trim_spaces"], output_type="csv", file_path=str(path), checkpoint=True)
+
+        assert runner.run_file(state)
+        assert state.run_id == runner.last_run_id
+        assert not (tmp_path / ".neatdata_checkpoints" / state.run_id).exists()
+
+    def test_runner_rereads_input_when_checkpoint_frame_is_missing(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "data.csv"
+        pd.DataFrame({"name": ["  a  ", " b "]}).to_csv(path, index=False)
+        runner = PipelineRunner()
+        state = UIState(
+            selected_core_keys=["trim_spaces"], output_type="csv", output_dir=str(tmp_path / "out"), file_path=str(path)
+        )
+        state.checkpoint = True
+        checkpoint = runner._open_checkpoint(state, state.get_all_selected_modules())
+        # manifest says the step finished, but its frame is gone
+        checkpoint.begin(input_fingerprint(str(path), state.get_all_selected_modules()), 2)
+        checkpoint.save(1, "trim_spaces", pd.DataFrame({"name": ["a", "b"]}))
+        for frame_file in checkpoint.directory.glob("step_*"):
+            frame_file.unlink()
+
+        assert runner.run_file(state)
+        output = next((tmp_path / "out").glob("*.csv"))
+        assert pd.read_csv(output)["name"].tolist() == ["a", "b"]
@@ -0,0 +1,37 @@
+import pandas as pd
+
+from modules.custom.clean_akakce_data import process
+
+
+def test_split_and_price_cleaning():
+    df = pd.DataFrame(
+        {
+            "name": ["Apple iPhone 15 Pro", "Nokia", "Samsung  Galaxy"],
+            "price": ["12.999 TL +116 FİYAT", " 8.500 TL ", "1.250 TL+3FİYAT"],
+        }
+    )
+    out = process(df)
+    assert list(out.columns) == ["price", "brand", "model"]
+    assert out["price"].tolist() == ["12.999 TL", "8.500 TL", "1.250 TL"]
+    assert out["brand"].tolist() == ["Apple", "Nokia", "Samsung"]
+    assert out["model"].tolist() == ["iPhone 15 Pro", None, " Galaxy"]
+
+
+def test_missing_and_non_text_cells_are_kept():
+    df = pd.DataFrame({"name": ["Apple iPhone", None, 5], "price": ["1 +2 FİYAT", None, 3.5]})
+    out = process(df)
+    assert out["price"].tolist()[::2] == ["1", 3.5] and pd.isna(out.loc[1, "price"])
+    assert out.loc[2, "brand"] == 5 and pd.isna(out.loc[1, "brand"])
+
+
+def test_missing_columns_are_tolerated():
+    assert process(pd.DataFrame({"id": [1]})).columns.tolist() == ["id"]
+    only_names = process(pd.DataFrame({"name": ["Asus Zenbook"]}))
+    assert only_names.to_dict("records") == [{"brand": "Asus", "model": "Zenbook"}]
+
+
+def test_names_without_spaces_have_no_model():
+    for names in (pd.Series(["Nokia", "Xiaomi"]), pd.Series(["Nokia", "Xiaomi"], dtype="category")):
+        out = process(pd.DataFrame({"name": names}))
+        assert out["brand"].tolist() == ["Nokia", "Xiaomi"]
+        assert out["model"].dtype == object and out["model"].tolist() == [None, None]
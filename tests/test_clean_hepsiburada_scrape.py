@@ -47,3 +47,14 @@ def test_parse_extra_handles_empty():
     df = pd.DataFrame({"name": ["x"], "price": ["10"], "extra": [pd.NA]})
     out = clean_run(df)
     assert pd.isna(out.loc[0, "extra"]) or out.loc[0, "extra"] == out.loc[0, "extra"]
+
+
+def test_repeated_names_are_cleaned_like_single_ones():
+    names = ["Telefon  “Pro”  6,1''", "Kulaklık", None]
+    df = pd.DataFrame({"name": names * 3, "price": ["10"] * 9})
+    out = clean_run(df)
+    single = clean_run(pd.DataFrame({"name": names, "price": ["10"] * 3}))
+    assert list(out["name"]) == list(single["name"]) * 3
+    assert out.loc[0, "name"] == 'Telefon "Pro" 6,1"'
+    # missing names are read as text, as before
+    assert out.loc[2, "name"] == "None"
@@ -207,6 +207,25 @@ class TestTrimSpaces:
         result = trim_spaces(df)
         assert list(result["id"]) == [1, 2, 3]
     
+    def test_mixed_object_column_keeps_non_strings(self):
+        """Only string cells are stripped; numbers and missing values stay as they are."""
+        df = pd.DataFrame({"mixed": ["  a ", 5, None, np.nan, 2.5]})
+        result = trim_spaces(df)
+        assert result["mixed"].tolist()[:2] == ["a", 5]
+        assert result["mixed"].iloc[2] is None
+        assert pd.isna(result["mixed"].iloc[3])
+        assert result["mixed"].iloc[4] == 2.5
+
+    def test_arrow_backend(self):
+        """use_arrow keeps text columns as Arrow strings when pyarrow is installed."""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"name": ["  Alice ", None], "mixed": [" x ", 1]})
+        result = trim_spaces(df, use_arrow=True)
+        assert result["name"].dtype == "string[pyarrow]"
+        assert result["name"].iloc[0] == "Alice"
+        assert pd.isna(result["name"].iloc[1])
+        assert result["mixed"].tolist() == ["x", 1]
+
     def test_numeric_columns_ignored(self):
         """Numeric columns should be ignored."""
         df = pd.DataFrame({
@@ -289,6 +308,28 @@ class TestConvertTypes:
         result = convert_types(df, coerce=True, numeric_threshold=0.6)
         assert pd.isna(result.loc[2, "value"])
 
+    def test_vectorized_cleaning_matches_per_cell(self):
+        """Vectorized cleaning must equal the per-cell reference, including literal tokens."""
+        from modules.core.convert_types import _clean_numeric_string, clean_numeric_series
+
+        values = pd.Series(["1.234,5 TL", "€ 12", "EUR 3e2", "-4%", "nan", "x1ye", " 7 "])
+        for tokens in ([",", " ", "$", "TL", "€", "%"], ["EUR", ","], ["x", "1y"]):
+            expected = values.apply(lambda value: _clean_numeric_string(value, tokens))
+            assert clean_numeric_series(values, tokens).tolist() == expected.tolist()
+        multiline = pd.Series(["1\n2 TL", "3"])
+        expected = multiline.apply(lambda value: _clean_numeric_string(value, ["TL"]))
+        assert clean_numeric_series(multiline, ["TL"]).tolist() == expected.tolist()
+
+    def test_sample_check_skips_text_columns(self):
+        """Long text columns are rejected from a sample, numeric ones still convert."""
+        df = pd.DataFrame({
+            "text": ["abc" if i % 50 else "5" for i in range(5000)],
+            "value": [str(i) for i in range(5000)],
+        })
+        result = convert_types(df, sample_size=200)
+        assert result["text"].dtype == object
+        assert result["value"].dtype == np.int64
+
 
 class TestTextNormalize:
     """Test text normalization pipeline."""
@@ -0,0 +1,86 @@
+"""Tests for hash-based and spilling duplicate removal."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.core import drop_duplicates
+from modules.memory_budget import MemoryBudget
+from modules.pipeline_manager import PipelineManager
+
+
+def _frame(rows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "name": rng.choice(["a", "b", "c", None], rows),
+        "price": rng.integers(0, 20, rows),
+        "note": rng.choice(["x", "y"], rows),
+    })
+
+
+class TestHashMode:
+    @pytest.mark.parametrize("keep", ["first", "last", False])
+    def test_matches_pandas(self, keep):
+        df = _frame()
+        expected = df.drop_duplicates(subset=["name", "price"], keep=keep).reset_index(drop=True)
+        result = drop_duplicates.process(df, subset=["name", "price"], keep=keep, method="hash")
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_unverified_trusts_hashes(self):
+        df = _frame()
+        mask = drop_duplicates.duplicated_by_hash(df, verify=False)
+        assert (mask == df.duplicated().to_numpy()).all()
+
+
+class TestSpillingDeduplicator:
+    @pytest.mark.parametrize("keep", ["first", "last"])
+    def test_global_dedup_preserves_order(self, keep, tmp_path):
+        df = _frame(rows=3000, seed=1)
+        chunks = [df.iloc[start:start + 700] for start in range(0, len(df), 700)]
+        deduplicator = drop_duplicates.SpillingDeduplicator(subset=["name", "price"], keep=keep, partitions=4, directory=tmp_path)
+        for chunk in chunks:
+            deduplicator.add(chunk)
+        result = pd.concat(list(deduplicator.results()))
+
+        expected = df.drop_duplicates(subset=["name", "price"], keep=keep)
+        pd.testing.assert_frame_equal(result, expected)
+        assert not list(tmp_path.glob("*.pkl"))
+
+    def test_process_chunked_matches_across_dtypes(self):
+        chunks = [pd.DataFrame({"v": [1, 2]}), pd.DataFrame({"v": [2.0, np.nan]}), pd.DataFrame({"v": [np.nan, 3.0]})]
+        result = pd.concat(list(drop_duplicates.process_chunked(chunks)))
+        assert result["v"].tolist()[:2] == [1, 2]
+        assert len(result) == 4
+
+    @pytest.mark.parametrize("verify", [True, False])
+    def test_mixed_dtype_chunks(self, verify):
+        # the same CSV column parsed as int64, float64 and object in different chunks
+        chunks = [
+            pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}),
+            pd.DataFrame({"id": [2.0, np.nan], "name": ["b", "c"]}),
+            pd.DataFrame({"id": pd.Series(["1", "x", None], dtype=object), "name": ["a", "d", "c"]}),
+        ]
+        deduplicator = drop_duplicates.SpillingDeduplicator(partitions=3, verify=verify)
+        for chunk in chunks:
+            deduplicator.add(chunk)
+        result = pd.concat(list(deduplicator.results()))
+        assert result["name"].tolist() == ["a", "b", "c", "d"]
+        assert result["id"].tolist()[-1] == "x"
+
+    def test_distinct_strings_are_not_merged(self):
+        # numeric-looking text in an object column is compared as written, like `process`
+        df = pd.DataFrame({"v": ["01234", "1234", "1.0", "1", "2.50", "2.5", "1"]})
+        chunks = [df.iloc[:3], df.iloc[3:]]
+        result = pd.concat(list(drop_duplicates.process_chunked(chunks)))
+        assert result["v"].tolist() == drop_duplicates.process(df)["v"].tolist()
+
+
+class TestChunkedPipeline:
+    def test_duplicates_removed_across_slices(self):
+        df = pd.DataFrame({"name": [f"item {i % 50}" for i in range(5000)]})
+        manager = PipelineManager(
+            selected_modules_list=["drop_duplicates"],
+            memory_budget=MemoryBudget(limit_bytes=50_000, min_chunk_rows=100),
+        )
+        result = manager.run_pipeline(df)
+        assert result["name"].tolist() == [f"item {i}" for i in range(50)]
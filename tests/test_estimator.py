@@ -0,0 +1,39 @@
+"""Tests for the sample-based pipeline cost estimator."""
+
+import pandas as pd
+
+from modules.estimator import PipelineEstimator
+
+
+def _write_csv(path, rows):
+    pd.DataFrame({
+        "name": [f"  item {i}  " for i in range(rows)],
+        "group": [i // (rows // 4) for i in range(rows)],
+    }).to_csv(path, index=False)
+
+
+def test_small_file_is_sampled_whole(tmp_path):
+    path = tmp_path / "small.csv"
+    _write_csv(path, 200)
+    estimate = PipelineEstimator().estimate(str(path), ["trim_spaces"], sample_rows=1000)
+    assert estimate.sample_rows == 200
+    assert estimate.scale == 1.0
+    assert [step.key for step in estimate.steps] == ["trim_spaces"]
+
+
+def test_sample_is_stratified_and_extrapolated(tmp_path):
+    path = tmp_path / "big.csv"
+    _write_csv(path, 20000)
+    estimator = PipelineEstimator()
+    probe = estimator.data_loader.probe(str(path))
+    sample = estimator.sample(str(path), probe, sample_rows=1000, strata=4)
+    # every quarter of the file is represented, not only the head
+    assert sorted(sample["group"].unique().tolist()) == [0, 1, 2, 3]
+
+    estimate = estimator.estimate(str(path), ["trim_spaces", "drop_duplicates"], sample_rows=1000, strata=4)
+    assert estimate.scale > 10
+    assert 15000 <= estimate.estimated_rows <= 25000
+    step = estimate.steps[0]
+    assert step.estimated_seconds >= step.sample_seconds
+    assert step.estimated_peak_bytes > step.sample_peak_bytes > 0
+    assert estimate.to_dict()["estimated_peak_bytes"] == estimate.estimated_peak_bytes
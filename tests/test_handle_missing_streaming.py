@@ -0,0 +1,124 @@
+"""Tests for statistical fills, mergeable sketches and chunked handle_missing."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.core import handle_missing
+from modules.sketches import QuantileSketch, RunningMoments, SpaceSaving
+
+
+def _frame(rows=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "group": rng.choice(["a", "b", "c", None], rows),
+        "shop": rng.integers(0, 3, rows),
+        "price": np.where(rng.random(rows) < 0.3, np.nan, rng.normal(100, 10, rows)),
+        "color": pd.Series(np.where(rng.random(rows) < 0.3, None, rng.choice(["red", "blue", "green"], rows)), dtype=object),
+    })
+
+
+def _chunks(frame, size=700):
+    for start in range(0, len(frame), size):
+        yield frame.iloc[start:start + size]
+
+
+class TestSketches:
+    def test_running_moments_merge(self):
+        values = np.random.default_rng(1).normal(size=1000)
+        left = RunningMoments().update(values[:300])
+        right = RunningMoments().update(values[300:])
+        merged = left.merge(right)
+        assert merged.count == 1000
+        assert merged.mean == pytest.approx(values.mean())
+        assert merged.variance == pytest.approx(values.var(ddof=1))
+
+    def test_quantile_sketch_exact_then_approximate(self):
+        values = np.random.default_rng(2).normal(size=200_000)
+        small = QuantileSketch(k=1024).update(values[:500])
+        assert small.exact
+        assert small.median() == pytest.approx(np.median(values[:500]))
+
+        sketch = QuantileSketch(k=256)
+        for start in range(0, len(values), 20_000):
+            sketch.update(values[start:start + 20_000])
+        assert not sketch.exact
+        assert sum(len(level) for level in sketch.levels) < 5000
+        assert sketch.quantile(0.5) == pytest.approx(np.median(values), abs=0.05)
+        assert sketch.quantile(0.9) == pytest.approx(np.quantile(values, 0.9), abs=0.05)
+
+    def test_space_saving_mode_and_ties(self):
+        counter = SpaceSaving(capacity=10).update(["b", "a", "b", "a", "c"])
+        assert counter.mode() == "a"
+        assert counter.most_common(1)[0][1] == 2
+
+    def test_space_saving_keeps_heavy_hitter(self):
+        values = ["hot"] * 500 + [f"cold{i}" for i in range(2000)]
+        counter = SpaceSaving(capacity=50)
+        for start in range(0, len(values), 100):
+            counter.update(values[start:start + 100])
+        assert counter.mode() == "hot"
+        assert len(counter.counts) == 50
+
+
+class TestStatisticalFills:
+    def test_mean_fill(self):
+        df = pd.DataFrame({"a": [1.0, None, 3.0]})
+        result = handle_missing.process(df, strategy="mean", columns=["a"])
+        assert result["a"].tolist() == [1.0, 2.0, 3.0]
+
+    def test_median_skips_text_columns(self):
+        df = pd.DataFrame({"a": [1.0, None, 3.0, 10.0], "b": ["x", None, "y", "y"]})
+        result = handle_missing.process(df, strategy="median", columns=["a", "b"])
+        assert result["a"].tolist() == [1.0, 3.0, 3.0, 10.0]
+        assert result["b"].isna().sum() == 1
+
+    def test_mode_fill(self):
+        df = pd.DataFrame({"b": ["x", None, "y", "y"]})
+        result = handle_missing.process(df, strategy="mode", columns=["b"])
+        assert result["b"].tolist() == ["x", "y", "y", "y"]
+
+    def test_group_mean_falls_back_to_overall(self):
+        df = pd.DataFrame({
+            "g": ["a", "a", "b", "b", "c", None],
+            "v": [1.0, None, 10.0, None, None, None],
+        })
+        result = handle_missing.process(df, strategy="mean", columns=["v"], group_by=["g"])
+        assert result["v"].tolist() == [1.0, 1.0, 10.0, 10.0, 5.5, 5.5]
+
+    def test_nullable_integer_mean(self):
+        df = pd.DataFrame({"a": pd.array([1, None, 2], dtype="Int64")})
+        result = handle_missing.process(df, strategy="mean", columns=["a"])
+        assert result["a"].tolist() == [1.0, 1.5, 2.0]
+
+
+class TestChunked:
+    @pytest.mark.parametrize("strategy", ["mean", "median", "mode"])
+    @pytest.mark.parametrize("group_by", [None, ["group"], ["group", "shop"]])
+    def test_statistics_match_in_memory(self, strategy, group_by):
+        df = _frame()
+        expected = handle_missing.process(df, strategy=strategy, columns=["price", "color"], group_by=group_by)
+        result = pd.concat(handle_missing.process_chunked(
+            _chunks(df), strategy=strategy, columns=["price", "color"], group_by=group_by, sketch_size=5000,
+        ))
+        pd.testing.assert_frame_equal(result, expected, check_exact=False)
+
+    @pytest.mark.parametrize("strategy", ["ffill", "bfill"])
+    @pytest.mark.parametrize("limit", [None, 1, 5])
+    def test_directional_fills_cross_chunks(self, strategy, limit):
+        df = _frame()
+        df.loc[600:1500, "price"] = np.nan
+        expected = handle_missing.process(df, strategy=strategy, columns=["price", "color"], limit=limit)
+        result = pd.concat(handle_missing.process_chunked(
+            _chunks(df, 300), strategy=strategy, columns=["price", "color"], limit=limit,
+        ))
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_noop_streams_through(self):
+        df = _frame()
+        result = pd.concat(handle_missing.process_chunked(_chunks(df), strategy="noop"))
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_invalid_strategy(self):
+        with pytest.raises(ValueError):
+            list(handle_missing.process_chunked(_chunks(_frame()), strategy="bogus", columns=["price"]))
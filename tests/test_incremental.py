@@ -0,0 +1,107 @@
+"""Tests for incremental (append-only) processing."""
+
+import numpy as np
+import pandas as pd
+
+from modules.core import drop_duplicates
+from modules.data_loader import DataLoader, DataLoaderConfig
+from modules.incremental import IncrementalStateStore, SourceState, read_tail
+from modules.utils import PipelineRunner, UIState
+
+
+def _append(path, lines):
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("".join(line + "\n" for line in lines))
+
+
+class TestReadTail:
+    def test_reads_only_complete_new_lines(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("name,price\na,1\nb,2\n", encoding="utf-8")
+        frame, offset = read_tail(path, 0, encoding="utf-8", delimiter=",")
+        assert frame["name"].tolist() == ["a", "b"]
+
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("c,3\nd,4")  # last line still being written
+        frame, offset = read_tail(path, offset, encoding="utf-8", delimiter=",")
+        assert frame["name"].tolist() == ["c"]
+        assert offset == path.stat().st_size - len("d,4")
+
+    def test_malformed_lines_go_to_bad_lines_log(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("name,price\na,1\nb,2,extra\nc,3\n", encoding="utf-8")
+        loader = DataLoader(DataLoaderConfig(bad_lines_log=tmp_path / "bad.csv"))
+        frame, _ = loader.load_tail(str(path), 0, encoding="utf-8", delimiter=",")
+        assert frame["name"].tolist() == ["a", "c"]
+        assert (tmp_path / "bad.csv").read_text(encoding="utf-8").splitlines() == ["b,2,extra"]
+
+
+class TestStatefulDropDuplicates:
+    def test_drops_rows_seen_in_earlier_runs(self):
+        state = {}
+        first = drop_duplicates.process_stateful(pd.DataFrame({"v": [1, 2, 2]}), state)
+        second = drop_duplicates.process_stateful(pd.DataFrame({"v": [2.0, 3.0, 3.0]}), state)
+        assert first["v"].tolist() == [1, 2]
+        assert second["v"].tolist() == [3.0]
+        assert isinstance(state["hashes"], np.ndarray) and len(state["hashes"]) == 3
+
+    def test_matches_values_parsed_with_other_dtypes(self):
+        state = {}
+        drop_duplicates.process_stateful(pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}), state)
+        later = pd.DataFrame({"id": pd.Series(["1", "3", None], dtype=object), "name": ["a", "c", "d"]})
+        assert drop_duplicates.process_stateful(later, state)["name"].tolist() == ["c", "d"]
+
+
+class TestStateStore:
+    def test_roundtrip(self, tmp_path):
+        store = IncrementalStateStore(root=tmp_path)
+        state = SourceState(source=str(tmp_path / "x.csv"), byte_offset=10, step_states={"drop_duplicates": {"hashes": np.arange(3, dtype=np.uint64)}})
+        store.save(state)
+        loaded = store.load(state.source)
+        assert loaded.byte_offset == 10
+        assert loaded.step_states["drop_duplicates"]["hashes"].tolist() == [0, 1, 2]
+        assert loaded.step_states["drop_duplicates"]["hashes"].dtype == np.uint64
+        # everything, step states included, is plain JSON
+        assert [p.name for p in store.directory_for(state.source).iterdir()] == ["state.json"]
+
+
+class TestIncrementalRunner:
+    def test_appends_only_new_rows(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "export.csv"
+        path.write_text("name,price\n  a  ,1\nb,2\n", encoding="utf-8")
+        state = UIState(selected_core_keys=["trim_spaces", "drop_duplicates"], output_type="csv", file_path=str(path), incremental=True)
+        runner = PipelineRunner()
+        assert runner.run_file(state)
+
+        _append(path, ["a,1", "c,3"])
+        assert runner.run_file(state)
+
+        output = pd.read_csv(tmp_path / "cleaned_export.csv", encoding="utf-8-sig")
+        assert output["name"].tolist() == ["a", "b", "c"]
+        assert IncrementalStateStore.for_output(tmp_path / "cleaned_export.csv").load(str(path)).rows_processed == 4
+
+    def test_state_is_kept_next_to_the_output(self, tmp_path, monkeypatch):
+        work = tmp_path / "work"
+        work.mkdir()
+        monkeypatch.chdir(work)
+        path = tmp_path / "export.csv"
+        path.write_text("name\na\n", encoding="utf-8")
+        out = tmp_path / "out"
+        state = UIState(selected_core_keys=["drop_duplicates"], output_type="csv", output_dir=str(out), file_path=str(path), incremental=True)
+        assert PipelineRunner().run_file(state)
+        assert (out / ".neatdata_state").is_dir()
+        assert not (work / ".neatdata_state").exists()
+
+    def test_rewritten_source_is_processed_in_full(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "export.csv"
+        path.write_text("name\nfirst\n", encoding="utf-8")
+        state = UIState(selected_core_keys=["trim_spaces"], output_type="csv", file_path=str(path), incremental=True)
+        runner = PipelineRunner()
+        assert runner.run_file(state)
+
+        path.write_text("name\nother\nrows\n", encoding="utf-8")
+        assert runner.run_file(state)
+        output = pd.read_csv(tmp_path / "cleaned_export.csv", encoding="utf-8-sig")
+        assert output["name"].tolist() == ["other", "rows"]
@@ -0,0 +1,48 @@
+import pandas as pd
+
+from modules.custom.clean_hepsiburada_scrape import run as clean_run
+from modules.json_fields import flatten_json_series, json_text_series, parse_json_series, sniff_format
+
+
+def test_parse_matches_cell_rules():
+    s = pd.Series(['{"a": 1}', "{'a': 1}", "  ", None, "bozuk{", "true", {"d": 1}])
+    report = {}
+    parsed = parse_json_series(s, report=report)
+    assert parsed.tolist() == [{"a": 1}, {"a": 1}, {}, {}, {}, True, {"d": 1}]
+    assert report == {"format": "json", "fallback": 1, "failed": 1}
+
+
+def test_sniffed_order_does_not_change_results():
+    python_style = ["{'k': %d}" % i for i in range(10)]
+    assert sniff_format(python_style) == "python"
+    # JSON-only spellings still get JSON's reading in a python-style column
+    s = pd.Series(python_style + ['"a\\/b"', "null", "NaN"])
+    parsed = parse_json_series(s)
+    assert parsed.iloc[10] == "a/b"
+    assert parsed.iloc[11] is None
+    assert parsed.iloc[12] != parsed.iloc[12]
+
+
+def test_json_text_keeps_missing_and_unserializable_cells():
+    s = pd.Series(["{'a': 'ç'}", pd.NA, "{1, 2}", "{'a': 'ç'}"])
+    out = json_text_series(s)
+    assert out.iloc[0] == '{"a": "ç"}' and out.iloc[3] == out.iloc[0]
+    assert pd.isna(out.iloc[1])
+    assert out.iloc[2] == "{1, 2}"
+
+
+def test_flatten_builds_typed_columns():
+    s = pd.Series(['{"a": 1, "n": {"x": "y"}}', "{'a': 2}", None], name="extra")
+    flat = flatten_json_series(s)
+    assert list(flat.columns) == ["extra_a", "extra_n_x"]
+    assert flat["extra_a"].tolist()[:2] == [1.0, 2.0] and pd.isna(flat.loc[2, "extra_a"])
+    assert flat.loc[0, "extra_n_x"] == "y" and pd.isna(flat.loc[1, "extra_n_x"])
+    assert str(flatten_json_series(s.iloc[:2])["extra_a"].dtype) == "int64"
+
+
+def test_plugin_can_flatten_extra():
+    df = pd.DataFrame({"name": ["a", "b"], "price": ["10", "20"], "extra": ["{'renk': 'mavi', 'stok': 3}", "{'renk': 'kırmızı', 'stok': 0}"]})
+    out = clean_run(df, flatten_extra=True)
+    assert out["extra"].tolist() == df["extra"].tolist()
+    assert out["extra_renk"].tolist() == ["mavi", "kırmızı"]
+    assert out["extra_stok"].tolist() == [3, 0]
@@ -0,0 +1,131 @@
+"""Tests for the memory budget governor and chunked execution."""
+
+import pandas as pd
+import pytest
+
+from modules.core import ModuleDescriptor
+from modules.data_loader import DataLoader
+from modules.memory_budget import MemoryBudget, parse_memory_size
+from modules.pipeline_manager import PipelineManager
+from modules.utils import PipelineRunner, UIState
+
+
+def _write_csv(path, rows=3000):
+    df = pd.DataFrame({
+        "name": [f"  item {i}  " for i in range(rows)],
+        "price": [str(i) for i in range(rows)],
+    })
+    df.to_csv(path, index=False)
+    return df
+
+
+class TestParseMemorySize:
+    def test_units(self):
+        assert parse_memory_size("512MB") == 512 * 1024 ** 2
+        assert parse_memory_size("2G") == 2 * 1024 ** 3
+        assert parse_memory_size("1.5GiB") == int(1.5 * 1024 ** 3)
+        assert parse_memory_size(1000) == 1000
+
+    def test_empty_and_invalid(self):
+        assert parse_memory_size(None) is None
+        assert parse_memory_size("") is None
+        with pytest.raises(ValueError):
+            parse_memory_size("lots")
+
+
+class TestMemoryBudget:
+    def test_plan_fits_in_memory(self):
+        plan = MemoryBudget(limit_bytes=10_000).plan(frame_bytes=1_000, rows=100, step_count=2)
+        assert plan.mode == "memory"
+
+    def test_plan_switches_to_chunked(self):
+        budget = MemoryBudget(limit_bytes=100_000, min_chunk_rows=10)
+        plan = budget.plan(frame_bytes=1_000_000, rows=10_000, step_count=3)
+        assert plan.chunked
+        assert plan.estimated_peak_bytes > plan.budget_bytes
+        assert 10 <= plan.chunksize < 10_000
+
+    def test_no_budget_never_chunks(self):
+        plan = MemoryBudget().plan(frame_bytes=10 ** 12, rows=10 ** 9, step_count=5)
+        assert plan.mode == "memory"
+
+
+class TestDataLoaderProbe:
+    def test_probe_estimates_rows(self, tmp_path):
+        path = tmp_path / "data.csv"
+        _write_csv(path, rows=3000)
+        probe = DataLoader().probe(str(path), sample_rows=500)
+        assert probe.sample_rows == 500
+        assert 2400 <= probe.estimated_rows <= 3600
+        assert probe.estimated_memory > probe.sample_memory
+
+    def test_iter_chunks_covers_file(self, tmp_path):
+        path = tmp_path / "data.csv"
+        df = _write_csv(path, rows=1050)
+        chunks = list(DataLoader().iter_chunks(str(path), 500))
+        assert [len(c) for c in chunks] == [500, 500, 50]
+        assert pd.concat(chunks)["name"].tolist() == df["name"].tolist()
+
+
+class TestChunkedExecution:
+    def test_manager_slices_when_over_budget(self):
+        df = pd.DataFrame({"name": [f"  x{i}  " for i in range(5000)]})
+        manager = PipelineManager(selected_modules_list=["trim_spaces"], memory_budget=MemoryBudget(limit_bytes=50_000, min_chunk_rows=100))
+        result = manager.run_pipeline(df)
+        assert len(result) == 5000
+        assert result["name"].iloc[-1] == "x4999"
+
+    def test_steps_that_are_not_chunk_safe_see_all_rows(self):
+        df = pd.DataFrame({"v": range(5000)})
+        manager = PipelineManager(selected_modules_list=["rank"], memory_budget=MemoryBudget(limit_bytes=50_000, min_chunk_rows=100))
+        manager.core_modules["rank"] = ModuleDescriptor(
+            key="rank", name="rank", description="", defaults={}, process=lambda frame: frame.assign(r=frame["v"].rank())
+        )
+        seen = []
+        stream = manager.run_pipeline_chunked((df.iloc[start:start + 500] for start in range(0, 5000, 500)))
+        for chunk in stream:
+            seen.append(len(chunk))
+        assert seen == [5000]
+        pd.testing.assert_frame_equal(manager.run_pipeline(df), df.assign(r=df["v"].rank()))
+
+    def test_runner_streams_chunks_to_csv(self, tmp_path):
+        path = tmp_path / "big.csv"
+        _write_csv(path, rows=3000)
+        runner = PipelineRunner(memory_budget=20_000)
+        state = UIState(
+            selected_core_keys=["trim_spaces"],
+            output_type="csv",
+            output_dir=str(tmp_path / "out"),
+            file_path=str(path),
+        )
+        assert runner.run_file(state)
+        output = pd.read_csv(tmp_path / "out" / "cleaned_big.csv", encoding="utf-8-sig")
+        assert len(output) == 3000
+        assert output["name"].iloc[0] == "item 0"
+
+    def test_run_budget_overrides_the_runner_default(self, tmp_path):
+        # Excel cannot be streamed, so the run's budget is applied by in-memory batching
+        path = tmp_path / "big.xlsx"
+        pd.DataFrame({"name": [f"  item {i}  " for i in range(3000)]}).to_excel(path, index=False)
+        runner = PipelineRunner(memory_budget="100GB")
+        slices = []
+        run_chunked = runner.pipeline_manager.run_pipeline_chunked
+
+        def counting(chunks, **kwargs):
+            for chunk in chunks:
+                slices.append(len(chunk))
+                yield from run_chunked([chunk], **kwargs)
+
+        runner.pipeline_manager.run_pipeline_chunked = counting
+        state = UIState(
+            selected_core_keys=["trim_spaces"],
+            output_type="csv",
+            output_dir=str(tmp_path / "out"),
+            file_path=str(path),
+            memory_budget="20000",
+        )
+        assert runner.run_file(state)
+        assert runner.pipeline_manager.memory_budget.limit_bytes == 20_000
+        assert len(slices) > 1 and sum(slices) == 3000
+        output = pd.read_csv(tmp_path / "out" / "cleaned_big.csv", encoding="utf-8-sig")
+        assert output["name"].tolist()[-1] == "item 2999"
@@ -0,0 +1,76 @@
+"""Tests for MinHash/LSH near-duplicate removal."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.core import near_duplicates
+from modules.pipeline_manager import PipelineManager
+
+
+def _products():
+    return pd.DataFrame({
+        "name": [
+            "Apple iPhone 13 128GB Mavi",
+            "Samsung Galaxy S21 Siyah",
+            "apple iphone 13 128gb  mavi!",
+            "Xiaomi Redmi Note 11",
+            "Apple iPhone 13 128GB Mavi.",
+            None,
+            None,
+        ],
+        "price": [100, 200, 101, 300, 102, 1, 2],
+    })
+
+
+def test_default_is_noop():
+    df = _products()
+    result = near_duplicates.process(df)
+    pd.testing.assert_frame_equal(result, df)
+
+
+@pytest.mark.parametrize("keep,expected_prices", [
+    ("first", [100, 200, 300, 1, 2]),
+    ("last", [200, 300, 102, 1, 2]),
+    (False, [200, 300, 1, 2]),
+])
+def test_keep_semantics(keep, expected_prices):
+    result = near_duplicates.process(_products(), columns=["name"], keep=keep)
+    assert result["price"].tolist() == expected_prices
+    assert result.index.tolist() == list(range(len(expected_prices)))
+
+
+def test_report_and_empty_text_kept():
+    result = near_duplicates.process(_products(), columns=["name"])
+    report = result.attrs["near_duplicates"]
+    assert report["removed"] == 2
+    assert report["clusters"] == 1
+    assert result["name"].isna().sum() == 2
+
+
+def test_dissimilar_texts_are_not_merged():
+    df = pd.DataFrame({"name": ["kırmızı elma", "yeşil armut", "mavi kalem", "siyah çanta"]})
+    result = near_duplicates.process(df, columns=["name"])
+    assert len(result) == 4
+
+
+def test_small_edit_found_among_many_rows():
+    rng = np.random.default_rng(1)
+    words = ["".join(rng.choice(list("abcdefghijklmnop"), 12)) for _ in range(2000)]
+    df = pd.DataFrame({"name": words + [words[10] + "x"]})
+    result = near_duplicates.process(df, columns=["name"], threshold=0.7)
+    assert len(result) == 2000
+    assert result.attrs["near_duplicates"]["removed"] == 1
+
+
+def test_signatures_are_deterministic():
+    texts = ["abc def", "abd def", "zzz"]
+    first = near_duplicates.minhash_signatures(texts, num_perm=16)
+    second = near_duplicates.minhash_signatures(texts, num_perm=16)
+    assert first.shape == (16, 3)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_registered_in_pipeline():
+    manager = PipelineManager()
+    assert "near_duplicates" in manager.available_core_modules()
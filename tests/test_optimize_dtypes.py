@@ -0,0 +1,67 @@
+"""Tests for the optimize_dtypes core module."""
+
+import numpy as np
+import pandas as pd
+
+from modules.core.optimize_dtypes import META, optimize_series, process
+
+
+class TestOptimizeSeries:
+    def test_integers_use_smallest_width(self):
+        assert optimize_series(pd.Series([1, 2, 100]), min_int_bits=8).dtype == np.int8
+        assert optimize_series(pd.Series([1, 40000]), min_int_bits=8).dtype == np.int32
+        assert str(optimize_series(pd.Series([1, None], dtype="Int64"), min_int_bits=8).dtype) == "Int8"
+
+    def test_integers_keep_32_bits_by_default(self):
+        assert optimize_series(pd.Series([100, 120])).dtype == np.int32
+        assert str(optimize_series(pd.Series([1, None], dtype="Int64")).dtype) == "Int32"
+        narrow = pd.Series([1, 2], dtype=np.int8)
+        assert optimize_series(narrow) is narrow
+
+    def test_integral_floats_become_nullable_ints(self):
+        result = optimize_series(pd.Series([1.0, np.nan, 300.0]), integral_floats=True, min_int_bits=8)
+        assert str(result.dtype) == "Int16"
+        assert result.isna().tolist() == [False, True, False]
+
+    def test_floats_downcast_only_when_lossless(self):
+        assert optimize_series(pd.Series([0.5, 1.25, np.nan]), downcast_floats=True).dtype == np.float32
+        assert optimize_series(pd.Series([0.1, 1.25]), downcast_floats=True).dtype == np.float64
+
+    def test_floats_left_alone_by_default(self):
+        for values in ([2.0, 3.0], [0.5, 1.25]):
+            series = pd.Series(values)
+            assert optimize_series(series) is series
+
+    def test_strings_left_alone_by_default(self):
+        series = pd.Series(["a", "b", "a", "a"])
+        assert optimize_series(series) is series
+        assert optimize_series(series, string_dtype="category").dtype == "category"
+        assert optimize_series(pd.Series(["a", "b", "c"]), string_dtype="category").dtype == object
+
+
+class TestProcess:
+    def test_report_and_values(self):
+        df = pd.DataFrame({"qty": [1, 2, 3] * 100, "price": [10.0, 12.0, 9.0] * 100, "name": ["x", "y", "z"] * 100})
+        result = process(df, string_dtype="category", min_int_bits=8, integral_floats=True)
+
+        report = result.attrs["optimize_dtypes"]
+        assert set(report["columns"]) == {"qty", "price", "name"}
+        assert report["columns"]["qty"]["bytes_saved"] > 0
+        assert report["bytes_after"] < report["bytes_before"]
+        assert result["qty"].tolist() == df["qty"].tolist()
+        assert result["price"].astype(float).tolist() == df["price"].tolist()
+        assert df["qty"].dtype == np.int64  # input untouched
+
+    def test_column_selection(self):
+        df = pd.DataFrame({"a": [1, 2], "b": [1, 2]})
+        result = process(df, columns=["a"])
+        assert result["a"].dtype == np.int32
+        assert result["b"].dtype == np.int64
+
+    def test_defaults_leave_room_for_later_plugins(self):
+        df = pd.DataFrame({"p": [2.0, 3.0], "q": [100, 120]})
+        out = process(df, **META["defaults"])
+        # a later plugin may store fractions and do arithmetic without overflow
+        out.loc[0, "p"] = 1.5
+        assert out["p"].tolist() == [1.5, 3.0]
+        assert (out["q"] * 2).tolist() == [200, 240]
@@ -0,0 +1,76 @@
+"""Tests for the sample-driven parse_dates core module."""
+
+import numpy as np
+import pandas as pd
+
+from modules.core import parse_dates
+
+
+def test_defaults_are_noop():
+    df = pd.DataFrame({"d": ["2023-01-05", "x"]})
+    result = parse_dates.process(df, **parse_dates.META["defaults"])
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_mixed_formats_are_reported_per_format():
+    df = pd.DataFrame({"d": ["2023-01-05", " 2023-01-05 ", "05.02.2023", "March 5, 2023", "garbage", None, ""]})
+    result = parse_dates.process(df, columns=["d"])
+    assert result["d"].tolist()[:4] == [
+        pd.Timestamp("2023-01-05"),
+        pd.Timestamp("2023-01-05"),
+        pd.Timestamp("2023-02-05"),
+        pd.Timestamp("2023-03-05"),
+    ]
+    assert result["d"].iloc[4:].isna().all()
+    assert result.attrs["parse_dates"]["d"] == {
+        "formats": {"%Y-%m-%d": 2, "%d.%m.%Y": 1, "%B %d, %Y": 1},
+        "fallback": 0,
+        "failed": 1,
+    }
+
+
+def test_sample_decides_day_month_order():
+    assert parse_dates.detect_formats(["01/02/2023", "13/02/2023"]) == ["%d/%m/%Y", "%m/%d/%Y"]
+    assert parse_dates.detect_formats(["01/02/2023"]) == ["%m/%d/%Y", "%d/%m/%Y"]
+    assert parse_dates.detect_formats(["01/02/2023"], dayfirst=True) == ["%d/%m/%Y", "%m/%d/%Y"]
+
+
+def test_leftovers_use_fallback():
+    report = {}
+    series = pd.Series(["2023-01-05", "2023-01-05T10:00:00Z", pd.Timestamp("2020-01-01")], dtype=object)
+    result = parse_dates.parse_date_series(series, report=report)
+    assert result.tolist() == [pd.Timestamp("2023-01-05"), pd.Timestamp("2023-01-05 10:00"), pd.Timestamp("2020-01-01")]
+    assert report["fallback"] == 2
+    report = {}
+    assert parse_dates.parse_date_series(series, fallback=False, report=report).isna().sum() == 2
+    assert report["failed"] == 2
+
+
+def test_matches_pandas_on_large_iso_column():
+    days = pd.date_range("2015-01-01", periods=500).strftime("%Y-%m-%d %H:%M:%S")
+    series = pd.Series(np.random.default_rng(0).choice(days, 20_000))
+    expected = pd.to_datetime(series, format="%Y-%m-%d %H:%M:%S")
+    pd.testing.assert_series_equal(parse_dates.parse_date_series(series, sample_size=50), expected)
+
+
+def test_output_format_and_arrow_strings():
+    df = pd.DataFrame({"d": ["05.02.2023", None]}).astype("string")
+    result = parse_dates.process(df, columns="d", output_format="%Y-%m-%d")
+    assert result["d"].iloc[0] == "2023-02-05"
+    assert pd.isna(result["d"].iloc[1])
+
+
+def test_cascade_keeps_one_day_month_order():
+    # "12/25/2023" only fits %m/%d; it must not switch the column's order
+    series = pd.Series(["05/01/2023", "13/01/2023", "12/25/2023", "2023-01-07"] * 3)
+    report = {}
+    result = parse_dates.parse_date_series(series, dayfirst=True, fallback=False, report=report)
+    assert result.tolist()[:2] == [pd.Timestamp("2023-01-05"), pd.Timestamp("2023-01-13")]
+    assert pd.isna(result.iloc[2])
+    assert result.iloc[3] == pd.Timestamp("2023-01-07")
+    assert "%m/%d/%Y" not in report["formats"]
+
+
+def test_all_missing_column():
+    result = parse_dates.parse_date_series(pd.Series([None, np.nan], dtype=object))
+    assert result.isna().all() and str(result.dtype) == "datetime64[ns]"
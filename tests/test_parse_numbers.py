@@ -0,0 +1,71 @@
+"""Tests for the shared locale-aware number parser."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.core import convert_types, parse_numbers
+from modules.core.parse_numbers import classify_cells, parse_number_series
+
+
+def test_defaults_are_noop():
+    df = pd.DataFrame({"p": ["1.234,56"]})
+    pd.testing.assert_frame_equal(parse_numbers.process(df, **parse_numbers.META["defaults"]), df)
+
+
+def test_classify_cells():
+    cells = pd.Series(["1.234,56", "1,234.56", "1.234", "12,5", "12.50", "1.234.567", "1,234,567", "12"])
+    assert classify_cells(cells).tolist() == ["tr", "us", "ambiguous", "tr", "us", "tr", "us", "ambiguous"]
+
+
+@pytest.mark.parametrize(
+    "locale, expected",
+    [
+        ("tr", [1234.56, 1234.0, 12.5, np.nan]),
+        ("us", [1.23456, 1.234, 125.0, np.nan]),
+    ],
+)
+def test_explicit_locales(locale, expected):
+    result = parse_number_series(pd.Series(["1.234,56 TL", "1.234", "12,5", None]), locale=locale)
+    np.testing.assert_allclose(result.to_numpy(dtype=float), expected)
+
+
+def test_auto_uses_column_notation_for_ambiguous_cells():
+    report = {}
+    result = parse_number_series(pd.Series(["1.234,56", "1.234", "12,5", "1,234.5", None, "x"]), report=report)
+    np.testing.assert_allclose(result.to_numpy(dtype=float), [1234.56, 1234.0, 12.5, 1234.5, np.nan, np.nan])
+    assert report == {"locale": "tr", "failed": 1}
+
+    report = {}
+    result = parse_number_series(pd.Series(["1,234.56", "1,234", "$12.5"]), report=report)
+    assert result.tolist() == [1234.56, 1234.0, 12.5]
+    assert report["locale"] == "us"
+
+
+def test_heuristic_rules():
+    cells = pd.Series(["1.234,56", "1,234.56", "1,234", "1234.5", "1234.567", "12.345.6", "1.2,3.4", "", None])
+    result = parse_number_series(cells, locale="heuristic")
+    np.testing.assert_allclose(
+        result.to_numpy(dtype=float), [1234.56, 1234.56, 1.234, 1234.5, 1234567.0, 123456.0, np.nan, np.nan, np.nan]
+    )
+
+
+def test_plain_rules_and_unknown_locale():
+    assert parse_number_series(pd.Series(["1,5", "1.234,5", 7]), locale="plain").tolist()[::2] == [1.5, 7]
+    with pytest.raises(ValueError):
+        parse_number_series(pd.Series(["1"]), locale="de")
+
+
+def test_convert_types_decimal_locale():
+    df = pd.DataFrame({"p": ["1.234,56 TL", "99,90 TL", "12"]})
+    result = convert_types.process(df, strip_characters=None, decimal_locale="tr")
+    assert result["p"].tolist() == [1234.56, 99.9, 12.0]
+    assert result["p"].tolist() != convert_types.process(df, strip_characters=[",", " ", "TL"])["p"].tolist()
+
+
+def test_process_reports_locale():
+    df = pd.DataFrame({"p": ["1.234,56", "2,5"], "q": ["1,000.5", "3"]})
+    result = parse_numbers.process(df, columns=["p", "q"])
+    assert result["p"].tolist() == [1234.56, 2.5]
+    assert result["q"].tolist() == [1000.5, 3.0]
+    assert result.attrs["parse_numbers"] == {"p": {"locale": "tr", "failed": 0}, "q": {"locale": "us", "failed": 0}}
@@ -0,0 +1,75 @@
+"""Tests for declared module capabilities and how the executor uses them."""
+
+import pandas as pd
+
+from modules.core import ModuleCapabilities, ModuleDescriptor
+from modules.pipeline_manager import PipelineManager
+
+
+def test_capabilities_parsed_from_meta():
+    caps = ModuleCapabilities.from_meta({"capabilities": {"chunk_safe": True, "columns_read": ["a"]}})
+    assert caps.chunk_safe and not caps.pure
+    assert caps.columns_read == ("a",)
+    assert ModuleCapabilities.from_meta({}) == ModuleCapabilities()
+
+
+def test_core_and_custom_modules_declare_capabilities():
+    manager = PipelineManager()
+    core = manager.available_core_modules()
+    assert core["trim_spaces"].capabilities.column_wise
+    assert not core["drop_duplicates"].capabilities.chunk_safe
+    custom = manager.available_custom_modules()
+    assert custom["clean_akakce_data"].capabilities.columns_read == ("name", "price")
+
+
+def test_column_wise_parallel_matches_sequential():
+    df = pd.DataFrame({f"c{i}": [f"  v{i}  ", None, " x "] for i in range(7)})
+    sequential = PipelineManager(selected_modules_list=["trim_spaces", "text_normalize"]).run_pipeline(df)
+    parallel = PipelineManager(selected_modules_list=["trim_spaces", "text_normalize"], max_workers=3).run_pipeline(df)
+    pd.testing.assert_frame_equal(sequential, parallel)
+
+
+def test_columns_read_projection_keeps_other_columns():
+    seen = []
+
+    def upper(df):
+        seen.append(list(df.columns))
+        return df.assign(a=df["a"].str.upper())
+
+    caps = ModuleCapabilities(column_wise=True, columns_read=("a",))
+    manager = PipelineManager(selected_modules_list=["upper"])
+    manager.core_modules["upper"] = ModuleDescriptor("upper", "upper", "", {}, upper, capabilities=caps)
+    result = manager.run_pipeline(pd.DataFrame({"a": ["x"], "b": [1]}))
+    assert seen == [["a"]]
+    assert result.to_dict("list") == {"a": ["X"], "b": [1]}
+
+
+def test_pure_results_are_cached():
+    calls = []
+
+    def step(df):
+        calls.append(1)
+        return df.assign(v=df["v"] * 2)
+
+    caps = ModuleCapabilities(pure=True, in_place_safe=True)
+    manager = PipelineManager(selected_modules_list=["double"], cache_results=True)
+    manager.core_modules["double"] = ModuleDescriptor("double", "double", "", {}, step, capabilities=caps)
+    df = pd.DataFrame({"v": [1, 2]})
+    first = manager.run_pipeline(df)
+    second = manager.run_pipeline(df)
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    # a different input is not served from the cache
+    manager.run_pipeline(pd.DataFrame({"v": [3]}))
+    assert len(calls) == 2
+    # nor is the same rows in another order
+    reordered = df.iloc[::-1]
+    pd.testing.assert_frame_equal(manager.run_pipeline(reordered), reordered.assign(v=reordered["v"] * 2))
+    assert len(calls) == 3
+
+
+def test_input_is_never_mutated_without_copy():
+    df = pd.DataFrame({"name": ["  a  "]})
+    result = PipelineManager(selected_modules_list=["trim_spaces"]).run_pipeline(df)
+    assert df.loc[0, "name"] == "  a  "
+    assert result.loc[0, "name"] == "a"
@@ -0,0 +1,100 @@
+"""Tests for running custom plugins in isolated worker processes."""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.audit import MemoryAuditSink, use_sink
+from modules.custom.clean_akakce_data import process as akakce_process
+from modules.pipeline_manager import PipelineManager
+from modules.plugin_pool import PluginMemoryError, PluginTimeoutError, PluginWorkerError, PluginWorkerPool, resource
+
+PLUGIN = '''
+import time
+
+import numpy as np
+
+from modules.audit import record_rows
+
+META = {"key": "yavas", "defaults": {}}
+
+
+def process(df, seconds=0.0, grow=0, fail=False, **kwargs):
+    time.sleep(seconds)
+    if fail:
+        raise ValueError("bozuk satır")
+    if grow:
+        np.ones(grow, dtype=np.uint8)
+    record_rows(df, df["a"] < 0, "Negatif", source="yavas")
+    return df[df["a"] >= 0].assign(b=lambda d: d["a"] * 2)
+'''
+
+
+@pytest.fixture(scope="module")
+def pool(tmp_path_factory):
+    custom = tmp_path_factory.mktemp("custom")
+    (custom / "yavas.py").write_text(PLUGIN, encoding="utf-8")
+    with PluginWorkerPool(custom, size=1) as pool:
+        yield pool
+
+
+@pytest.fixture(autouse=True)
+def sink():
+    # keep replayed audit rows out of the legacy CSV in the working directory
+    with use_sink(MemoryAuditSink()) as sink:
+        yield sink
+
+
+def _frame():
+    return pd.DataFrame({"a": [1, -2, 3], "s": ["x", np.nan, None]})
+
+
+def test_pool_returns_same_frame_and_replays_audit(pool, sink):
+    out = pool.run("yavas", _frame())
+    assert out["b"].tolist() == [2, 6]
+    # object cells cross the process boundary unchanged (NaN vs None)
+    assert out["s"].tolist()[0] == "x" and out["s"].tolist()[1] is None
+    rows, source = sink.records[0]
+    assert source == "yavas"
+    assert rows["Reason"].tolist() == ["Negatif"] and rows.index.tolist() == [1]
+
+
+def test_timeout_replaces_worker(pool):
+    with pytest.raises(PluginTimeoutError):
+        pool.run("yavas", _frame(), {"seconds": 30}, timeout=0.5)
+    with pytest.raises(PluginWorkerError, match="bozuk satır"):
+        pool.run("yavas", _frame(), {"fail": True})
+    assert pool.run("yavas", _frame())["b"].tolist() == [2, 6]
+
+
+@pytest.mark.skipif(resource is None or not sys.platform.startswith("linux"), reason="RLIMIT_AS gerekir")
+def test_memory_limit_per_call(pool):
+    with pytest.raises(PluginMemoryError):
+        pool.run("yavas", _frame(), {"grow": 2**31}, memory_limit="256MB")
+    assert len(pool.run("yavas", _frame(), {"grow": 2**20}, memory_limit="256MB")) == 2
+
+
+def test_manager_runs_custom_plugins_in_workers():
+    frame = pd.DataFrame({"name": ["Apple iPhone 15", "Xiaomi", None], "price": ["10 TL +116 FİYAT", "5 TL", None]})
+    manager = PipelineManager(plugin_workers=1)
+    try:
+        descriptor = manager.custom_modules["clean_akakce_data"]
+        out = manager.run_step(frame, descriptor)
+        assert manager.plugin_pool() is not None
+    finally:
+        manager.close()
+    pd.testing.assert_frame_equal(out, akakce_process(frame))
+
+
+def test_pool_stays_warm_across_runs():
+    frame = pd.DataFrame({"name": ["Apple iPhone 15"], "price": ["10 TL +116 FİYAT"]})
+    manager = PipelineManager(selected_modules_list=["clean_akakce_data"], plugin_workers=1)
+    try:
+        manager.run_pipeline(frame)
+        pids = manager.plugin_pool().pids
+        manager.run_pipeline(frame)
+        assert manager.plugin_pool().pids == pids
+    finally:
+        manager.close()
@@ -0,0 +1,93 @@
+"""Tests for HyperLogLog and the single-pass data-quality profiler."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.pipeline_manager import PipelineManager
+from modules.profiling import DataProfiler, profile_frame
+from modules.sketches import HyperLogLog, SpaceSaving
+
+
+def _frame(rows=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "price": np.where(rng.random(rows) < 0.2, np.nan, rng.normal(100, 10, rows)),
+        "city": pd.Series(rng.choice(["Ankara", "İzmir", "42", None], rows), dtype=object),
+        "code": rng.integers(0, 50_000, rows),
+        "flag": rng.random(rows) < 0.5,
+    })
+
+
+class TestHyperLogLog:
+    def test_exact_while_sparse(self):
+        sketch = HyperLogLog(precision=10).update(["a", "b", "a", None])
+        assert sketch.exact and sketch.count() == 2
+
+    def test_estimate_and_merge(self):
+        values = np.arange(200_000)
+        left = HyperLogLog().update(values[:120_000])
+        right = HyperLogLog().update(values[80_000:])
+        assert not left.exact
+        assert left.merge(right).count() == pytest.approx(200_000, rel=0.05)
+
+    def test_precision_mismatch(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+
+def test_space_saving_batch_keeps_heavy_hitters():
+    counter = SpaceSaving(capacity=20)
+    for start in range(0, 10_000, 1000):
+        batch = pd.Series(["hot"] * 100 + [f"cold{i}" for i in range(start, start + 900)])
+        counter.update(batch)
+    assert counter.most_common(1) == [("hot", 1000)]
+    assert len(counter.counts) == 20
+
+
+def test_profile_matches_pandas():
+    df = _frame()
+    profile = profile_frame(df)
+    assert profile["rows"] == len(df)
+    price = profile["columns"]["price"]
+    assert price["nulls"] == df["price"].isna().sum()
+    assert price["distinct"] == df["price"].nunique()
+    assert price["min"] == df["price"].min() and price["max"] == df["price"].max()
+    assert price["mean"] == pytest.approx(df["price"].mean())
+    assert price["quantiles"]["0.5"] == pytest.approx(df["price"].median(), abs=0.5)
+
+    city = profile["columns"]["city"]
+    counts = df["city"].value_counts()
+    assert city["top_values"][0] == [counts.index[0], int(counts.iloc[0])]
+    assert city["types"] == {"text": int(counts[["Ankara", "İzmir"]].sum()), "numeric_text": int(counts["42"])}
+    assert city["dominant_type"] == "text"
+    assert city["min"] == "42" and city["max"] == "İzmir"
+    assert profile["columns"]["flag"]["types"] == {"bool": len(df)}
+
+
+def test_chunked_profile_equals_whole_frame():
+    df = _frame()
+    whole = profile_frame(df)
+    chunked = profile_frame(df, chunk_size=700)
+    for column in ("city", "flag"):
+        assert chunked["columns"][column] == whole["columns"][column]
+    assert chunked["columns"]["code"]["distinct"] == whole["columns"]["code"]["distinct"]
+
+    left = DataProfiler().update(df.iloc[:2000])
+    right = DataProfiler().update(df.iloc[2000:])
+    assert left.merge(right).result()["columns"]["price"]["nulls"] == whole["columns"]["price"]["nulls"]
+
+
+def test_manager_profiles_before_and_after_steps():
+    df = pd.DataFrame({"name": [" a", "a ", "b", "b"], "n": [1, 1, 2, 2]})
+    points = ["input", "after:trim_spaces", "output"]
+    manager = PipelineManager(selected_modules_list=["trim_spaces", "drop_duplicates"], profile_points=points)
+    manager.run_pipeline(df)
+    assert set(manager.profiles) == set(points)
+    assert manager.profiles["input"]["columns"]["name"]["distinct"] == 3
+    assert manager.profiles["after:trim_spaces"]["columns"]["name"]["distinct"] == 2
+    assert manager.profiles["output"]["rows"] == 2
+
+    chunked = PipelineManager(selected_modules_list=["trim_spaces", "drop_duplicates"], profile_points=points)
+    list(chunked.run_pipeline_chunked(df.iloc[start:start + 1] for start in range(len(df))))
+    assert chunked.profiles == manager.profiles
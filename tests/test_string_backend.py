@@ -0,0 +1,112 @@
+"""Tests for the Arrow-backed string mode (string[pyarrow] columns)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from modules.core import convert_types, text_normalize, trim_spaces
+from modules.data_loader import DataLoader, DataLoaderConfig, apply_string_backend
+from modules.pipeline_manager import PipelineManager
+
+ARROW = "string[pyarrow]"
+
+CORE = ["standardize_headers", "text_normalize", "trim_spaces", "drop_duplicates", "convert_types", "optimize_dtypes"]
+
+
+def _messy():
+    return pd.DataFrame({
+        "Ürün Adı": ["  Elma ", "Armut", "  Elma ", "“Kivi”", None, "Ã§ilek"],
+        "Fiyat": ["1.250 TL", "99", "1.250 TL", "abc", "12,5", None],
+        "Adet": [1, 2, 1, 3, 4, 5],
+        "Karışık": ["a", 1, "a", None, 2.5, "b"],
+    })
+
+
+def test_apply_string_backend_converts_pure_text_only():
+    frame = apply_string_backend(_messy(), "arrow")
+    assert frame["Ürün Adı"].dtype == ARROW
+    assert frame["Fiyat"].dtype == ARROW
+    assert frame["Adet"].dtype == np.int64
+    assert frame["Karışık"].dtype == object
+    with pytest.raises(ValueError):
+        apply_string_backend(_messy(), "rust")
+
+
+def test_loader_produces_arrow_strings(tmp_path):
+    path = tmp_path / "data.csv"
+    _messy().to_csv(path, index=False)
+    frame = DataLoader(DataLoaderConfig(string_backend="arrow", bad_lines_log=tmp_path / "bad.csv")).load(str(path))
+    assert frame["Ürün Adı"].dtype == ARROW
+    chunks = list(DataLoader(DataLoaderConfig(string_backend="arrow")).iter_chunks(str(path), 2))
+    assert all(chunk["Fiyat"].dtype == ARROW for chunk in chunks)
+
+
+def test_pipeline_results_match_object_backend():
+    df = _messy()
+    expected = PipelineManager(selected_modules_list=CORE).run_pipeline(df)
+    result = PipelineManager(selected_modules_list=CORE, string_backend="arrow").run_pipeline(df)
+    assert df["Ürün Adı"].dtype == object  # caller's frame untouched
+    assert (result.dtypes == ARROW).any()
+    normalized = [frame.astype(object).where(frame.notna(), None) for frame in (result, expected)]
+    pd.testing.assert_frame_equal(*normalized)
+
+
+def test_pipeline_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        PipelineManager(string_backend="rust")
+
+
+def test_convert_types_arrow_matches_object_path():
+    values = ["1.250 TL", "99", "1e3", "inf", "12345678901234567", "-.5", "garbage", None, "0x10", "007"]
+    df = pd.DataFrame({
+        "mixed": values * 20,
+        "ints": [str(value) for value in range(200)],
+        "long": ["12345678901234567.5", "0.1", None, "3"] * 50,
+    })
+    defaults = dict(convert_types.META["defaults"], numeric_threshold=0.5)
+    for strip in (defaults["strip_characters"], None):
+        options = dict(defaults, strip_characters=strip)
+        expected = convert_types.process(df, **options)
+        result = convert_types.process(df.astype(ARROW), **options)
+        for column in df.columns:
+            if expected[column].dtype != object:
+                pd.testing.assert_series_equal(result[column], expected[column])
+
+
+@pytest.mark.parametrize("memoize", [True, False])
+def test_text_normalize_arrow_matches_fused(memoize):
+    values = pd.Series(
+        ["  a b ", "x​y", "“q”", "Ã§ilek", "é", "<b>t</b> &amp;", "a \x1c b", None, "''z''"] * 3,
+        dtype=object,
+    )
+    for strip_html in (False, True):
+        stats_object, stats_arrow = {}, {}
+        expected = text_normalize.clean_text_pipeline(values, memoize=memoize, strip_html=strip_html, mojibake_stats=stats_object)
+        result = text_normalize.clean_text_pipeline(
+            values.astype(ARROW), memoize=memoize, strip_html=strip_html, mojibake_stats=stats_arrow
+        )
+        assert result.dtype == ARROW
+        assert [None if value is pd.NA else value for value in result.tolist()] == expected.tolist()
+        assert stats_arrow == stats_object
+
+
+def test_mojibake_suspects_arrow_regex_matches_python():
+    rng = np.random.default_rng(0)
+    pool = [chr(code) for code in list(range(0, 0x250)) + list(range(0x2000, 0x2070)) + list(range(0xFF00, 0xFFFE))]
+    values = pd.Series(["".join(rng.choice(pool, rng.integers(0, 5))) for _ in range(5000)], dtype=object)
+    expected = text_normalize.mojibake_suspects(values)
+    result = text_normalize.mojibake_suspects(values.astype(ARROW))
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+
+def test_whitespace_chars_match_str_isspace():
+    assert set(text_normalize.WHITESPACE_CHARS) == {chr(code) for code in range(0x3100) if chr(code).isspace()}
+
+
+def test_trim_spaces_keeps_arrow_dtype():
+    df = pd.DataFrame({"a": ["  x ", None, "y  "]}).astype(ARROW)
+    result = trim_spaces.process(df)
+    assert result["a"].dtype == ARROW
+    assert result["a"].tolist() == ["x", pd.NA, "y"]
@@ -48,3 +48,58 @@ def test_process_applies_to_specified_columns(tmp_path):
     out = tn.process(df, columns=["name", "notes"], strip_html=True)
     assert out["name"].iloc[0] == "A B"
     assert out["notes"].iloc[0] == "x"
+
+
+def test_memoized_pipeline_matches_per_cell():
+    s = pd.Series(["  a “b”  ", None, "  a “b”  ", np.nan, "c  d"] * 3)
+    memoized = tn.clean_text_pipeline(s)
+    direct = tn.clean_text_pipeline(s, memoize=False)
+    assert memoized.tolist()[:2] == ['a "b"', None]
+    assert pd.isna(memoized.iloc[3])
+    assert memoized.equals(direct)
+
+
+def test_apply_on_uniques_calls_func_once_per_distinct_value():
+    seen = []
+
+    def func(values):
+        seen.extend(values.tolist())
+        return values.str.upper()
+
+    result = tn.apply_on_uniques(pd.Series(["x", "y", "x", None], index=[5, 6, 7, 8]), func)
+    assert seen == ["x", "y"]
+    assert result.tolist() == ["X", "Y", "X", None]
+    assert result.index.tolist() == [5, 6, 7, 8]
+
+    mixed = tn.apply_on_uniques(pd.Series([1, 1.0, "a"]), lambda values: values.astype(str))
+    assert mixed.tolist() == ["1", "1.0", "a"]
+
+
+def test_fused_engine_matches_legacy_chain():
+    s = pd.Series([
+        "  a​“b”  ", "<b>x</b> &amp; ''y''", "Ta��nabilir", "‘single’ – dash", None, "",
+    ])
+    for strip_html in (False, True):
+        for collapse in (False, True):
+            legacy = tn.clean_text_pipeline(s, memoize=False, engine="legacy", strip_html=strip_html, collapse_whitespace=collapse)
+            fused = tn.clean_text_pipeline(s, memoize=False, strip_html=strip_html, collapse_whitespace=collapse)
+            assert fused.equals(legacy)
+    kernel = tn.build_text_normalizer(normalize_quotes_opt=False, fix_mojibake_opt=False)
+    assert kernel("“a” ") == "“a”"
+    assert kernel(5) == 5
+
+
+def test_mojibake_prefilter_selects_suspects_only():
+    s = pd.Series(["Ã¼rÃ¼n", "Ta�nabilir", "plain text", None, "Ürün kalite"])
+    suspects = tn.mojibake_suspects(s)
+    assert suspects.tolist()[:4] == [True, True, False, False]
+    assert tn.fix_mojibake(s).equals(tn.fix_mojibake(s, prefilter=False))
+
+
+def test_process_reports_mojibake_hit_rate():
+    df = pd.DataFrame({"name": ["ok", "ok", "Ã¼rÃ¼n", "fine"], "n": [1, 2, 3, 4]})
+    result = tn.process(df, memoize=False)
+    stats = result.attrs["text_normalize"]["mojibake"]["name"]
+    assert stats["checked"] == 4
+    assert stats["suspect"] == 1
+    assert stats["hit_rate"] == 0.25